@@ -0,0 +1,22 @@
+import App.logic as logic
+from App.Tests.test_snapshot import escribir_datos
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_get_data_sin_columnas_internas(tmp_path, monkeypatch):
+    # Las filas solo traen columnas del CSV o derivadas de él, aunque ya se
+    # hayan asignado los barrios
+    escribir_datos(str(tmp_path))
+    monkeypatch.setattr(logic, "data_dir", str(tmp_path))
+    catalog = logic.new_logic()
+    logic.load_data(catalog, "viajes.csv")
+    logic.load_neighborhoods(catalog, "barrios.csv")
+    logic.asignar_barrios(catalog)
+
+    trip = logic.get_data(catalog, 0)
+    for nombre, tipo in logic.COLUMNAS_INTERNAS:
+        assert nombre not in trip
+    for nombre, tipo in logic.COLUMNAS_VIAJES:
+        assert nombre in trip
+    assert trip["payment_type"] == "CASH"
@@ -0,0 +1,48 @@
+import App.logic as logic
+from App.Tests.test_snapshot import escribir_datos
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def cargar(carpeta, monkeypatch):
+    monkeypatch.setattr(logic, "data_dir", carpeta)
+    catalog = logic.new_logic()
+    logic.load_data(catalog, "viajes.csv")
+    return catalog
+
+
+@handle_not_implemented
+def test_req_2_pocos_viajes(tmp_path, monkeypatch):
+    # 12 viajes en la franja, menos que 2 * N: se listan una sola vez
+    escribir_datos(str(tmp_path))
+    catalog = cargar(str(tmp_path), monkeypatch)
+    r = logic.req_2(catalog, 40.6, 40.6005, 10)
+
+    assert r["total_filtrados"] == 12
+    assert len(r["primeros"]) == 12
+    assert r["ultimos"] == r["primeros"]
+    assert all(t["pickup_coords"][0] == 40.6 for t in r["primeros"])
+
+
+@handle_not_implemented
+def test_req_2_sin_viajes(tmp_path, monkeypatch):
+    escribir_datos(str(tmp_path))
+    catalog = cargar(str(tmp_path), monkeypatch)
+    r = logic.req_2(catalog, 41.0, 42.0, 5)
+
+    assert r["total_filtrados"] == 0
+    assert r["primeros"] == []
+    assert r["ultimos"] == []
+
+
+@handle_not_implemented
+def test_req_2_muchos_viajes(tmp_path, monkeypatch):
+    # 80 viajes en la franja: N primeros y N últimos por latitud descendente
+    escribir_datos(str(tmp_path))
+    catalog = cargar(str(tmp_path), monkeypatch)
+    r = logic.req_2(catalog, 40.6, 40.61, 3)
+
+    assert r["total_filtrados"] == 80
+    assert len(r["primeros"]) == 3
+    assert len(r["ultimos"]) == 3
+    assert r["primeros"][0]["pickup_coords"][0] == 40.606
+    assert r["ultimos"][-1]["pickup_coords"][0] == 40.6
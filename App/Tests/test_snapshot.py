@@ -0,0 +1,80 @@
+import json
+import os
+import subprocess
+import sys
+from DataStructures.Utils.utils import handle_not_implemented
+
+raiz = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+encabezado = ("pickup_datetime,dropoff_datetime,passenger_count,trip_distance,"
+              "pickup_longitude,pickup_latitude,rate_code,store_and_fwd_flag,"
+              "dropoff_longitude,dropoff_latitude,payment_type,fare_amount,extra,"
+              "mta_tax,tip_amount,tolls_amount,improvement_surcharge,total_amount")
+
+# Carga los CSV, guarda el snapshot y responde req_4, req_5 y req_6, o (con
+# "cargar") los responde sobre el snapshot. Imprime los resultados en JSON.
+programa = """
+import json, sys
+import App.logic as logic
+logic.data_dir = sys.argv[1]
+catalog = logic.new_logic()
+if sys.argv[2] == "guardar":
+    logic.load_data(catalog, "viajes.csv")
+    logic.load_neighborhoods(catalog, "barrios.csv")
+    logic.asignar_barrios(catalog)
+    logic.save_snapshot(catalog, "viajes.csv", "barrios.csv")
+else:
+    assert logic.load_snapshot(catalog, "viajes.csv", "barrios.csv") is not None
+resultados = []
+for barrio in ("nb 0", "nb 1", "nb 2"):
+    r = logic.req_6(catalog, barrio, "0", "23", 3)
+    resultados.append([r["total"], r["primeros"], r["ultimos"]])
+for dia in ("2015-01-01", "2015-01-02"):
+    r = logic.req_4(catalog, dia, "DESPUES", "06:00:00", 3)
+    resultados.append([r["total"], r["primeros"], r["ultimos"]])
+for hora in ("2015-01-01 10", "2015-01-02 15"):
+    r = logic.req_5(catalog, hora, 3)
+    resultados.append([r["total_filtrados"], r["primeros"]["elements"]])
+print(json.dumps(resultados))
+"""
+
+
+def escribir_datos(carpeta):
+    with open(os.path.join(carpeta, "viajes.csv"), "w") as file:
+        file.write(encabezado + "\n")
+        for i in range(240):
+            dia = 1 + i % 2
+            hora = (i * 7) % 24
+            minuto = (i * 13) % 60
+            lat = 40.60 + (i % 3) * 0.1 + (i % 7) * 0.001
+            lon = -73.90 + (i % 3) * 0.1
+            file.write(f"2015-01-0{dia} {hora:02d}:{minuto:02d}:00,"
+                       f"2015-01-0{dia} {hora:02d}:{minuto:02d}:30,1,{1 + i % 5}.5,"
+                       f"{lon:.6f},{lat:.6f},1,N,{lon:.6f},{lat:.6f},CASH,"
+                       f"5.0,0.5,0.5,1.0,0.0,0.3,{7 + i % 11}.3\n")
+    with open(os.path.join(carpeta, "barrios.csv"), "w") as file:
+        file.write("borough;neighborhood;latitude;longitude\n")
+        for j in range(3):
+            lat = str(round(40.60 + j * 0.1, 2)).replace(".", ",")
+            lon = str(round(-73.90 + j * 0.1, 2)).replace(".", ",")
+            file.write(f"B{j};Nb {j} ;{lat};{lon}\n")
+
+
+def ejecutar(carpeta, paso, semilla):
+    entorno = dict(os.environ, PYTHONHASHSEED=semilla, PYTHONPATH=raiz)
+    salida = subprocess.run([sys.executable, "-c", programa, carpeta, paso],
+                            cwd=raiz, env=entorno, capture_output=True,
+                            text=True, check=True)
+    return json.loads(salida.stdout.strip().splitlines()[-1])
+
+
+@handle_not_implemented
+def test_snapshot_en_otro_proceso(tmp_path):
+    # El snapshot se guarda y se carga en procesos con distinto hash() de
+    # cadenas: las consultas por llave de texto deben dar lo mismo
+    carpeta = str(tmp_path)
+    escribir_datos(carpeta)
+    guardado = ejecutar(carpeta, "guardar", "1")
+    for semilla in ("2", "3"):
+        assert ejecutar(carpeta, "cargar", semilla) == guardado
+    assert all(resultado[0] > 0 for resultado in guardado)
@@ -1,13 +1,26 @@
 import time
 import os
 import csv 
+import io
+import gzip
+import bz2
+import lzma
+import itertools
 import tabulate 
 import math
 import re
+import mmap
+import pickle
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from array import array
 from DataStructures.List import array_list as lt
 from DataStructures.Stack import stack as st
 from DataStructures.Queue import queue as q
 from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Map import multimap as mm
+from DataStructures.Tree import sorted_index as si
 
 data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Data", "Challenge-2")
 
@@ -18,6 +31,62 @@ def _parse_float_or_none(s: str):
     s2 = s.strip().replace(",", ".")
     return float(s2) if _FLOAT_RE.match(s2) else None
 
+# Almacenamiento columnar de los viajes: una columna por campo.
+# Columnas numéricas y su código de tipo en array.array
+COLUMNAS_VIAJES = (
+    ("pickup_ts", "d"),
+    ("dropoff_ts", "d"),
+    ("pickup_hour", "b"),
+    ("passenger_count", "i"),
+    ("payment_type", "H"),  # código en trips['payment_types']
+    ("trip_distance", "d"),
+    ("fare_amount", "d"),
+    ("tip_amount", "d"),
+    ("tolls_amount", "d"),
+    ("total_amount", "d"),
+    ("duration_min", "d"),
+    ("pickup_longitude", "d"),
+    ("pickup_latitude", "d"),
+    ("dropoff_longitude", "d"),
+    ("dropoff_latitude", "d"),
+)
+# Columnas internas de la carga: se guardan igual pero get_data no las expone
+COLUMNAS_INTERNAS = (
+    ("pickup_nb", "i"),  # id del barrio de recogida, lo llena asignar_barrios
+)
+# Columnas de fecha: texto "YYYY-MM-DD HH:MM:SS" de ancho fijo en un bytearray
+COLUMNAS_FECHA = ("pickup_datetime", "dropoff_datetime")
+ANCHO_FECHA = 19
+FORMATO_FECHA = "%Y-%m-%d %H:%M:%S"
+
+
+def new_trips():
+    """
+    Crea el almacenamiento columnar vacío de los viajes
+    """
+    columns = {}
+    for nombre in COLUMNAS_FECHA:
+        columns[nombre] = bytearray()
+    for nombre, tipo in COLUMNAS_VIAJES + COLUMNAS_INTERNAS:
+        columns[nombre] = array(tipo)
+    return {
+        "columns": columns,
+        "payment_types": [],
+        # Posiciones del viaje de menor distancia positiva y del de mayor distancia
+        "extremos_distancia": (-1, -1),
+        "size": 0,
+    }
+
+
+def texto_fecha(columna, idx, desde=0, hasta=ANCHO_FECHA):
+    """
+    Retorna el texto de la fecha en la posición idx de una columna de fecha.
+    desde/hasta permiten tomar solo una parte, p. ej. (0, 10) para el día.
+    """
+    inicio = idx * ANCHO_FECHA
+    return str(columna[inicio + desde:inicio + hasta], "ascii")
+
+
 def new_logic():
     """
     Crea el catalogo para almacenar las estructuras de datos
@@ -25,77 +94,390 @@ def new_logic():
     catalogo = {
         "trips": None,
         "barrios": None,
+        "idx_barrios_grid": None,
+        "nombres_barrios": None,
+        "idx_barrios": None,
+        "idx_pickup_ts": None,
+        "idx_pickup_latitude": None,
+        "idx_trip_distance": None,
+        "idx_req4": None,
         "idx_req5": None
     }
-    catalogo["trips"] = lt.new_list()
+    catalogo["trips"] = new_trips()
     catalogo["barrios"] = lt.new_list()
     return catalogo
 
 
 # Funciones para la carga de datos
 
-def load_data(catalog, filename):
+def load_data(catalog, filename, workers=1, limite=None):
+    """
+    Carga el archivo de viajes en catalog['trips'].
+
+    La carga es una cadena de generadores: lectura de líneas -> interpretación
+    de la fila -> campos derivados (timestamps, hora, duración) -> sumidero
+    columnar, que además lleva los agregados (extremos de distancia) en la
+    misma pasada. Acepta archivos comprimidos .gz, .bz2 y .xz, y `limite`
+    permite cargar solo las primeras filas.
+
+    Con workers > 1 un archivo sin comprimir se parte en rangos de bytes
+    alineados a inicio de línea que se interpretan en paralelo con un
+    ProcessPoolExecutor; los bloques se agregan en el orden del archivo, así
+    que el resultado es idéntico al de la carga secuencial.
+    """
     start = get_time()
-    path = os.path.join(data_dir, filename)
-    file = open(path, encoding="utf-8")
-    reader = csv.DictReader(file)
-    for row in reader:
-        pick_t = time.strptime(row["pickup_datetime"], "%Y-%m-%d %H:%M:%S")
-        drop_t = time.strptime(row["dropoff_datetime"], "%Y-%m-%d %H:%M:%S")
-        pick_ts = time.mktime(pick_t)
-        drop_ts = time.mktime(drop_t)
-        duration_min = (drop_ts - pick_ts) / 60.0
-
-        lt.add_last(catalog["trips"], {
-            "pickup_datetime": row["pickup_datetime"],
-            "dropoff_datetime": row["dropoff_datetime"],
-            "pickup_ts": pick_ts,
-            "dropoff_ts": drop_ts,
-            "pickup_hour": pick_t.tm_hour,
-
-            "passenger_count": int(row["passenger_count"]),
-            "payment_type": row["payment_type"].strip().upper(),
-
-            "trip_distance": float(row["trip_distance"]),
-            "fare_amount": float(row["fare_amount"]),
-            "tip_amount": float(row["tip_amount"]),
-            "tolls_amount": float(row["tolls_amount"]),
-            "total_amount": float(row["total_amount"]),
-
-            "duration_min": duration_min,
-
-            "pickup_longitude": float(row["pickup_longitude"]),
-            "pickup_latitude": float(row["pickup_latitude"]),
-            "dropoff_longitude": float(row["dropoff_longitude"]),
-            "dropoff_latitude": float(row["dropoff_latitude"]),
-        })
-
-    file.close()
+    _agregar_archivo(catalog["trips"], os.path.join(data_dir, filename), workers, limite)
+
+    construir_indice_pickup_ts(catalog)
+    # Los índices que se construyen bajo demanda quedaron desactualizados
+    catalog["idx_pickup_latitude"] = None
+    catalog["idx_trip_distance"] = None
+    catalog["idx_req4"] = None
+    catalog["idx_req5"] = None
+    catalog["idx_barrios"] = None
     end = get_time()
     tiempo_milisegundos = delta_time(start, end)
 
-    elements = catalog["trips"]["elements"]
-    size = catalog["trips"]["size"]
+    max_trip, min_trip, primeras5_rows, ultimas5_rows = resumen_viajes(catalog)
+    total_registros = lt.size(catalog["trips"])
+
+    return catalog, max_trip, min_trip, primeras5_rows, ultimas5_rows, tiempo_milisegundos, total_registros
+
 
-    min_trip = None
-    max_trip = None
+# Etapas de la carga de viajes
 
-    for t in elements:
-        dist = t.get("trip_distance", 0.0)
+_ABRIDORES = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
 
-        if dist > 0.0:
-            if min_trip is None or dist < min_trip["trip_distance"]:
-                min_trip = t
 
-        if max_trip is None or dist > max_trip["trip_distance"]:
-            max_trip = t
+def _abridor(path):
+    # Función para abrir el archivo en binario según su compresión
+    return _ABRIDORES.get(os.path.splitext(path)[1].lower(), open)
+
+
+def _rangos_de_bytes(path, partes):
+    """
+    Lee el encabezado del CSV y parte el resto del archivo en hasta `partes`
+    rangos de bytes [inicio, fin) que empiezan al comienzo de una línea.
+    fin None significa hasta el final del archivo.
+    Retorna (campos del encabezado, lista de rangos).
+    """
+    with _abridor(path)(path, "rb") as file:
+        encabezado = file.readline().decode("utf-8")
+        inicio = file.tell()
+        cortes = [inicio]
+        if partes > 1:
+            total = os.fstat(file.fileno()).st_size
+            for k in range(1, partes):
+                pos = inicio + (total - inicio) * k // partes
+                if pos <= cortes[-1]:
+                    continue
+                # Avanzar hasta el inicio de la línea siguiente
+                file.seek(pos - 1)
+                file.readline()
+                pos = file.tell()
+                if pos >= total:
+                    break
+                if pos > cortes[-1]:
+                    cortes.append(pos)
+        cortes.append(None)
+    campos = next(csv.reader([encabezado]))
+    return campos, list(zip(cortes[:-1], cortes[1:]))
+
+
+def _leer_lineas(path, inicio, fin):
+    # Lectura: líneas del archivo (como texto) entre los bytes inicio y fin
+    with _abridor(path)(path, "rb") as file:
+        file.seek(inicio)
+        pos = inicio
+        while fin is None or pos < fin:
+            linea = file.readline()
+            if not linea:
+                break
+            pos += len(linea)
+            yield linea.decode("utf-8")
+
+
+def _interpretar_filas(lineas, campos):
+    # Interpretación: cada fila del CSV como tupla de campos ya convertidos
+    for row in csv.DictReader(lineas, fieldnames=campos):
+        yield (
+            row["pickup_datetime"],
+            row["dropoff_datetime"],
+            int(row["passenger_count"]),
+            row["payment_type"].strip().upper(),
+            float(row["trip_distance"]),
+            float(row["fare_amount"]),
+            float(row["tip_amount"]),
+            float(row["tolls_amount"]),
+            float(row["total_amount"]),
+            float(row["pickup_longitude"]),
+            float(row["pickup_latitude"]),
+            float(row["dropoff_longitude"]),
+            float(row["dropoff_latitude"]),
+        )
+
+
+def _derivar_campos(filas):
+    # Derivación: agrega timestamps de recogida/terminación, hora y duración
+    for fila in filas:
+        pick_ts, pick_h = parse_fecha(fila[0])
+        drop_ts, drop_h = parse_fecha(fila[1])
+        yield fila + (pick_ts, drop_ts, pick_h, (drop_ts - pick_ts) / 60.0)
+
+
+def _sumidero_columnas(viajes):
+    """
+    Sumidero: guarda los viajes en un bloque columnar con la forma de
+    new_trips() y calcula en la misma pasada los extremos de distancia.
+    """
+    bloque = new_trips()
+    cols = bloque["columns"]
+    pickup_dt = cols["pickup_datetime"]
+    dropoff_dt = cols["dropoff_datetime"]
+    pickup_ts = cols["pickup_ts"]
+    dropoff_ts = cols["dropoff_ts"]
+    pickup_hour = cols["pickup_hour"]
+    passenger_count = cols["passenger_count"]
+    payment_type = cols["payment_type"]
+    trip_distance = cols["trip_distance"]
+    fare_amount = cols["fare_amount"]
+    tip_amount = cols["tip_amount"]
+    tolls_amount = cols["tolls_amount"]
+    total_amount = cols["total_amount"]
+    duration = cols["duration_min"]
+    pickup_lon = cols["pickup_longitude"]
+    pickup_lat = cols["pickup_latitude"]
+    dropoff_lon = cols["dropoff_longitude"]
+    dropoff_lat = cols["dropoff_latitude"]
+    pickup_nb = cols["pickup_nb"]
+
+    # Codificación por diccionario de payment_type, local al bloque
+    codigos_pago = {}
+    nombres_pago = bloque["payment_types"]
+
+    # Extremos: la menor distancia positiva y la mayor (el primero en caso de empate)
+    min_idx = -1
+    max_idx = -1
+    min_dist = 0.0
+    max_dist = 0.0
+
+    n = 0
+    for (pick_s, drop_s, pasajeros, pago, dist, fare, tip, tolls, total,
+         plon, plat, dlon, dlat, pick_ts, drop_ts, pick_h, duration_min) in viajes:
+        pickup_dt += _fecha_ancho_fijo(pick_s)
+        dropoff_dt += _fecha_ancho_fijo(drop_s)
+        pickup_ts.append(pick_ts)
+        dropoff_ts.append(drop_ts)
+        pickup_hour.append(pick_h)
+
+        passenger_count.append(pasajeros)
+        codigo = codigos_pago.get(pago)
+        if codigo is None:
+            codigo = len(nombres_pago)
+            codigos_pago[pago] = codigo
+            nombres_pago.append(pago)
+        payment_type.append(codigo)
+
+        trip_distance.append(dist)
+        fare_amount.append(fare)
+        tip_amount.append(tip)
+        tolls_amount.append(tolls)
+        total_amount.append(total)
+
+        duration.append(duration_min)
+
+        pickup_lon.append(plon)
+        pickup_lat.append(plat)
+        dropoff_lon.append(dlon)
+        dropoff_lat.append(dlat)
+        pickup_nb.append(-1)
+
+        if dist > 0.0 and (min_idx == -1 or dist < min_dist):
+            min_idx = n
+            min_dist = dist
+        if max_idx == -1 or dist > max_dist:
+            max_idx = n
+            max_dist = dist
+        n += 1
+
+    bloque["size"] = n
+    bloque["extremos_distancia"] = (min_idx, max_idx)
+    return bloque
+
+
+def _cargar_rango(path, campos, inicio, fin, limite=None):
+    """
+    Arma la cadena de etapas para las filas entre los bytes inicio y fin y
+    retorna el bloque columnar resultante. Es la unidad de trabajo de la
+    carga, tanto secuencial como en paralelo.
+    """
+    lineas = _leer_lineas(path, inicio, fin)
+    viajes = _derivar_campos(_interpretar_filas(lineas, campos))
+    if limite is not None:
+        viajes = itertools.islice(viajes, limite)
+    return _sumidero_columnas(viajes)
+
+
+def _agregar_archivo(trips, path, workers=1, limite=None):
+    """
+    Agrega al final de trips las filas del archivo path. Con workers > 1 un
+    archivo sin comprimir se parte en rangos de bytes que se interpretan en
+    paralelo; los bloques se agregan en el orden del archivo. Un límite de
+    filas o un archivo comprimido se leen en un solo tramo.
+    """
+    partes = max(1, workers)
+    if limite is not None or _abridor(path) is not open:
+        partes = 1
+    campos, rangos = _rangos_de_bytes(path, partes)
+    if len(rangos) > 1:
+        with ProcessPoolExecutor(max_workers=len(rangos)) as pool:
+            bloques = pool.map(_cargar_rango, [path] * len(rangos), [campos] * len(rangos),
+                               [r[0] for r in rangos], [r[1] for r in rangos])
+            for bloque in bloques:
+                _agregar_bloque(trips, bloque)
+    else:
+        for inicio, fin in rangos:
+            _agregar_bloque(trips, _cargar_rango(path, campos, inicio, fin, limite))
+
+
+def _agregar_bloque(trips, bloque):
+    # Agrega al final de trips las filas de un bloque de _cargar_rango,
+    # traduciendo los códigos locales de payment_type a los de trips y
+    # combinando los extremos de distancia
+    cols = trips["columns"]
+    for nombre in cols:
+        cols[nombre] = si.mutable(cols[nombre])
+    nombres = trips["payment_types"]
+    codigos = {}
+    for codigo, nombre in enumerate(nombres):
+        codigos[nombre] = codigo
+    traduccion = []
+    for nombre in bloque["payment_types"]:
+        if nombre not in codigos:
+            codigos[nombre] = len(nombres)
+            nombres.append(nombre)
+        traduccion.append(codigos[nombre])
+
+    offset = trips["size"]
+    distancias = cols["trip_distance"]
+    min_idx, max_idx = trips["extremos_distancia"]
+    min_b, max_b = bloque["extremos_distancia"]
+    dist_b = bloque["columns"]["trip_distance"]
+    if min_b != -1 and (min_idx == -1 or dist_b[min_b] < distancias[min_idx]):
+        min_idx = offset + min_b
+    if max_b != -1 and (max_idx == -1 or dist_b[max_b] > distancias[max_idx]):
+        max_idx = offset + max_b
+    trips["extremos_distancia"] = (min_idx, max_idx)
+
+    for nombre, columna in bloque["columns"].items():
+        if nombre == "payment_type" and traduccion != list(range(len(traduccion))):
+            columna = array(columna.typecode, [traduccion[c] for c in columna])
+        cols[nombre] += columna
+    trips["size"] += bloque["size"]
+
+
+def append_data(catalog, filename, workers=1):
+    """
+    Agrega al catálogo los viajes de un archivo nuevo sin recargar los
+    anteriores, manteniendo al día los índices ya construidos: pickup_ts,
+    día y hora de terminación, y barrio de recogida (con su asignación).
+    Los índices ordenados (sorted_index) mezclan las filas nuevas en una sola
+    pasada sin recalcular la llave de las existentes, y los arreglos por día
+    y por barrio se mezclan igual con si.merge_rows, así que si los viajes
+    nuevos llegan después de los existentes el costo es proporcional a ellos.
+    Retorna (catalog, viajes agregados, tiempo en milisegundos).
+    """
+    start = get_time()
+    trips = catalog["trips"]
+    primera = trips["size"]
+    _agregar_archivo(trips, os.path.join(data_dir, filename), workers)
+    nuevas = range(primera, trips["size"])
+
+    cols = trips["columns"]
+    pickup_ts = cols["pickup_ts"]
+    dropoff_dt = cols["dropoff_datetime"]
+
+    def clave_pickup(i):
+        # Orden de idx_pickup_ts e idx_barrios: pickup_ts ↑ y en empate posición ↓
+        return (pickup_ts[i], -i)
+
+    def clave_dropoff(i):
+        # Orden de cada día en idx_req4: dropoff_datetime ↑ y en empate posición ↑
+        return (texto_fecha(dropoff_dt, i), i)
+
+    if catalog["idx_pickup_ts"] is None:
+        construir_indice_pickup_ts(catalog)
+    else:
+        si.insert(catalog["idx_pickup_ts"], pickup_ts, nuevas, _posicion_desc)
+    if catalog["idx_pickup_latitude"] is not None:
+        si.insert(catalog["idx_pickup_latitude"], cols["pickup_latitude"], nuevas,
+                  _desempate_latitud(catalog))
+    if catalog["idx_trip_distance"] is not None:
+        si.insert(catalog["idx_trip_distance"], cols["trip_distance"], nuevas,
+                  _desempate_distancia(catalog))
+
+    if catalog["idx_req4"] is not None:
+        por_dia = {}
+        for i in nuevas:
+            por_dia.setdefault(texto_fecha(dropoff_dt, i, 0, 10), []).append(i)
+        for dia, filas_dia in por_dia.items():
+            filas = mp.get(catalog["idx_req4"], dia)
+            if filas is None:
+                mp.put(catalog["idx_req4"], dia, array("l", sorted(filas_dia, key=clave_dropoff)))
+            else:
+                filas = si.mutable(filas)
+                filas = si.merge_rows(filas, filas_dia, clave_dropoff)
+                mp.put(catalog["idx_req4"], dia, filas)
+
+    if catalog["idx_req5"] is not None:
+        horas = set()
+        for i in nuevas:
+            k = texto_fecha(dropoff_dt, i, 0, 13)
+            mm.add(catalog["idx_req5"], k, i)
+            horas.add(k)
+        mm.sort_values(catalog["idx_req5"], _clave_req5(catalog), True, horas)
+
+    if catalog["idx_barrios"] is not None:
+        nombres = catalog["nombres_barrios"]
+        id_de_barrio = _ids_de_barrios(catalog)
+        lats = cols["pickup_latitude"]
+        lons = cols["pickup_longitude"]
+        pickup_nb = cols["pickup_nb"]
+        por_barrio = {}
+        for i in nuevas:
+            j = barrio_mas_cercano(catalog, lats[i], lons[i])
+            nb = id_de_barrio[j] if j != -1 else -1
+            pickup_nb[i] = nb
+            if nb != -1:
+                por_barrio.setdefault(nb, []).append(i)
+        for nb, filas_nb in por_barrio.items():
+            nb_key = lt.get_element(nombres, nb)
+            filas = si.mutable(mp.get(catalog["idx_barrios"], nb_key))
+            filas = si.merge_rows(filas, filas_nb, clave_pickup)
+            mp.put(catalog["idx_barrios"], nb_key, filas)
+
+    return catalog, len(nuevas), delta_time(start, get_time())
+
+
+def resumen_viajes(catalog):
+    """
+    Retorna el resumen de la carga de viajes: el trayecto de mayor distancia,
+    el de menor distancia (positiva) y los primeros y últimos 5 trayectos.
+    """
+    size = lt.size(catalog["trips"])
+    min_idx, max_idx = catalog["trips"]["extremos_distancia"]
+    min_trip = get_data(catalog, min_idx) if min_idx != -1 else None
+    max_trip = get_data(catalog, max_idx) if max_idx != -1 else None
 
     primeras5_rows = []
     ultimas5_rows = []
 
-    primeras_slice = elements[:5] if size > 0 else []
-    
-    for trip in primeras_slice:
+    for i in range(min(5, size)):
+        trip = get_data(catalog, i)
         primeras5_rows.append( [{
             "pickup_datetime": trip["pickup_datetime"],
             "dropoff_datetime": trip["dropoff_datetime"],
@@ -104,8 +486,8 @@ def load_data(catalog, filename):
             "total_amount": round(trip["total_amount"], 2),
         }])
 
-    ultimas_slice = elements[-5:] 
-    for t in ultimas_slice:
+    for i in range(max(0, size - 5), size):
+        t = get_data(catalog, i)
         ultimas5_rows.append([{
             "pickup_datetime": t["pickup_datetime"],
             "dropoff_datetime": t["dropoff_datetime"],
@@ -114,9 +496,60 @@ def load_data(catalog, filename):
             "total_amount": round(t["total_amount"], 2),
         }])
 
-    total_registros = lt.size(catalog["trips"])
+    return max_trip, min_trip, primeras5_rows, ultimas5_rows
 
-    return catalog, max_trip, min_trip, primeras5_rows, ultimas5_rows, tiempo_milisegundos, total_registros
+
+def _fecha_ancho_fijo(texto):
+    # Las fechas se guardan con ancho fijo; un texto fuera del formato
+    # canónico se reescribe a partir de la fecha interpretada
+    if len(texto) != ANCHO_FECHA:
+        texto = time.strftime(FORMATO_FECHA, time.strptime(texto, FORMATO_FECHA))
+    return texto.encode("ascii")
+
+
+# Epoch local de las 00:00:00 de cada fecha "YYYY-MM-DD" ya vista, o False
+# si ese día no dura 86400 s (cambio de horario) y no se puede usar la suma
+_epoch_por_dia = {}
+
+
+def _epoch_dia(dia):
+    try:
+        t = time.strptime(dia, "%Y-%m-%d")
+    except ValueError:
+        _epoch_por_dia[dia] = False
+        return False
+    inicio = time.mktime((t.tm_year, t.tm_mon, t.tm_mday, 0, 0, 0, 0, 0, -1))
+    fin = time.mktime((t.tm_year, t.tm_mon, t.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    base = inicio if fin - inicio == 86400 else False
+    _epoch_por_dia[dia] = base
+    return base
+
+
+def parse_fecha(texto):
+    """
+    Interpreta un texto "YYYY-MM-DD HH:MM:SS" y retorna (timestamp, hora).
+    Da los mismos valores que time.mktime(time.strptime(texto, FORMATO_FECHA))
+    y tm_hour, pero sin strptime: toma los campos por posición y suma
+    h*3600 + m*60 + s al epoch memorizado de la fecha. Cualquier texto fuera
+    de ese formato, o un día con cambio de horario, usa el camino de strptime.
+    """
+    if (len(texto) == ANCHO_FECHA and texto.isascii() and texto[10] == " "
+            and texto[13] == ":" and texto[16] == ":"):
+        dia = texto[:10]
+        base = _epoch_por_dia.get(dia)
+        if base is None:
+            base = _epoch_dia(dia)
+        hh = texto[11:13]
+        mi = texto[14:16]
+        ss = texto[17:19]
+        if base is not False and hh.isdigit() and mi.isdigit() and ss.isdigit():
+            h = int(hh)
+            m = int(mi)
+            sec = int(ss)
+            if h < 24 and m < 60 and sec < 60:
+                return base + h * 3600 + m * 60 + sec, h
+    t = time.strptime(texto, FORMATO_FECHA)
+    return time.mktime(t), t.tm_hour
 
 def load_neighborhoods(catalog, filename):
     """
@@ -151,6 +584,7 @@ def load_neighborhoods(catalog, filename):
             })
             cargados += 1
 
+    construir_indice_espacial_barrios(catalog)
     end = get_time()
     tiempo_milisegundos = delta_time(start, end)
     total_registros = lt.size(catalog["barrios"])
@@ -158,35 +592,516 @@ def load_neighborhoods(catalog, filename):
     return catalog, tiempo_milisegundos, total_registros, cargados
 
 
-def clave_hora_terminacion(trip):
-    # Llave: "%Y-%m-%d %H" tomada de dropoff_datetime
-    # dropoff_datetime viene como "YYYY-MM-DD HH:MM:SS"
-    dt = trip["dropoff_datetime"]
-    # Primeros 13 caracteres: "YYYY-MM-DD HH"
-    return dt[:13]
+# Snapshot binario del catálogo
+
+# Encabezado: firma, versión y largo del pickle con la estructura
+MAGIA_SNAPSHOT = b"RETO2SNP"
+VERSION_SNAPSHOT = 4
+_ENCABEZADO = struct.Struct("<8sIQ")
+_ALINEACION = 8
+
+# Índices que son tablas hash con llaves de texto: la casilla de cada llave
+# depende de hash(), que para cadenas cambia en cada proceso, así que no se
+# guardan en el snapshot. idx_barrios se reconstruye al cargar y los otros
+# dos se construyen con la primera consulta, como después de load_data.
+_INDICES_HASH = ("idx_barrios", "idx_req4", "idx_req5")
+
+
+def ruta_snapshot(filename):
+    """
+    Ruta del snapshot asociado a un archivo de viajes, junto a él en Data/Challenge-2
+    """
+    base = os.path.splitext(os.path.join(data_dir, filename))[0]
+    return base + ".snapshot"
+
+
+def _firma_fuentes(filenames):
+    # (nombre, tamaño, fecha de modificación) de cada CSV de origen
+    firma = []
+    for filename in filenames:
+        info = os.stat(os.path.join(data_dir, filename))
+        firma.append((filename, info.st_size, info.st_mtime))
+    return firma
+
+
+def _plataforma():
+    # Los arreglos se guardan en el formato nativo de la máquina
+    return (sys.byteorder, array("l").itemsize, array("i").itemsize)
+
+
+def _alinear(n):
+    return (n + _ALINEACION - 1) // _ALINEACION * _ALINEACION
+
+
+def save_snapshot(catalog, trips_filename, barrios_filename):
+    """
+    Guarda el catálogo cargado (viajes, barrios e índices ya construidos) en
+    un snapshot binario junto al archivo de viajes. Las columnas y demás
+    arreglos se escriben como bloques crudos que load_snapshot mapea en
+    memoria; el resto de la estructura va en un pickle al inicio.
+    Retorna el tiempo que tomó en milisegundos.
+    """
+    start = get_time()
+    bloques = []
+    desplazamiento = [0]
+
+    class _Pickler(pickle.Pickler):
+        def persistent_id(self, obj):
+            if isinstance(obj, (array, bytearray, memoryview)):
+                if isinstance(obj, array):
+                    tipo = obj.typecode
+                elif isinstance(obj, bytearray):
+                    tipo = "B"
+                else:
+                    tipo = obj.format
+                datos = memoryview(obj).cast("B")
+                pid = (tipo, desplazamiento[0], datos.nbytes)
+                bloques.append(datos)
+                desplazamiento[0] = _alinear(desplazamiento[0] + datos.nbytes)
+                return pid
+            return None
+
+    contenido = {
+        "fuentes": _firma_fuentes([trips_filename, barrios_filename]),
+        "plataforma": _plataforma(),
+        "catalogo": _sin_indices_hash(catalog),
+        "con_idx_barrios": catalog["idx_barrios"] is not None,
+    }
+    buffer = io.BytesIO()
+    _Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(contenido)
+    estructura = buffer.getvalue()
+
+    path = ruta_snapshot(trips_filename)
+    temporal = path + ".tmp"
+    with open(temporal, "wb") as file:
+        file.write(_ENCABEZADO.pack(MAGIA_SNAPSHOT, VERSION_SNAPSHOT, len(estructura)))
+        file.write(estructura)
+        inicio_datos = _alinear(_ENCABEZADO.size + len(estructura))
+        file.write(bytes(inicio_datos - _ENCABEZADO.size - len(estructura)))
+        for datos in bloques:
+            file.write(datos)
+            file.write(bytes(_alinear(datos.nbytes) - datos.nbytes))
+    os.replace(temporal, path)
+    return delta_time(start, get_time())
+
+
+def load_snapshot(catalog, trips_filename, barrios_filename):
+    """
+    Carga en catalog el snapshot del archivo de viajes si existe, es más
+    reciente que los CSV de origen y estos no han cambiado desde que se
+    guardó. Los arreglos quedan como memoryview sobre el archivo mapeado en
+    memoria (copy-on-write), sin copiarlos.
+    Retorna el tiempo que tomó en milisegundos, o None si no se pudo usar.
+    """
+    start = get_time()
+    path = ruta_snapshot(trips_filename)
+    try:
+        mtime = os.path.getmtime(path)
+        firma = _firma_fuentes([trips_filename, barrios_filename])
+    except OSError:
+        return None
+    for _, _, mtime_fuente in firma:
+        if mtime_fuente >= mtime:
+            return None
+
+    with open(path, "rb") as file:
+        datos = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    if len(datos) < _ENCABEZADO.size:
+        return None
+    magia, version, largo = _ENCABEZADO.unpack_from(datos, 0)
+    if magia != MAGIA_SNAPSHOT or version != VERSION_SNAPSHOT:
+        return None
+    inicio_datos = _alinear(_ENCABEZADO.size + largo)
+    vista = memoryview(datos)
+
+    class _Unpickler(pickle.Unpickler):
+        def persistent_load(self, pid):
+            tipo, desplazamiento, nbytes = pid
+            inicio = inicio_datos + desplazamiento
+            return vista[inicio:inicio + nbytes].cast(tipo)
+
+    estructura = io.BytesIO(vista[_ENCABEZADO.size:_ENCABEZADO.size + largo])
+    contenido = _Unpickler(estructura).load()
+    if contenido["fuentes"] != firma or contenido["plataforma"] != _plataforma():
+        return None
+
+    catalog.clear()
+    catalog.update(contenido["catalogo"])
+    if contenido["con_idx_barrios"]:
+        construir_indice_barrios(catalog)
+    return delta_time(start, get_time())
+
+
+def _sin_indices_hash(catalog):
+    # Copia superficial del catálogo sin los índices de _INDICES_HASH
+    copia = dict(catalog)
+    for nombre in _INDICES_HASH:
+        copia[nombre] = None
+    return copia
+
+
+# Radio de la Tierra en km
+R_TIERRA = 6371
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Distancia en km entre dos puntos dados en grados (fórmula de haversine).
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_phi = math.radians(lat2 - lat1)
+    delta_lambda = math.radians(lon2 - lon1)
+
+    a = math.sin(delta_phi / 2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2)**2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+    return R_TIERRA * c
+
+
+def construir_indice_espacial_barrios(catalog):
+    """
+    Construye una grilla uniforme de latitud/longitud sobre los centroides de
+    catalog['barrios']. Cada celda guarda las posiciones de los barrios que
+    caen en ella; el lado de la celda se escoge para tener en promedio un
+    barrio por celda.
+    """
+    barrios = catalog["barrios"]["elements"]
+    n = len(barrios)
+    if n == 0:
+        catalog["idx_barrios_grid"] = None
+        return
+
+    lat_min = min(b["latitude"] for b in barrios)
+    lat_max = max(b["latitude"] for b in barrios)
+    lon_min = min(b["longitude"] for b in barrios)
+    lon_max = max(b["longitude"] for b in barrios)
+    alto = lat_max - lat_min
+    ancho = lon_max - lon_min
+    lado = max(math.sqrt(alto * ancho / n), max(alto, ancho) / n)
+    if lado <= 0:
+        lado = 1.0
+
+    filas = int(alto / lado) + 1
+    columnas = int(ancho / lado) + 1
+    celdas = lt.new_list()
+    for _ in range(filas * columnas):
+        lt.add_last(celdas, lt.new_list())
+    for j in range(n):
+        b = barrios[j]
+        f = int((b["latitude"] - lat_min) / lado)
+        c = int((b["longitude"] - lon_min) / lado)
+        lt.add_last(lt.get_element(celdas, f * columnas + c), j)
+
+    # Cota para podar por longitud: el menor coseno de latitud de los centroides
+    cos_min = min(math.cos(math.radians(b["latitude"])) for b in barrios)
+
+    catalog["idx_barrios_grid"] = {
+        "lat_min": lat_min,
+        "lon_min": lon_min,
+        "lon_max": lon_max,
+        "lado": lado,
+        "filas": filas,
+        "columnas": columnas,
+        "celdas": celdas,
+        "cos_min": cos_min,
+    }
+
+
+def barrio_mas_cercano(catalog, lat, lon):
+    """
+    Retorna la posición en catalog['barrios'] del centroide más cercano (por
+    haversine) al punto dado, o -1 si no hay barrios. Da el mismo resultado
+    que recorrer todos los barrios en orden quedándose con el primero de
+    menor distancia.
+
+    Revisa la grilla por anillos alrededor de la celda del punto y se detiene
+    cuando la distancia mínima posible a las celdas sin revisar supera la
+    mejor distancia encontrada.
+    """
+    grid = catalog["idx_barrios_grid"]
+    if grid is None:
+        return -1
+    barrios = catalog["barrios"]["elements"]
+
+    if not (-90.0 <= lat <= 90.0) or not (-180.0 <= lon <= 180.0):
+        # Fuera del dominio de las cotas: recorrido completo
+        mejor = -1
+        mejor_dist = None
+        for j in range(len(barrios)):
+            d = haversine(lat, lon, barrios[j]["latitude"], barrios[j]["longitude"])
+            if mejor_dist is None or d < mejor_dist:
+                mejor_dist = d
+                mejor = j
+        return mejor
+
+    lat_min = grid["lat_min"]
+    lon_min = grid["lon_min"]
+    lado = grid["lado"]
+    filas = grid["filas"]
+    columnas = grid["columnas"]
+    celdas = grid["celdas"]
+    # sin(dlon/2) se multiplica por este factor para acotar la distancia por longitud
+    factor_lon = math.sqrt(max(0.0, math.cos(math.radians(lat)) * grid["cos_min"]))
+    dlon_max = max(abs(lon - lon_min), abs(lon - grid["lon_max"]))
+
+    fq = math.floor((lat - lat_min) / lado)
+    cq = math.floor((lon - lon_min) / lado)
+    # Los anillos más cercanos que no tocan la grilla están vacíos
+    k = max(0, -fq, fq - (filas - 1), -cq, cq - (columnas - 1))
+
+    mejor = -1
+    mejor_dist = None
+    while True:
+        for f in range(max(0, fq - k), min(filas - 1, fq + k) + 1):
+            if f == fq - k or f == fq + k:
+                cols = range(max(0, cq - k), min(columnas - 1, cq + k) + 1)
+            else:
+                cols = [c for c in (cq - k, cq + k) if 0 <= c < columnas]
+            for c in cols:
+                celda = lt.get_element(celdas, f * columnas + c)
+                for j in celda["elements"]:
+                    b = barrios[j]
+                    d = haversine(lat, lon, b["latitude"], b["longitude"])
+                    if mejor_dist is None or d < mejor_dist or (d == mejor_dist and j < mejor):
+                        mejor_dist = d
+                        mejor = j
+
+        # Menor separación en grados hacia las celdas aún sin revisar
+        gap_lat = math.inf
+        if fq - k > 0:
+            gap_lat = lat - (lat_min + (fq - k) * lado)
+        if fq + k < filas - 1:
+            gap_lat = min(gap_lat, lat_min + (fq + k + 1) * lado - lat)
+        gap_lon = math.inf
+        if cq - k > 0:
+            gap_lon = lon - (lon_min + (cq - k) * lado)
+        if cq + k < columnas - 1:
+            gap_lon = min(gap_lon, lon_min + (cq + k + 1) * lado - lon)
+        if gap_lat == math.inf and gap_lon == math.inf:
+            return mejor
+
+        if mejor_dist is not None:
+            cota = math.inf
+            if gap_lat != math.inf:
+                cota = R_TIERRA * math.radians(gap_lat)
+            if gap_lon != math.inf:
+                # sin(dlon/2) es mínimo en uno de los extremos de [gap_lon, dlon_max]
+                seno = min(math.sin(math.radians(gap_lon) / 2), math.sin(math.radians(dlon_max) / 2))
+                cota = min(cota, 2 * R_TIERRA * math.asin(min(1.0, factor_lon * seno)))
+            # Margen para que un empate por redondeo no quede sin revisar
+            if cota - 1e-6 > mejor_dist:
+                return mejor
+        k += 1
+
+
+def asignar_barrios(catalog):
+    """
+    Paso de carga que se ejecuta después de load_data y load_neighborhoods.
+    Escribe en cada viaje el id del barrio de recogida más cercano
+    ("pickup_nb", posición en catalog['nombres_barrios'] o -1) y construye
+    catalog['idx_barrios']: nombre de barrio -> arreglo de posiciones de sus
+    viajes, ordenadas por pickup_ts ascendente.
+    Retorna el tiempo que tomó en milisegundos.
+    """
+    start = get_time()
+    if catalog["idx_barrios_grid"] is None:
+        construir_indice_espacial_barrios(catalog)
+    if catalog["idx_pickup_ts"] is None:
+        construir_indice_pickup_ts(catalog)
+
+    # Ids compactos: uno por nombre de barrio distinto, en orden de aparición
+    nombres = lt.new_list()
+    ids = {}
+    for b in catalog["barrios"]["elements"]:
+        nb_key = b["neighborhood"].strip().lower()
+        if nb_key not in ids:
+            ids[nb_key] = lt.size(nombres)
+            lt.add_last(nombres, nb_key)
+    catalog["nombres_barrios"] = nombres
+    id_de_barrio = _ids_de_barrios(catalog)
+
+    cols = catalog["trips"]["columns"]
+    lats = cols["pickup_latitude"]
+    lons = cols["pickup_longitude"]
+    pickup_nb = cols["pickup_nb"]
+    for i in range(lt.size(catalog["trips"])):
+        nb = -1
+        j = barrio_mas_cercano(catalog, lats[i], lons[i])
+        if j != -1:
+            nb = id_de_barrio[j]
+        pickup_nb[i] = nb
+
+    construir_indice_barrios(catalog)
+    return delta_time(start, get_time())
+
+
+def construir_indice_barrios(catalog):
+    """
+    Construye catalog['idx_barrios'] a partir de la columna pickup_nb ya
+    asignada y del índice de pickup_ts, sin volver a buscar barrios.
+    """
+    nombres = catalog["nombres_barrios"]
+    pickup_nb = catalog["trips"]["columns"]["pickup_nb"]
+    # Recorrer en el orden del índice de pickup_ts deja cada lista ya ordenada
+    por_barrio = []
+    for _ in range(lt.size(nombres)):
+        por_barrio.append(array("l"))
+    for i in catalog["idx_pickup_ts"]["rows"]:
+        nb = pickup_nb[i]
+        if nb != -1:
+            por_barrio[nb].append(i)
+
+    index = mp.new_map(max(1, lt.size(nombres)), 0.5)
+    for nb in range(lt.size(nombres)):
+        mp.put(index, lt.get_element(nombres, nb), por_barrio[nb])
+    catalog["idx_barrios"] = index
+
+
+def _ids_de_barrios(catalog):
+    # Para cada posición de catalog['barrios'], el id de su nombre en
+    # catalog['nombres_barrios']
+    ids = {}
+    nombres = catalog["nombres_barrios"]
+    for nb in range(lt.size(nombres)):
+        ids[lt.get_element(nombres, nb)] = nb
+    id_de_barrio = []
+    for b in catalog["barrios"]["elements"]:
+        id_de_barrio.append(ids[b["neighborhood"].strip().lower()])
+    return id_de_barrio
+
+
+def construir_indice_pickup_ts(catalog):
+    """
+    Construye el índice ordenado (sorted_index) por pickup_ts. Los empates
+    quedan con la posición mayor primero, que es el orden en que los deja
+    lt.merge_sort con el criterio estricto de req_1.
+    """
+    ts = catalog["trips"]["columns"]["pickup_ts"]
+    n = lt.size(catalog["trips"])
+    # sorted es estable: recorrer las posiciones al revés deja los empates de mayor a menor
+    catalog["idx_pickup_ts"] = si.new_index(ts, range(n - 1, -1, -1))
+
+
+def construir_indice_latitud(catalog):
+    """
+    Índice ordenado por pickup_latitude para req_2. Leído de atrás hacia
+    adelante da el orden de req_2: latitud ↓, longitud ↓ y, en empate, la
+    posición mayor primero (como lt.merge_sort con el criterio estricto).
+    """
+    if catalog["idx_pickup_latitude"] is not None:
+        return
+    cols = catalog["trips"]["columns"]
+    catalog["idx_pickup_latitude"] = si.new_index(
+        cols["pickup_latitude"], tie_key=_desempate_latitud(catalog))
+
+
+def construir_indice_distancia(catalog):
+    """
+    Índice ordenado por trip_distance para req_3. Leído de atrás hacia
+    adelante da el orden de req_3: distancia ↓, total_amount ↓ y, en empate,
+    la posición mayor primero.
+    """
+    if catalog["idx_trip_distance"] is not None:
+        return
+    cols = catalog["trips"]["columns"]
+    catalog["idx_trip_distance"] = si.new_index(
+        cols["trip_distance"], tie_key=_desempate_distancia(catalog))
+
+
+def _posicion_desc(i):
+    return -i
+
+
+def _desempate_latitud(catalog):
+    lons = catalog["trips"]["columns"]["pickup_longitude"]
+    return lambda i: (lons[i], i)
+
+
+def _desempate_distancia(catalog):
+    totales = catalog["trips"]["columns"]["total_amount"]
+    return lambda i: (totales[i], i)
+
 
 def construir_indice_por_hora_terminacion(catalog):
-    # Construye índice hash: key -> lista de viajes con esa fecha+hora de terminación
+    # Construye índice hash: key -> lista de posiciones de los viajes con esa
+    # fecha+hora de terminación, ordenadas por dropoff_ts descendente
     if "idx_req5" in catalog and catalog["idx_req5"] is not None:
         return
-    index = mp.new_map(15000, 0.5)
-    trips = catalog["trips"]["elements"]
-    for t in trips:
-        k = clave_hora_terminacion(t)
-        bucket = mp.get(index, k)
-        if bucket is None:
-            bucket = lt.new_list()
-            mp.put(index, k, bucket)
-        lt.add_last(bucket, t)
-    catalog["idx_req5"] = index
+    dropoff_dt = catalog["trips"]["columns"]["dropoff_datetime"]
+    catalog["idx_req5"] = mm.group_by(
+        range(lt.size(catalog["trips"])),
+        lambda i: texto_fecha(dropoff_dt, i, 0, 13),
+        _clave_req5(catalog), True, 15000)
+
+def _clave_req5(catalog):
+    # Orden de req_5: dropoff_ts descendente y, en empates, la posición mayor
+    # primero, que es como quedaban con lt.merge_sort y el criterio estricto
+    dropoff_ts = catalog["trips"]["columns"]["dropoff_ts"]
+    return lambda i: (dropoff_ts[i], i)
+
+def construir_indice_por_dia_terminacion(catalog):
+    # Construye índice hash: "YYYY-MM-DD" -> arreglo con las posiciones de los
+    # viajes que terminan ese día, ordenadas por dropoff_datetime ascendente
+    if "idx_req4" in catalog and catalog["idx_req4"] is not None:
+        return
+    dropoff_dt = catalog["trips"]["columns"]["dropoff_datetime"]
+    orden = sorted(range(lt.size(catalog["trips"])),
+                   key=lambda i: texto_fecha(dropoff_dt, i))
+
+    # Al recorrer en orden cada día queda contiguo: se parte en tramos
+    dias = []
+    tramo = None
+    dia_actual = None
+    for i in orden:
+        dia = texto_fecha(dropoff_dt, i, 0, 10)
+        if dia != dia_actual:
+            tramo = array("l")
+            dias.append((dia, tramo))
+            dia_actual = dia
+        tramo.append(i)
+
+    index = mp.new_map(max(1, len(dias)), 0.5)
+    for dia, tramo in dias:
+        mp.put(index, dia, tramo)
+    catalog["idx_req4"] = index
+
+
+def _primera_posicion(filas, valor, clave, incluir_igual):
+    # Búsqueda binaria sobre filas ordenadas por clave(fila): primera posición
+    # cuya clave es >= valor (incluir_igual) o > valor (no incluir_igual)
+    lo = 0
+    hi = len(filas)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        k = clave(filas[mid])
+        if k < valor or (not incluir_igual and k == valor):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
 
 # Funciones de consulta sobre el catálogo
 
 def get_data(catalog, idx):
     """
     Retorna un dato por su índice (0-based) dentro de trips.
+    El viaje se arma como diccionario a partir de las columnas.
     """
-    return lt.get_element(catalog["trips"], idx)
+    trips = catalog["trips"]
+    if idx < 0:
+        idx += trips["size"]
+    if idx < 0 or idx >= trips["size"]:
+        raise IndexError("list index out of range")
+    cols = trips["columns"]
+    trip = {}
+    for nombre in COLUMNAS_FECHA:
+        trip[nombre] = texto_fecha(cols[nombre], idx)
+    for nombre, tipo in COLUMNAS_VIAJES:
+        trip[nombre] = cols[nombre][idx]
+    trip["payment_type"] = trips["payment_types"][trip["payment_type"]]
+    return trip
 
 
 
@@ -202,19 +1117,13 @@ def req_1(catalog, start_dt_str, end_dt_str, sample_n):
     end_ts   = time.mktime(end_tuple)
 
     
-    trips_pylist = catalog["trips"]["elements"]
-    filtrados = lt.new_list()
-    for t in trips_pylist:
-        if start_ts <= t["pickup_ts"] and t["pickup_ts"] <= end_ts:
-            lt.add_last(filtrados, t)
-
-    
-    def cmp_pickup_ts_asc(t1, t2):
-        return t1["pickup_ts"] < t2["pickup_ts"]
-
-    size_filtrados = lt.size(filtrados)
-    if size_filtrados > 1:
-        filtrados = lt.merge_sort(filtrados, cmp_pickup_ts_asc)
+    # Búsqueda binaria de la franja sobre el índice ordenado por pickup_ts
+    if catalog["idx_pickup_ts"] is None:
+        construir_indice_pickup_ts(catalog)
+    idx = catalog["idx_pickup_ts"]
+    lo, hi = si.bounds(idx, start_ts, end_ts)
+    filas = idx["rows"]
+    size_filtrados = hi - lo
 
     if isinstance(sample_n, int):
         N = sample_n
@@ -230,7 +1139,8 @@ def req_1(catalog, start_dt_str, end_dt_str, sample_n):
 
     if size_filtrados <= 2 * N:
         # Mostrar todos en "primeros" y reutilizar en "ultimos"
-        for t in filtrados["elements"]:
+        for i in range(lo, lo + size_filtrados):
+            t = get_data(catalog, filas[i])
             lt.add_last(primeros, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -242,8 +1152,8 @@ def req_1(catalog, start_dt_str, end_dt_str, sample_n):
         ultimos = primeros
     else:
         # N primeros
-        for i in range(N):
-            t = lt.get_element(filtrados, i)
+        for i in range(lo, lo + N):
+            t = get_data(catalog, filas[i])
             lt.add_last(primeros, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -253,8 +1163,8 @@ def req_1(catalog, start_dt_str, end_dt_str, sample_n):
                 "total_amount": round(t["total_amount"], 2)
             })
         # N últimos
-        for i in range(size_filtrados - N, size_filtrados):
-            t = lt.get_element(filtrados, i)
+        for i in range(hi - N, hi):
+            t = get_data(catalog, filas[i])
             lt.add_last(ultimos, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -294,29 +1204,11 @@ def req_2(catalog, lat_min, lat_max, N):
     # TODO: Modificar el requerimiento 2
     start = get_time()
 
-    # Aca lo que hacemos es que filtramos los viajes por lo que dice el requerimiento
-    filtrados = lt.new_list()
-    size_trips = lt.size(catalog["trips"])
-
-    for i in range(size_trips):
-        trip = get_data(catalog, i)
-        lat = trip["pickup_latitude"]
-        if lat_min <= lat and lat <= lat_max:
-            lt.add_last(filtrados, trip)
-
-    # Definimos el criterio de ordenamiento especifico para el requisito 2
-    def sort_criteria_req2(a, b):
-        if a["pickup_latitude"] > b["pickup_latitude"]:
-            return True
-        elif a["pickup_latitude"] < b["pickup_latitude"]:
-            return False
-        else:
-            return a["pickup_longitude"] > b["pickup_longitude"]
-
-    # Aca ordenamos usando merge sort
+    # Los viajes de la franja de latitud salen del índice ordenado ya en el
+    # orden del requisito (latitud ↓ y luego longitud ↓)
+    construir_indice_latitud(catalog)
+    filtrados = si.values(catalog["idx_pickup_latitude"], lat_min, lat_max, reverse=True)
     size_filtrados = lt.size(filtrados)
-    if size_filtrados > 1:
-        filtrados = lt.merge_sort(filtrados, sort_criteria_req2)
 
     # Creamos las listas para los primeros y ultimos
     primeros = []
@@ -325,21 +1217,21 @@ def req_2(catalog, lat_min, lat_max, N):
     if size_filtrados <= 2 * N:
         # Se devuelve solamente una vez los elementos y se igualan
         for i in range(size_filtrados):
-            t = lt.get_element(filtrados, i)
-            primeros.append(primeros({
+            t = get_data(catalog, lt.get_element(filtrados, i))
+            primeros.append({
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
                 "dropoff_datetime": t["dropoff_datetime"],
                 "dropoff_coords": [t["dropoff_latitude"], t["dropoff_longitude"]],
                 "trip_distance": round(t["trip_distance"], 3),
                 "total_amount": round(t["total_amount"], 2)
-            }))
+            })
         # Esto es para decir que los elementos sean iguales para no imprimirlos 2 veces porque los filtrados son menor que 2N
         ultimos = primeros 
     else:
         # Aca agregamos los primeros elementos el rango de N
         for i in range(N):
-            t = lt.get_element(filtrados, i)
+            t = get_data(catalog, lt.get_element(filtrados, i))
             primeros.append({
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -351,7 +1243,7 @@ def req_2(catalog, lat_min, lat_max, N):
 
         # Aca agregamos los ultimos elementos en el rango de N
         for i in range(size_filtrados - N, size_filtrados):
-            t = lt.get_element(filtrados, i)
+            t = get_data(catalog, lt.get_element(filtrados, i))
             ultimos.append({
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -380,20 +1272,9 @@ def req_3(catalog, distancia_min, distancia_max, n_muestra):
     """
     inicio_ms = get_time()
 
-    # Filtrar
-    filtrados = lt.new_list()
-    for t in catalog["trips"]["elements"]:
-        d = t["trip_distance"]
-        if distancia_min <= d <= distancia_max:
-            lt.add_last(filtrados, t)
-
-    # Comparator: distancia ↓, costo ↓
-    def cmp_desc_dist_cost(a, b):
-        if a["trip_distance"] != b["trip_distance"]:
-            return a["trip_distance"] > b["trip_distance"]
-        return a["total_amount"] > b["total_amount"]
-
-    filtrados = lt.merge_sort(filtrados, cmp_desc_dist_cost)
+    # Filtrar y ordenar (distancia ↓, costo ↓) con el índice por distancia
+    construir_indice_distancia(catalog)
+    filtrados = si.values(catalog["idx_trip_distance"], distancia_min, distancia_max, reverse=True)
     total = lt.size(filtrados)
 
     # Armar salida
@@ -412,16 +1293,16 @@ def req_3(catalog, distancia_min, distancia_max, n_muestra):
     if total <= 2 * n_muestra:
         i = 0
         while i < total:
-            primeros.append(fila(lt.get_element(filtrados, i)))
+            primeros.append(fila(get_data(catalog, lt.get_element(filtrados, i))))
             i += 1
     else:
         i = 0
         while i < n_muestra:
-            primeros.append(fila(lt.get_element(filtrados, i)))
+            primeros.append(fila(get_data(catalog, lt.get_element(filtrados, i))))
             i += 1
         i = total - n_muestra
         while i < total:
-            ultimos.append(fila(lt.get_element(filtrados, i)))
+            ultimos.append(fila(get_data(catalog, lt.get_element(filtrados, i))))
             i += 1
 
     fin_ms = get_time()
@@ -445,44 +1326,29 @@ def req_4(catalog, fecha_yyyy_mm_dd, momento_interes, hora_referencia_hms, n_mue
     """
     inicio_ms = get_time()
 
-    # Índice hash por fecha de terminación
-    indice = mp.new_map(num_elements=max(1, lt.size(catalog["trips"])), load_factor=0.5)
-    for t in catalog["trips"]["elements"]:
-        llave = t["dropoff_datetime"][:10]  # YYYY-MM-DD
-        balde = mp.get(indice, llave)
-        if balde is None:
-            balde = lt.new_list()
-            mp.put(indice, llave, balde)
-        lt.add_last(balde, t)
+    # Índice hash por fecha de terminación (se construye una sola vez)
+    construir_indice_por_dia_terminacion(catalog)
+    del_dia = mp.get(catalog["idx_req4"], fecha_yyyy_mm_dd)
 
-    del_dia = mp.get(indice, fecha_yyyy_mm_dd)
+    # El día está ordenado por hora de terminación: el corte es una búsqueda binaria
+    dropoff_dt = catalog["trips"]["columns"]["dropoff_datetime"]
 
-    # Filtrar por hora respecto a referencia
-    candidatos = lt.new_list()
-    if del_dia is not None and lt.size(del_dia) > 0:
-        i = 0
-        tam = lt.size(del_dia)
+    def hora_terminacion(fila):
+        return texto_fecha(dropoff_dt, fila, 11)
+
+    lo = 0
+    hi = 0
+    if del_dia is not None:
         if momento_interes == "ANTES":
-            while i < tam:
-                t = lt.get_element(del_dia, i)
-                hhmmss = t["dropoff_datetime"][11:19]
-                if hhmmss < hora_referencia_hms:
-                    lt.add_last(candidatos, t)
-                i += 1
+            hi = _primera_posicion(del_dia, hora_referencia_hms, hora_terminacion, True)
         else:  # DESPUES
-            while i < tam:
-                t = lt.get_element(del_dia, i)
-                hhmmss = t["dropoff_datetime"][11:19]
-                if hhmmss > hora_referencia_hms:
-                    lt.add_last(candidatos, t)
-                i += 1
-
-    # Ordenar por dropoff_datetime ↓
-    def cmp_drop_desc(a, b):
-        return a["dropoff_datetime"] > b["dropoff_datetime"]
-
-    candidatos = lt.merge_sort(candidatos, cmp_drop_desc)
-    total = lt.size(candidatos)
+            lo = _primera_posicion(del_dia, hora_referencia_hms, hora_terminacion, False)
+            hi = len(del_dia)
+    total = hi - lo
+
+    # Orden de salida dropoff_datetime ↓: se recorre el tramo desde el final
+    def candidato(i):
+        return get_data(catalog, del_dia[hi - 1 - i])
 
     # Armar salida
     primeros, ultimos = [], []
@@ -500,16 +1366,16 @@ def req_4(catalog, fecha_yyyy_mm_dd, momento_interes, hora_referencia_hms, n_mue
     if total <= 2 * n_muestra:
         i = 0
         while i < total:
-            primeros.append(fila(lt.get_element(candidatos, i)))
+            primeros.append(fila(candidato(i)))
             i += 1
     else:
         i = 0
         while i < n_muestra:
-            primeros.append(fila(lt.get_element(candidatos, i)))
+            primeros.append(fila(candidato(i)))
             i += 1
         i = total - n_muestra
         while i < total:
-            ultimos.append(fila(lt.get_element(candidatos, i)))
+            ultimos.append(fila(candidato(i)))
             i += 1
 
     fin_ms = get_time()
@@ -530,7 +1396,7 @@ def req_5(catalog, term_dt_hour_str, sample_n=5):
     idx = catalog["idx_req5"]
 
     
-    bucket = mp.get(idx, term_dt_hour_str)
+    bucket = mm.get_all(idx, term_dt_hour_str)
     if bucket is None:
         tiempo_ms = round(delta_time(start_clock, get_time()), 3)
         
@@ -546,13 +1412,8 @@ def req_5(catalog, term_dt_hour_str, sample_n=5):
             "last_n": []
         }
 
-    
-    def cmp_dropoff_ts_desc(t1, t2):
-        return t1["dropoff_ts"] > t2["dropoff_ts"]
-
+    # El índice ya guarda cada hora ordenada por dropoff_ts descendente
     size_bucket = lt.size(bucket)
-    if size_bucket > 1:
-        bucket = lt.merge_sort(bucket, cmp_dropoff_ts_desc)
 
     
     if isinstance(sample_n, int):
@@ -568,7 +1429,8 @@ def req_5(catalog, term_dt_hour_str, sample_n=5):
     ultimos  = lt.new_list()
 
     if size_bucket <= 2 * n_val:
-        for t in bucket["elements"]:
+        for i in bucket["elements"]:
+            t = get_data(catalog, i)
             lt.add_last(primeros, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -580,7 +1442,7 @@ def req_5(catalog, term_dt_hour_str, sample_n=5):
         ultimos = primeros
     else:
         for i in range(n_val):
-            t = lt.get_element(bucket, i)
+            t = get_data(catalog, lt.get_element(bucket, i))
             lt.add_last(primeros, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -590,7 +1452,7 @@ def req_5(catalog, term_dt_hour_str, sample_n=5):
                 "total_amount": round(t["total_amount"], 2)
             })
         for i in range(size_bucket - n_val, size_bucket):
-            t = lt.get_element(bucket, i)
+            t = get_data(catalog, lt.get_element(bucket, i))
             lt.add_last(ultimos, {
                 "pickup_datetime": t["pickup_datetime"],
                 "pickup_coords": [t["pickup_latitude"], t["pickup_longitude"]],
@@ -627,19 +1489,6 @@ def req_6(catalog, barrio_buscar, hora_inicio_str, hora_fin_str, n_muestra):
     """
     # TODO: Modificar el requerimiento 6
     
-    # Se define la funcion haversine como pide en el documento
-    def haversine(lat1, lon1, lat2, lon2):
-        R = 6371  # Radio de la Tierra en km
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = math.sin(delta_phi / 2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-
-        return R * c
-
     inicio_ms = get_time()
 
     # Normalizar barrio
@@ -677,43 +1526,13 @@ def req_6(catalog, barrio_buscar, hora_inicio_str, hora_fin_str, n_muestra):
 
     N = parse_n(n_muestra, 5)
 
-    # Construir índice hash por barrio con el indice de los barrios como pide el documento
-    barrios_list = catalog["barrios"]
-    size_barrios = lt.size(barrios_list)
-    idx_barrios = mp.new_map(max(1, size_barrios), 0.5)
-    for i in range(size_barrios):
-        b = lt.get_element(barrios_list, i)
-        nb_key = b["neighborhood"].strip().lower()
-        if mp.get(idx_barrios, nb_key) is None:
-            mp.put(idx_barrios, nb_key, lt.new_list())
+    # Los viajes ya quedaron asignados a su barrio en la carga
+    if catalog["idx_barrios"] is None:
+        asignar_barrios(catalog)
 
-    # Asignar cada viaje al barrio más cercano
-    for i in range(lt.size(catalog["trips"])):
-        t = get_data(catalog, i)
-        plat = t.get("pickup_latitude")
-        plon = t.get("pickup_longitude")
-        if plat is not None and plon is not None:
-            mejor_nb = None
-            mejor_dist = None
-            for j in range(lt.size(barrios_list)):
-                b = lt.get_element(barrios_list, j)
-                lat_b = b["latitude"]
-                lon_b = b["longitude"]
-                if lat_b is not None or lon_b is not None:
-                    d = haversine(plat, plon, lat_b, lon_b)
-                    if mejor_dist is None or d < mejor_dist:
-                        mejor_dist = d
-                        mejor_nb = b["neighborhood"].strip().lower()
-            if mejor_nb is not None:
-                bucket = mp.get(idx_barrios, mejor_nb)
-                if bucket is None:
-                    bucket = lt.new_list()
-                    mp.put(idx_barrios, mejor_nb, bucket)
-                lt.add_last(bucket, t)
-
-    # Obtener bucket del barrio buscado
-    bucket_barrio = mp.get(idx_barrios, barrio_key)
-    if bucket_barrio is None or lt.size(bucket_barrio) == 0:
+    # Obtener los viajes del barrio buscado (ordenados por pickup_ts)
+    bucket_barrio = mp.get(catalog["idx_barrios"], barrio_key)
+    if bucket_barrio is None or len(bucket_barrio) == 0:
         tiempo_ms = round(delta_time(inicio_ms, get_time()), 3)
         return {"tiempo_ms": tiempo_ms, 
         "total": 0, 
@@ -723,36 +1542,24 @@ def req_6(catalog, barrio_buscar, hora_inicio_str, hora_fin_str, n_muestra):
 
     # Filtrar por hora
     candidatos = lt.new_list()
-    tam = lt.size(bucket_barrio)
+    tam = len(bucket_barrio)
+    horas = catalog["trips"]["columns"]["pickup_hour"]
     crosses_midnight = (h_start > h_end)
     i = 0
     while i < tam:
-        trip = lt.get_element(bucket_barrio, i)
-        ph = trip.get("pickup_hour")
-        if ph is None:
-            pd = trip.get("pickup_datetime")
-            if isinstance(pd, str) and len(pd) >= 13:
-                hh = pd[11:13]
-                if hh.isdigit():
-                    ph = int(hh)
-        if ph is not None:
-            if not crosses_midnight:
-                if h_start <= ph and ph <= h_end:
-                    lt.add_last(candidatos, trip)
-            else:
-                if ph >= h_start or ph <= h_end:
-                    lt.add_last(candidatos, trip)
+        fila_viaje = bucket_barrio[i]
+        ph = horas[fila_viaje]
+        if not crosses_midnight:
+            if h_start <= ph and ph <= h_end:
+                lt.add_last(candidatos, fila_viaje)
+        else:
+            if ph >= h_start or ph <= h_end:
+                lt.add_last(candidatos, fila_viaje)
         i += 1
 
+    # El índice del barrio ya está ordenado por pickup_ts ascendente (más antiguo primero)
     total = lt.size(candidatos)
 
-    # Ordenar por pickup_ts ascendente (más antiguo primero)
-    def sort_criteria_req6(a, b):
-        return a["pickup_ts"] < b["pickup_ts"]
-
-    if total > 1:
-        candidatos = lt.merge_sort(candidatos, sort_criteria_req6)
-
     # Preparar salida
     primeros = []
     ultimos = []
@@ -778,17 +1585,17 @@ def req_6(catalog, barrio_buscar, hora_inicio_str, hora_fin_str, n_muestra):
     if total <= 2 * N:
         j = 0
         while j < total:
-            primeros.append(fila(lt.get_element(candidatos, j)))
+            primeros.append(fila(get_data(catalog, lt.get_element(candidatos, j))))
             j += 1
         ultimos = primeros
     else:
         j = 0
         while j < N:
-            primeros.append(fila(lt.get_element(candidatos, j)))
+            primeros.append(fila(get_data(catalog, lt.get_element(candidatos, j))))
             j += 1
         j = total - N
         while j < total:
-            ultimos.append(fila(lt.get_element(candidatos, j)))
+            ultimos.append(fila(get_data(catalog, lt.get_element(candidatos, j))))
             j += 1
 
     tiempo_ms = round(delta_time(inicio_ms, get_time()), 3)
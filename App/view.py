@@ -2,8 +2,8 @@ import sys
 import os
 import App.logic as logic
 from tabulate import tabulate
-default_limit = 1000
-sys.setrecursionlimit(default_limit*10)
+# Procesos usados para interpretar el CSV de viajes en paralelo
+load_workers = os.cpu_count() or 1
 
 def new_logic():
     """
@@ -27,18 +27,70 @@ def load_data(control):
     """
     Carga los datos
     """
-    # Cargar viajes
     taxis_file = "taxis-large.csv"
-    catalog, max_trip, min_trip, primeras5_rows, ultimas5_rows, tiempo_milisegundos_trips, total_registros_trips = logic.load_data(control, taxis_file)
+    barrios_file = "nyc-neighborhoods.csv"
+
+    # Si hay un snapshot vigente de una carga anterior se usa en lugar de los CSV
+    tiempo_snapshot = logic.load_snapshot(control, taxis_file, barrios_file)
+    if tiempo_snapshot is not None:
+        resumen = [
+            ["Archivo", logic.ruta_snapshot(taxis_file)],
+            ["Viajes cargados", logic.lt.size(control["trips"])],
+            ["Barrios cargados", logic.lt.size(control["barrios"])],
+            ["Tiempo de carga (ms)", round(tiempo_snapshot, 3)]
+        ]
+        print("\n=== Resumen de carga desde snapshot ===")
+        print(tabulate(resumen, headers=["Métrica", "Valor"], tablefmt="psql"))
+        max_trip, min_trip, primeras5_rows, ultimas5_rows = logic.resumen_viajes(control)
+        print_resumen_viajes(max_trip, min_trip, primeras5_rows, ultimas5_rows)
+        return
+
+    # Cargar viajes
+    catalog, max_trip, min_trip, primeras5_rows, ultimas5_rows, tiempo_milisegundos_trips, total_registros_trips = logic.load_data(control, taxis_file, workers=load_workers)
+    filas_por_segundo = 0
+    if tiempo_milisegundos_trips > 0:
+        filas_por_segundo = round(total_registros_trips / (tiempo_milisegundos_trips / 1000))
     resumen_trips = [
         ["Archivo", taxis_file],
         ["Registros cargados", total_registros_trips],
-        ["Tiempo de carga (ms)", round(tiempo_milisegundos_trips, 3)]
+        ["Tiempo de carga (ms)", round(tiempo_milisegundos_trips, 3)],
+        ["Filas por segundo", filas_por_segundo]
     ]
 
     print("\n=== Resumen de carga de datos de viajes ===") 
     print(tabulate(resumen_trips, headers=["Métrica", "Valor"], tablefmt="psql"))
-    
+    print_resumen_viajes(max_trip, min_trip, primeras5_rows, ultimas5_rows)
+
+    # Cargar barrios
+    catalog, tiempo_milisegundos, total_registros, cargados = logic.load_neighborhoods(control, barrios_file)
+    resumen = [
+        ["Archivo", barrios_file],
+        ["Registros cargados", total_registros],
+        ["Tiempo de carga (ms)", round(tiempo_milisegundos, 3)]
+    ]
+
+    print("\n=== Resumen de carga de datos de barrios ===")
+    print(tabulate(resumen, headers=["Métrica", "Valor"], tablefmt="psql"))
+
+    if catalog["barrios"]["size"] > 0:
+        print(f"\nBarrios cargados: {cargados}")
+        print(tabulate(catalog["barrios"]["elements"][:5], headers="keys", tablefmt="psql"))
+    else:
+        print("\nNo se cargaron barrios. Revisa delimitador ';' y columnas: borough;neighborhood;latitude;longitude")
+
+    # Asignar a cada viaje su barrio de recogida
+    tiempo_asignacion = logic.asignar_barrios(control)
+    print(f"\nBarrio de recogida asignado a cada trayecto en {round(tiempo_asignacion, 3)} ms")
+
+    # Guardar el snapshot para que la próxima carga no tenga que leer los CSV
+    tiempo_guardado = logic.save_snapshot(control, taxis_file, barrios_file)
+    print(f"Snapshot guardado en {logic.ruta_snapshot(taxis_file)} ({round(tiempo_guardado, 3)} ms)")
+
+
+def print_resumen_viajes(max_trip, min_trip, primeras5_rows, ultimas5_rows):
+    """
+    Imprime los trayectos extremos y los primeros/últimos 5 de la carga
+    """
     print("\n=== Trayecto de menor distancia ===")
     print(tabulate([{
         "pickup_datetime": min_trip["pickup_datetime"],
@@ -59,24 +111,6 @@ def load_data(control):
     print("\n=== Últimos 5 trayectos ===")
     print(tabulate(ultimas5_rows, headers="keys", tablefmt="psql"))
 
-    # Cargar barrios
-    barrios_file = "nyc-neighborhoods.csv"
-    catalog, tiempo_milisegundos, total_registros, cargados = logic.load_neighborhoods(control, barrios_file)
-    resumen = [
-        ["Archivo", barrios_file],
-        ["Registros cargados", total_registros],
-        ["Tiempo de carga (ms)", round(tiempo_milisegundos, 3)]
-    ]
-
-    print("\n=== Resumen de carga de datos de barrios ===")
-    print(tabulate(resumen, headers=["Métrica", "Valor"], tablefmt="psql"))
-
-    if catalog["barrios"]["size"] > 0:
-        print(f"\nBarrios cargados: {cargados}")
-        print(tabulate(catalog["barrios"]["elements"][:5], headers="keys", tablefmt="psql"))
-    else:
-        print("\nNo se cargaron barrios. Revisa delimitador ';' y columnas: borough;neighborhood;latitude;longitude")
-
 
 
 def print_data(control, id):
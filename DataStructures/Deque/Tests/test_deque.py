@@ -0,0 +1,58 @@
+from DataStructures.Deque import deque as dq
+from DataStructures.Utils.utils import handle_not_implemented
+
+def setup_deque():
+    # Inicializa una cola doble vacía para pruebas
+    return dq.new_deque()
+
+@handle_not_implemented
+def test_new_deque():
+    my_deque = setup_deque()
+
+    assert type(my_deque) == dict
+    assert dq.is_empty(my_deque) is True
+    assert dq.size(my_deque) == 0
+    assert dq.first_element(my_deque) is None
+    assert dq.remove_first(my_deque) is None
+    assert dq.remove_last(my_deque) is None
+
+@handle_not_implemented
+def test_both_ends():
+    # Se agrega y se quita por ambos extremos, dando la vuelta al arreglo
+    my_deque = setup_deque()
+    dq.add_last(my_deque, 2)
+    dq.add_first(my_deque, 1)
+    dq.add_last(my_deque, 3)
+    assert list(dq.iterator(my_deque)) == [1, 2, 3]
+    assert dq.first_element(my_deque) == 1
+    assert dq.last_element(my_deque) == 3
+    assert dq.get_element(my_deque, 1) == 2
+
+    assert dq.remove_last(my_deque) == 3
+    assert dq.remove_first(my_deque) == 1
+    assert dq.remove_first(my_deque) == 2
+    assert dq.is_empty(my_deque)
+
+@handle_not_implemented
+def test_grow_and_shrink():
+    my_deque = setup_deque()
+    for i in range(100):
+        if i % 2 == 0:
+            dq.add_last(my_deque, i)
+        else:
+            dq.add_first(my_deque, i)
+    expected = list(range(99, 0, -2)) + list(range(0, 100, 2))
+    assert list(dq.iterator(my_deque)) == expected
+    assert dq.size(my_deque) == 100
+    assert my_deque["capacity"] == 128
+
+    for i in range(95):
+        assert dq.remove_first(my_deque) == expected[i]
+    assert list(dq.iterator(my_deque)) == expected[95:]
+    assert my_deque["capacity"] < 128
+
+    try:
+        dq.get_element(my_deque, 5)
+        assert False
+    except IndexError:
+        pass
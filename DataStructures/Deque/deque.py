@@ -0,0 +1,129 @@
+"""
+  Cola doble (deque) sobre un arreglo circular.
+
+  Los elementos están en una lista de Python de capacidad fija (potencia de
+  2) a partir de la posición "head", dando la vuelta al final. Agregar o
+  quitar en cualquiera de los dos extremos es O(1) amortizado: cuando la
+  lista se llena se duplica, y cuando queda a un cuarto se reduce a la mitad.
+  No se crea ningún nodo por elemento.
+"""
+
+_MIN_CAPACITY = 8
+
+
+def new_deque(capacity=_MIN_CAPACITY):
+    """ Crea una cola doble vacía
+
+        :param capacity: Número de elementos que caben antes de crecer
+        :type capacity: int
+
+        :returns: Cola doble creada
+        :rtype: dict
+    """
+    real_capacity = _MIN_CAPACITY
+    while real_capacity < capacity:
+        real_capacity *= 2
+    return {
+        "elements": [None] * real_capacity,
+        "head": 0,
+        "size": 0,
+        "capacity": real_capacity
+    }
+
+
+def _resize(my_deque, new_capacity):
+    # Copia los elementos en orden al inicio de una lista nueva
+    elements = my_deque["elements"]
+    head = my_deque["head"]
+    mask = my_deque["capacity"] - 1
+    n = my_deque["size"]
+    resized = [elements[(head + i) & mask] for i in range(n)]
+    resized.extend([None] * (new_capacity - n))
+    my_deque["elements"] = resized
+    my_deque["head"] = 0
+    my_deque["capacity"] = new_capacity
+
+
+def _shrink(my_deque):
+    capacity = my_deque["capacity"]
+    if capacity > _MIN_CAPACITY and my_deque["size"] <= capacity // 4:
+        _resize(my_deque, capacity // 2)
+
+
+def add_first(my_deque, element):
+    if my_deque["size"] == my_deque["capacity"]:
+        _resize(my_deque, 2 * my_deque["capacity"])
+    head = (my_deque["head"] - 1) & (my_deque["capacity"] - 1)
+    my_deque["elements"][head] = element
+    my_deque["head"] = head
+    my_deque["size"] += 1
+    return my_deque
+
+
+def add_last(my_deque, element):
+    if my_deque["size"] == my_deque["capacity"]:
+        _resize(my_deque, 2 * my_deque["capacity"])
+    pos = (my_deque["head"] + my_deque["size"]) & (my_deque["capacity"] - 1)
+    my_deque["elements"][pos] = element
+    my_deque["size"] += 1
+    return my_deque
+
+
+def remove_first(my_deque):
+    # Retorna None si está vacía, como las listas encadenadas
+    if my_deque["size"] == 0:
+        return None
+    head = my_deque["head"]
+    element = my_deque["elements"][head]
+    my_deque["elements"][head] = None
+    my_deque["head"] = (head + 1) & (my_deque["capacity"] - 1)
+    my_deque["size"] -= 1
+    _shrink(my_deque)
+    return element
+
+
+def remove_last(my_deque):
+    if my_deque["size"] == 0:
+        return None
+    pos = (my_deque["head"] + my_deque["size"] - 1) & (my_deque["capacity"] - 1)
+    element = my_deque["elements"][pos]
+    my_deque["elements"][pos] = None
+    my_deque["size"] -= 1
+    _shrink(my_deque)
+    return element
+
+
+def first_element(my_deque):
+    if my_deque["size"] == 0:
+        return None
+    return my_deque["elements"][my_deque["head"]]
+
+
+def last_element(my_deque):
+    if my_deque["size"] == 0:
+        return None
+    pos = (my_deque["head"] + my_deque["size"] - 1) & (my_deque["capacity"] - 1)
+    return my_deque["elements"][pos]
+
+
+def get_element(my_deque, pos):
+    # Elemento en la posición pos contando desde el primero
+    if pos < 0 or pos >= my_deque["size"]:
+        raise IndexError("deque index out of range")
+    return my_deque["elements"][(my_deque["head"] + pos) & (my_deque["capacity"] - 1)]
+
+
+def size(my_deque):
+    return my_deque["size"]
+
+
+def is_empty(my_deque):
+    return my_deque["size"] == 0
+
+
+def iterator(my_deque):
+    elements = my_deque["elements"]
+    head = my_deque["head"]
+    mask = my_deque["capacity"] - 1
+    for i in range(my_deque["size"]):
+        yield elements[(head + i) & mask]
@@ -200,3 +200,104 @@ def test_sublist():
 
     assert sub_list is not None
     assert type(sub_list) == dict
+
+
+def trips_for_tests():
+    # Viajes con latitud, longitud, distancia y total; hay empates a propósito
+    lista = setup_tests()
+    for i, (lat, lon, dist, total) in enumerate([
+            (40.75, -73.99, 2.5, 12.0), (40.70, -73.95, 1.0, 8.5),
+            (40.75, -73.98, 2.5, 15.0), (40.80, -73.90, 4.0, 20.0),
+            (40.75, -73.98, 1.0, 8.5), (40.70, -73.99, 2.5, 12.0),
+            (40.62, -73.78, 9.0, 45.0), (40.80, -73.90, 4.0, 20.0)]):
+        lt.add_last(lista, {"id": i, "lat": lat, "lon": lon, "dist": dist, "total": total})
+    return lista
+
+
+def sort_crit_req2(a, b):
+    # Latitud ↓ y luego longitud ↓, como en req_2
+    if a["lat"] != b["lat"]:
+        return a["lat"] > b["lat"]
+    return a["lon"] > b["lon"]
+
+
+def sort_crit_req3(a, b):
+    # Distancia ↓ y luego total ↓, como en req_3
+    if a["dist"] != b["dist"]:
+        return a["dist"] > b["dist"]
+    return a["total"] > b["total"]
+
+
+@handle_not_implemented
+def test_top_k():
+    lista = setup_tests()
+    for e in [5, 3, 9, 1, 7]:
+        lt.add_last(lista, e)
+
+    assert lt.top_k(lista, 3)["elements"] == [1, 3, 5]
+    assert lt.top_k(lista, 10)["elements"] == [1, 3, 5, 7, 9]
+    assert lt.size(lt.top_k(lista, 0)) == 0
+    # La lista original no cambia
+    assert lista["elements"] == [5, 3, 9, 1, 7]
+
+    viajes = trips_for_tests()
+    for crit in (sort_crit_req2, sort_crit_req3):
+        ordenados = lt.merge_sort(viajes, crit)["elements"]
+        for k in range(9):
+            assert lt.top_k(viajes, k, crit)["elements"] == ordenados[:k]
+
+
+@handle_not_implemented
+def test_head_tail():
+    viajes = trips_for_tests()
+    for crit in (sort_crit_req2, sort_crit_req3):
+        # Los empates deben quedar igual que con merge_sort
+        ordenados = lt.merge_sort(viajes, crit)["elements"]
+        for n in range(1, 9):
+            primeros, ultimos, total = lt.head_tail(viajes, n, crit)
+            assert total == 8
+            assert primeros["elements"] == ordenados[:n]
+            assert ultimos["elements"] == ordenados[-n:]
+
+    primeros, ultimos, total = lt.head_tail(setup_tests(), 3)
+    assert total == 0
+    assert lt.size(primeros) == 0
+    assert lt.size(ultimos) == 0
+
+
+@handle_not_implemented
+def test_sort_by():
+    lista = setup_tests()
+    for e in [5, 3, 9, 1, 7]:
+        lt.add_last(lista, e)
+
+    assert lt.sort_by(lista, lambda e: e)["elements"] == [1, 3, 5, 7, 9]
+    assert lt.sort_by(lista, lambda e: e, reverse=True)["elements"] == [9, 7, 5, 3, 1]
+    assert lt.size(lista) == 5
+
+    # Estable: los empates conservan el orden de llegada
+    viajes = trips_for_tests()
+    lt.sort_by(viajes, lambda t: t["dist"])
+    assert [t["id"] for t in viajes["elements"]] == [1, 4, 0, 2, 5, 3, 7, 6]
+
+
+@handle_not_implemented
+def test_sort_by_mixed():
+    viajes = trips_for_tests()
+    # Distancia ↓ y total ↑
+    lt.sort_by(viajes, lambda t: (t["dist"], t["total"]), reverse=(True, False))
+    assert [t["id"] for t in viajes["elements"]] == [6, 3, 7, 0, 5, 2, 1, 4]
+
+    # Campos de texto también pueden ir descendentes
+    lista = setup_tests()
+    for e in [("b", 1), ("a", 2), ("b", 0), ("a", 1)]:
+        lt.add_last(lista, e)
+    lt.sort_by(lista, lambda e: e, reverse=(True, False))
+    assert lista["elements"] == [("b", 0), ("b", 1), ("a", 1), ("a", 2)]
+
+    # Con la llave completa descendente coincide con merge_sort y el criterio de req_3
+    viajes = trips_for_tests()
+    ordenados = lt.merge_sort(viajes, sort_crit_req3)["elements"]
+    lt.sort_by(viajes, lambda t: (t["dist"], t["total"]), reverse=(True, True))
+    assert [t["dist"] for t in viajes["elements"]] == [t["dist"] for t in ordenados]
+    assert [t["total"] for t in viajes["elements"]] == [t["total"] for t in ordenados]
@@ -0,0 +1,119 @@
+from DataStructures.List import doubly_linked_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    lista = lt.new_list()
+    for i in range(1, 6):
+        lt.add_last(lista, i)
+    return lista
+
+
+def check_links(lista):
+    # Recorre la lista en ambos sentidos y verifica que coincidan
+    forward = list(lt.iterator(lista))
+    backward = list(lt.reverse_iterator(lista))
+    assert forward == backward[::-1]
+    assert len(forward) == lt.size(lista)
+    return forward
+
+
+def compare_from_tests(element1, element2):
+    if element1 == element2:
+        return 0
+    elif element1 > element2:
+        return 1
+    return -1
+
+
+@handle_not_implemented
+def test_new_list():
+    lista = lt.new_list()
+
+    assert type(lista) == dict
+    assert lista["first"] is None
+    assert lista["last"] is None
+    assert lt.is_empty(lista)
+
+
+@handle_not_implemented
+def test_add_and_remove_ends():
+    lista = lt.new_list()
+    lt.add_last(lista, 2)
+    lt.add_first(lista, 1)
+    lt.add_last(lista, 3)
+    assert check_links(lista) == [1, 2, 3]
+
+    assert lt.remove_last(lista) == 3
+    assert lt.last_element(lista) == 2
+    assert lt.remove_first(lista) == 1
+    assert lt.first_element(lista) == 2
+    assert lt.remove_last(lista) == 2
+    assert lt.is_empty(lista)
+    assert lista["first"] is None and lista["last"] is None
+    assert lt.remove_first(lista) is None
+    assert lt.remove_last(lista) is None
+
+
+@handle_not_implemented
+def test_positional():
+    lista = setup_tests()
+
+    assert lt.get_element(lista, 0) == 1
+    assert lt.get_element(lista, 3) == 4
+    assert lt.is_present(lista, 4, compare_from_tests) == 3
+    assert lt.is_present(lista, 9, compare_from_tests) == -1
+
+    lt.insert_element(lista, 10, 2)
+    lt.insert_element(lista, 20, lt.size(lista))
+    assert check_links(lista) == [1, 2, 10, 3, 4, 5, 20]
+
+    lt.delete_element(lista, 2)
+    lt.change_info(lista, 0, 0)
+    lt.exchange(lista, 0, 5)
+    assert check_links(lista) == [20, 2, 3, 4, 5, 0]
+    assert check_links(lt.sub_list(lista, 1, 3)) == [2, 3, 4]
+
+    try:
+        lt.get_element(lista, 6)
+        assert False
+    except IndexError:
+        pass
+
+
+@handle_not_implemented
+def test_node_operations():
+    lista = setup_tests()
+
+    third = lt.first_node(lista).next.next
+    new = lt.insert_after(lista, third, 35)
+    lt.insert_before(lista, new, 32)
+    assert check_links(lista) == [1, 2, 3, 32, 35, 4, 5]
+
+    assert lt.remove_node(lista, new) == 35
+    lt.move_to_first(lista, lt.last_node(lista))
+    lt.move_to_last(lista, third)
+    assert check_links(lista) == [5, 1, 2, 32, 4, 3]
+    assert lt.first_element(lista) == 5
+    assert lt.last_element(lista) == 3
+
+    other = lt.new_list()
+    lt.add_last(other, 7)
+    lt.add_last(other, 8)
+    lt.concat(lista, other)
+    assert check_links(lista) == [5, 1, 2, 32, 4, 3, 7, 8]
+    assert lt.is_empty(other)
+
+
+@handle_not_implemented
+def test_sorts():
+    values = [30, 50, 22, 10, 11, 13, 15, 14, 12, 17, 19, 18, 16, 20, 21]
+    for sort in (lt.selection_sort, lt.insertion_sort, lt.shell_sort,
+                 lt.merge_sort, lt.quick_sort):
+        lista = lt.new_list()
+        for value in values:
+            lt.add_last(lista, value)
+        sort(lista)
+        assert check_links(lista) == sorted(values)
+        sort(lista, lambda a, b: a > b)
+        assert check_links(lista) == sorted(values, reverse=True)
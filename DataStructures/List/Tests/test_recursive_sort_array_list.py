@@ -94,3 +94,59 @@ def test_quick_sort():
     assert lt.size(back_up) == 15
 
 
+
+@handle_not_implemented
+def test_merge_sort_order():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    # Retorna una lista nueva y deja la original como estaba
+    original = list(random_lista["elements"])
+    ordenada = lt.merge_sort(random_lista, sort_criteria_increasingly)
+    assert ordenada is not random_lista
+    assert ordenada["elements"] == ordered_list
+    assert lt.size(ordenada) == 15
+    assert random_lista["elements"] == original
+    ordenada = lt.merge_sort(random_lista, sort_criteria_decreasingly)
+    assert ordenada["elements"] == reference_inverted_list
+    ordenada = lt.merge_sort(inverted_list, sort_criteria_increasingly)
+    assert ordenada["elements"] == list(range(1, 16))
+    assert lt.merge_sort(empty_list)["elements"] == []
+    assert lt.merge_sort(one_element_list)["elements"] == one_element_list["elements"]
+
+    # Con un criterio estricto los empates quedan en orden inverso al de llegada
+    pairs = lt.new_list()
+    for i in range(40):
+        lt.add_last(pairs, (i % 3, i))
+    ordenada = lt.merge_sort(pairs, lambda a, b: a[0] < b[0])
+    expected = sorted(((i % 3, i) for i in range(40)), key=lambda p: (p[0], -p[1]))
+    assert ordenada["elements"] == expected
+
+@handle_not_implemented
+def test_quick_sort_order():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.quick_sort(random_lista, sort_criteria_increasingly)
+    assert random_lista["elements"] == ordered_list
+    lt.quick_sort(random_lista, sort_criteria_decreasingly)
+    assert random_lista["elements"] == reference_inverted_list
+    lt.quick_sort(inverted_list, sort_criteria_increasingly)
+    assert inverted_list["elements"] == list(range(1, 16))
+
+    # Muchas llaves repetidas
+    repeated = lt.new_list()
+    for i in range(500):
+        lt.add_last(repeated, (i * 7) % 4)
+    lt.quick_sort(repeated, sort_criteria_increasingly)
+    assert repeated["elements"] == sorted((i * 7) % 4 for i in range(500))
+
+@handle_not_implemented
+def test_sort_large_sorted_input():
+    # Listas grandes ya ordenadas o invertidas no deben agotar la recursión
+    for sort in (lt.merge_sort, lt.quick_sort):
+        big = lt.new_list()
+        for i in range(5000):
+            lt.add_last(big, i)
+        big = sort(big, sort_criteria_increasingly)
+        assert big["elements"] == list(range(5000))
+        big = sort(big, sort_criteria_decreasingly)
+        assert big["elements"] == list(range(4999, -1, -1))
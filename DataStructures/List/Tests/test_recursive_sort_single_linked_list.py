@@ -93,3 +93,43 @@ def test_quick_sort():
     lt.quick_sort(back_up, sort_criteria_decreasingly)
     assert lt.size(back_up) == 15
 
+
+
+def to_python_list(my_list):
+    elements = []
+    node = my_list["first"]
+    while node is not None:
+        elements.append(node["info"])
+        node = node["next"]
+    return elements
+
+@handle_not_implemented
+def test_merge_sort_order():
+    empty_list, one_element_list, random_lista, inverted_list = setup_tests()
+
+    lt.merge_sort(random_lista, sort_criteria_increasingly)
+    assert to_python_list(random_lista) == ordered_list
+    assert lt.last_element(random_lista) == 50
+    lt.merge_sort(random_lista, sort_criteria_decreasingly)
+    assert to_python_list(random_lista) == reference_inverted_list
+    assert lt.last_element(random_lista) == 10
+
+    # Con un criterio estricto los empates quedan en orden inverso de llegada
+    pairs = lt.new_list()
+    for i in range(9):
+        lt.add_last(pairs, (i % 3, i))
+    lt.merge_sort(pairs, lambda a, b: a[0] < b[0])
+    assert to_python_list(pairs) == [(0, 6), (0, 3), (0, 0), (1, 7), (1, 4),
+                                     (1, 1), (2, 8), (2, 5), (2, 2)]
+
+@handle_not_implemented
+def test_merge_sort_large_list():
+    # La mezcla no es recursiva: una lista larga no agota la recursión
+    big = lt.new_list()
+    for i in range(30000):
+        lt.add_last(big, (i * 7919) % 30000)
+    lt.merge_sort(big, sort_criteria_increasingly)
+    assert to_python_list(big) == list(range(30000))
+    assert lt.last_element(big) == 29999
+    lt.add_last(big, 30000)
+    assert lt.size(big) == 30001
@@ -194,3 +194,65 @@ def test_sub_list():
 
     assert sub_list is not None
     assert type(sub_list) == dict
+
+
+@handle_not_implemented
+def test_iterator():
+    lista = setup_tests()
+    assert list(lt.iterator(lista)) == []
+
+    for i in range(5):
+        lt.add_last(lista, i)
+    assert list(lt.iterator(lista)) == [0, 1, 2, 3, 4]
+
+
+@handle_not_implemented
+def test_cursor():
+    lista = setup_tests()
+    for i in range(1, 4):
+        lt.add_last(lista, i)
+
+    cursor = lt.new_cursor(lista)
+    assert lt.cursor_peek(cursor) == 1
+    assert lt.cursor_next(cursor) == 1
+    lt.cursor_set(cursor, 10)
+    assert lt.first_element(lista) == 10
+
+    # Insertar y eliminar después del elemento actual
+    lt.cursor_insert_after(cursor, 15)
+    assert list(lt.iterator(lista)) == [10, 15, 2, 3]
+    assert lt.cursor_remove_next(cursor) == 15
+    assert lt.cursor_get(cursor) == 10
+
+    # Eliminar el último actualiza "last"
+    lt.cursor_next(cursor)
+    assert lt.cursor_remove_next(cursor) == 3
+    assert lt.last_element(lista) == 2
+    assert not lt.cursor_has_next(cursor)
+    lt.cursor_insert_after(cursor, 4)
+    assert lt.last_element(lista) == 4
+    assert lt.size(lista) == 3
+    assert list(lt.iterator(lista)) == [10, 2, 4]
+
+
+@handle_not_implemented
+def test_cursor_limits():
+    lista = setup_tests()
+    cursor = lt.new_cursor(lista)
+
+    assert not lt.cursor_has_next(cursor)
+    assert lt.cursor_peek(cursor) is None
+    for operation in (lt.cursor_next, lt.cursor_get, lt.cursor_remove_next):
+        try:
+            operation(cursor)
+            assert False
+        except IndexError:
+            pass
+
+    # Sin avanzar, insertar y eliminar trabajan sobre el inicio de la lista
+    lt.cursor_insert_after(cursor, 1)
+    lt.cursor_insert_after(cursor, 0)
+    assert list(lt.iterator(lista)) == [0, 1]
+    assert lt.cursor_remove_next(cursor) == 0
+    assert lt.first_element(lista) == 1
+    assert lt.last_element(lista) == 1
@@ -1,3 +1,7 @@
+import heapq
+from functools import cmp_to_key
+
+
 def new_list():
     newlist = {
         "elements": [],
@@ -165,73 +169,238 @@ def shell_sort(my_list, sort_crit=None):
     return my_list
 
 def merge_sort(my_list, sort_crit=None):
+    """
+    Merge sort de abajo hacia arriba y sin recursión. Retorna una lista nueva
+    ordenada y no modifica my_list: se copian los elementos, se ordenan
+    tramos cortos por inserción y luego se mezclan tramos de ancho creciente
+    alternando entre la copia y un único arreglo auxiliar.
+    Al mezclar se toma el de la izquierda si sort_crit(izquierda, derecha);
+    si no, el de la derecha.
+    """
     if sort_crit is None:
         sort_crit = default_sort_criteria
 
     tamaño_lista = my_list["size"]
-    
-    if tamaño_lista <= 1:
-        return my_list
-
-    mid = tamaño_lista // 2
-    left_half = sub_list(my_list, 0, mid)
-    right_half = sub_list(my_list, mid, tamaño_lista - mid)
-
-    left_half = merge_sort(left_half, sort_crit)
-    right_half = merge_sort(right_half, sort_crit)
+    elements = my_list["elements"][:tamaño_lista]
+
+    # Tramos iniciales por inserción. Un elemento pasa delante de uno
+    # anterior si este no va primero según sort_crit, la misma regla de la mezcla
+    for lo in range(0, tamaño_lista, _MERGE_RUN):
+        hi = min(lo + _MERGE_RUN, tamaño_lista)
+        for i in range(lo + 1, hi):
+            key = elements[i]
+            j = i - 1
+            while j >= lo and not sort_crit(elements[j], key):
+                elements[j + 1] = elements[j]
+                j -= 1
+            elements[j + 1] = key
+
+    src = elements
+    dst = [None] * tamaño_lista
+    width = _MERGE_RUN
+    while width < tamaño_lista:
+        for lo in range(0, tamaño_lista, 2 * width):
+            mid = min(lo + width, tamaño_lista)
+            hi = min(lo + 2 * width, tamaño_lista)
+            i = lo
+            j = mid
+            k = lo
+            while i < mid and j < hi:
+                if sort_crit(src[i], src[j]):
+                    dst[k] = src[i]
+                    i += 1
+                else:
+                    dst[k] = src[j]
+                    j += 1
+                k += 1
+            dst[k:k + mid - i] = src[i:mid]
+            k += mid - i
+            dst[k:k + hi - j] = src[j:hi]
+        src, dst = dst, src
+        width *= 2
 
     merged_list = new_list()
-    i = j = 0
-
-    while i < left_half["size"] and j < right_half["size"]:
-        if sort_crit(left_half["elements"][i], right_half["elements"][j]):
-            merged_list = add_last(merged_list, left_half["elements"][i])
-            i += 1
-        else:
-            merged_list = add_last(merged_list, right_half["elements"][j])
-            j += 1
-
-    while i < left_half["size"]:
-        merged_list = add_last(merged_list, left_half["elements"][i])
-        i += 1
+    merged_list["elements"] = src
+    merged_list["size"] = tamaño_lista
+    return merged_list
 
-    while j < right_half["size"]:
-        merged_list = add_last(merged_list, right_half["elements"][j])
-        j += 1
+# Largo de los tramos que merge_sort ordena por inserción antes de mezclar
+_MERGE_RUN = 16
 
-    return merged_list
+# Tramos de quick_sort que se terminan por inserción
+_QUICK_CUTOFF = 16
 
 def quick_sort(my_list, sort_crit=None):
+    """
+    Introsort sin recursión: quick sort con pivote mediana de tres y
+    partición en tres (menores, iguales y mayores que el pivote), inserción
+    para los tramos cortos y heap sort para un tramo que pase la profundidad
+    2*log2(n), lo que evita el caso cuadrático (por ejemplo en listas ya
+    ordenadas). No es estable.
+    """
     if sort_crit is None:
         sort_crit = default_sort_criteria
 
     tamano_lista = size(my_list)
     if tamano_lista <= 1:
         return my_list
-    # Elegimos el último elemento como pivote y lo ponemos en su lugar
-    def partition(low, high):
-        pivot = my_list["elements"][high]
+
+    elements = my_list["elements"]
+    # Pila de tramos pendientes (low, high, profundidad restante)
+    pending = [(0, tamano_lista - 1, 2 * tamano_lista.bit_length())]
+    while pending:
+        low, high, depth = pending.pop()
+        if high - low < _QUICK_CUTOFF:
+            _insertion_range(elements, low, high, sort_crit)
+            continue
+        if depth == 0:
+            _heap_sort_range(elements, low, high, sort_crit)
+            continue
+
+        pivot = _median_of_three(elements, low, (low + high) // 2, high, sort_crit)
+        # elements[low:lt_end] < pivote, [lt_end:i] iguales, [gt_start+1:high+1] mayores
+        lt_end = low
         i = low
-        for j in range(low, high):
-            element = get_element(my_list, j)
-            if sort_crit(element, pivot):
-                exchange(my_list, i, j)
+        gt_start = high
+        while i <= gt_start:
+            element = elements[i]
+            before = sort_crit(element, pivot)
+            after = sort_crit(pivot, element)
+            if before and not after:
+                elements[lt_end], elements[i] = element, elements[lt_end]
+                lt_end += 1
                 i += 1
-        exchange(my_list, i, high)
-        return i
-    
-    # Aca definimos una funcion que se va a llamar recursivamente para hacer el quick_sort
-    # Esto en base a lo que dice la documentacion y para no perder el O(1) en almacenamiento que tiene quick sort
-    # Porque se podria llamar recursivamente la funcion que ya tenemos con sublistas de nuestra lista
-    # Pero ahí perdemos el O(1) en espacial y lo que hace muy util a quick sort
-    def recursiva_quick_sort(low, high):
-        if low < high:
-            pos_pivote = partition(low, high)
-            recursiva_quick_sort(pos_pivote + 1, high)
-            recursiva_quick_sort(low, pos_pivote - 1)
-    
-    low = 0
-    high = tamano_lista - 1
-    recursiva_quick_sort(low, high)
-    
+            elif after and not before:
+                elements[gt_start], elements[i] = element, elements[gt_start]
+                gt_start -= 1
+            else:
+                i += 1
+        pending.append((low, lt_end - 1, depth - 1))
+        pending.append((gt_start + 1, high, depth - 1))
+
+    return my_list
+
+def _median_of_three(elements, a, b, c, sort_crit):
+    x, y, z = elements[a], elements[b], elements[c]
+    if sort_crit(y, x):
+        x, y = y, x
+    if sort_crit(z, y):
+        y = z
+        if sort_crit(y, x):
+            y = x
+    return y
+
+def _insertion_range(elements, low, high, sort_crit):
+    for i in range(low + 1, high + 1):
+        key = elements[i]
+        j = i - 1
+        while j >= low and sort_crit(key, elements[j]):
+            elements[j + 1] = elements[j]
+            j -= 1
+        elements[j + 1] = key
+
+def _heap_sort_range(elements, low, high, sort_crit):
+    n = high - low + 1
+
+    def sift_down(root, end):
+        while True:
+            child = 2 * root + 1
+            if child >= end:
+                return
+            if child + 1 < end and sort_crit(elements[low + child], elements[low + child + 1]):
+                child += 1
+            if not sort_crit(elements[low + root], elements[low + child]):
+                return
+            elements[low + root], elements[low + child] = elements[low + child], elements[low + root]
+            root = child
+
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(root, n)
+    for end in range(n - 1, 0, -1):
+        elements[low], elements[low + end] = elements[low + end], elements[low]
+        sift_down(0, end)
+
+def sort_by(my_list, key_fn, reverse=False):
+    """
+    Ordena la lista en su lugar por key_fn(elemento), que se calcula una sola
+    vez por elemento. El orden es estable: los empates quedan en el orden en
+    que estaban.
+
+    reverse puede ser un bool para toda la llave o, si key_fn retorna una
+    tupla, una tupla de bools con el sentido de cada campo, por ejemplo
+    (True, False) para el primer campo descendente y el segundo ascendente.
+    """
+    elements = my_list["elements"]
+    if isinstance(reverse, bool):
+        elements.sort(key=key_fn, reverse=reverse)
+        return my_list
+
+    keys = [key_fn(e) for e in elements]
+    order = list(range(len(elements)))
+    # Un ordenamiento estable por campo, del último al primero
+    for field in range(len(reverse) - 1, -1, -1):
+        order.sort(key=lambda p: keys[p][field], reverse=reverse[field])
+    elements[:] = [elements[p] for p in order]
     return my_list
+
+def _merge_sort_cmp(elements, sort_crit):
+    # Orden total sobre posiciones que reproduce el de merge_sort: entre una
+    # posición anterior p y una posterior q va primero p si sort_crit(p, q);
+    # si no (incluidos los empates con un criterio estricto) va primero q.
+    # Vale mientras sort_crit sea un orden consistente, como < o <=.
+    def cmp(p, q):
+        if p < q:
+            return -1 if sort_crit(elements[p], elements[q]) else 1
+        return 1 if sort_crit(elements[q], elements[p]) else -1
+    return cmp
+
+def _from_positions(my_list, positions):
+    result = new_list()
+    for pos in positions:
+        add_last(result, my_list["elements"][pos])
+    return result
+
+def top_k(my_list, k, sort_crit=None):
+    """
+    Retorna una lista nueva con los k primeros elementos en el orden en que
+    los dejaría merge_sort(my_list, sort_crit), empates incluidos, sin ordenar
+    toda la lista: O(n log k).
+    """
+    if sort_crit is None:
+        sort_crit = default_sort_criteria
+    key = cmp_to_key(_merge_sort_cmp(my_list["elements"], sort_crit))
+    return _from_positions(my_list, heapq.nsmallest(max(0, k), range(size(my_list)), key=key))
+
+def head_tail(my_list, n, sort_crit=None):
+    """
+    Retorna (primeros, ultimos, total): los n primeros y los n últimos
+    elementos en el orden de merge_sort(my_list, sort_crit), cada grupo en
+    ese orden, y el tamaño de la lista. Se hace en una sola pasada con dos
+    montículos de tamaño n: O(total log n). Si total <= n los dos grupos
+    son la lista completa ordenada.
+    """
+    if sort_crit is None:
+        sort_crit = default_sort_criteria
+    total = size(my_list)
+    cmp = _merge_sort_cmp(my_list["elements"], sort_crit)
+    normal = cmp_to_key(cmp)
+    inverse = cmp_to_key(lambda p, q: cmp(q, p))
+
+    # first: los n menores, con el mayor de ellos en la raíz
+    # last: los n mayores, con el menor de ellos en la raíz
+    first = []
+    last = []
+    if n > 0:
+        for pos in range(total):
+            if len(first) < n:
+                heapq.heappush(first, inverse(pos))
+            elif cmp(pos, first[0].obj) < 0:
+                heapq.heapreplace(first, inverse(pos))
+            if len(last) < n:
+                heapq.heappush(last, normal(pos))
+            elif cmp(pos, last[0].obj) > 0:
+                heapq.heapreplace(last, normal(pos))
+
+    head = sorted((k.obj for k in first), key=normal)
+    tail = sorted((k.obj for k in last), key=normal)
+    return _from_positions(my_list, head), _from_positions(my_list, tail), total
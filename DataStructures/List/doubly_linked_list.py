@@ -0,0 +1,300 @@
+"""
+  Lista doblemente encadenada.
+
+  La lista es un diccionario con "first", "last" y "size", como
+  single_linked_list, pero cada nodo (list_node.DoubleNode) conoce también
+  a su anterior. Así agregar o quitar en cualquiera de los dos extremos es
+  O(1), y un nodo que ya se tiene (first_node, last_node, insert_after...)
+  se puede sacar o mover sin recorrer la lista.
+"""
+
+import DataStructures.List.list_node as ln
+import DataStructures.List.array_list as al
+
+
+def new_list():
+    newlist = {
+        "first": None,
+        "last": None,
+        "size": 0,
+    }
+    return newlist
+
+
+def _node_at(my_list, pos):
+    # Recorre desde el extremo más cercano a pos
+    if pos < 0 or pos >= my_list["size"]:
+        raise IndexError("list index out of range")
+    if pos < my_list["size"] // 2:
+        node = my_list["first"]
+        for _ in range(pos):
+            node = node.next
+    else:
+        node = my_list["last"]
+        for _ in range(my_list["size"] - 1 - pos):
+            node = node.prev
+    return node
+
+
+def get_element(my_list, pos):
+    return _node_at(my_list, pos).info
+
+
+def is_present(my_list, element, cmp_function):
+    count = 0
+    node = my_list["first"]
+    while node is not None:
+        if cmp_function(element, node.info) == 0:
+            return count
+        node = node.next
+        count += 1
+    return -1
+
+
+def add_first(my_list, element):
+    node = ln.new_double_node(element)
+    _link_before(my_list, my_list["first"], node)
+    return my_list
+
+
+def add_last(my_list, element):
+    node = ln.new_double_node(element)
+    _link_after(my_list, my_list["last"], node)
+    return my_list
+
+
+def size(my_list):
+    return my_list["size"]
+
+
+def is_empty(my_list):
+    return my_list["size"] == 0
+
+
+def first_element(my_list):
+    if my_list["first"] is not None:
+        return my_list["first"].info
+    return None
+
+
+def last_element(my_list):
+    if my_list["last"] is not None:
+        return my_list["last"].info
+    return None
+
+
+def remove_first(my_list):
+    if my_list["first"] is None:
+        return None
+    return remove_node(my_list, my_list["first"])
+
+
+def remove_last(my_list):
+    if my_list["last"] is None:
+        return None
+    return remove_node(my_list, my_list["last"])
+
+
+def insert_element(my_list, element, pos):
+    if pos == my_list["size"]:
+        return add_last(my_list, element)
+    insert_before(my_list, _node_at(my_list, pos), element)
+    return my_list
+
+
+def delete_element(my_list, pos):
+    remove_node(my_list, _node_at(my_list, pos))
+    return my_list
+
+
+def change_info(my_list, pos, new_element):
+    _node_at(my_list, pos).info = new_element
+    return my_list
+
+
+def exchange(my_list, pos1, pos2):
+    node1 = _node_at(my_list, pos1)
+    node2 = _node_at(my_list, pos2)
+    node1.info, node2.info = node2.info, node1.info
+    return my_list
+
+
+def sub_list(my_list, pos, num_elements):
+    if pos < 0 or pos >= my_list["size"] or num_elements < 0 or (pos + num_elements) > my_list["size"]:
+        raise IndexError("list index out of range")
+
+    new_list_structure = new_list()
+    node = _node_at(my_list, pos)
+    for _ in range(num_elements):
+        add_last(new_list_structure, node.info)
+        node = node.next
+    return new_list_structure
+
+
+def iterator(my_list):
+    # Elementos del primero al último
+    node = my_list["first"]
+    while node is not None:
+        yield node.info
+        node = node.next
+
+
+def reverse_iterator(my_list):
+    # Elementos del último al primero
+    node = my_list["last"]
+    while node is not None:
+        yield node.info
+        node = node.prev
+
+
+# Operaciones sobre nodos. Los nodos que retornan estas funciones siguen
+# siendo válidos mientras estén en la lista; sus campos info, next y prev se
+# pueden leer directamente, pero los enlaces solo se cambian con estas
+# funciones.
+
+def first_node(my_list):
+    return my_list["first"]
+
+
+def last_node(my_list):
+    return my_list["last"]
+
+
+def _link_after(my_list, prev, node):
+    # Enlaza node después de prev (al inicio si prev es None)
+    if prev is None:
+        following = my_list["first"]
+        my_list["first"] = node
+    else:
+        following = prev.next
+        prev.next = node
+    node.prev = prev
+    node.next = following
+    if following is None:
+        my_list["last"] = node
+    else:
+        following.prev = node
+    my_list["size"] += 1
+    return node
+
+
+def _link_before(my_list, following, node):
+    # Enlaza node antes de following (al final si following es None)
+    if following is None:
+        return _link_after(my_list, my_list["last"], node)
+    return _link_after(my_list, following.prev, node)
+
+
+def _unlink(my_list, node):
+    if node.prev is None:
+        my_list["first"] = node.next
+    else:
+        node.prev.next = node.next
+    if node.next is None:
+        my_list["last"] = node.prev
+    else:
+        node.next.prev = node.prev
+    node.prev = None
+    node.next = None
+    my_list["size"] -= 1
+
+
+def insert_after(my_list, node, element):
+    """ Inserta element después de node y retorna el nodo nuevo
+    """
+    return _link_after(my_list, node, ln.new_double_node(element))
+
+
+def insert_before(my_list, node, element):
+    """ Inserta element antes de node y retorna el nodo nuevo
+    """
+    return _link_before(my_list, node, ln.new_double_node(element))
+
+
+def remove_node(my_list, node):
+    """ Saca node de la lista en O(1) y retorna su elemento
+    """
+    _unlink(my_list, node)
+    return node.info
+
+
+def move_to_first(my_list, node):
+    """ Mueve node, que ya está en la lista, al inicio sin crear nodos
+    """
+    if my_list["first"] is not node:
+        _unlink(my_list, node)
+        _link_after(my_list, None, node)
+    return my_list
+
+
+def move_to_last(my_list, node):
+    if my_list["last"] is not node:
+        _unlink(my_list, node)
+        _link_after(my_list, my_list["last"], node)
+    return my_list
+
+
+def concat(my_list, other):
+    """ Pasa todos los nodos de other al final de my_list en O(1). other
+        queda vacía.
+    """
+    if other["first"] is None:
+        return my_list
+    if my_list["last"] is None:
+        my_list["first"] = other["first"]
+    else:
+        my_list["last"].next = other["first"]
+        other["first"].prev = my_list["last"]
+    my_list["last"] = other["last"]
+    my_list["size"] += other["size"]
+    other["first"] = None
+    other["last"] = None
+    other["size"] = 0
+    return my_list
+
+
+# Ordenamientos: los elementos se copian a un array_list, se ordenan con el
+# algoritmo del mismo nombre (mismo criterio y mismo orden de empates) y se
+# escriben de vuelta en los nodos, que no cambian.
+
+def default_sort_criteria(element_1, element_2):
+    is_sorted = False
+    if element_1 < element_2:
+        is_sorted = True
+    return is_sorted
+
+
+def _sort_with(my_list, sort_function, sort_crit):
+    if sort_crit is None:
+        sort_crit = default_sort_criteria
+    if my_list["size"] <= 1:
+        return my_list
+    elements = al.new_list()
+    elements["elements"] = list(iterator(my_list))
+    elements["size"] = my_list["size"]
+    elements = sort_function(elements, sort_crit)
+    node = my_list["first"]
+    for element in elements["elements"]:
+        node.info = element
+        node = node.next
+    return my_list
+
+
+def selection_sort(my_list, sort_crit=None):
+    return _sort_with(my_list, al.selection_sort, sort_crit)
+
+
+def insertion_sort(my_list, sort_crit=None):
+    return _sort_with(my_list, al.insertion_sort, sort_crit)
+
+
+def shell_sort(my_list, sort_crit=None):
+    return _sort_with(my_list, al.shell_sort, sort_crit)
+
+
+def merge_sort(my_list, sort_crit=None):
+    return _sort_with(my_list, al.merge_sort, sort_crit)
+
+
+def quick_sort(my_list, sort_crit=None):
+    return _sort_with(my_list, al.quick_sort, sort_crit)
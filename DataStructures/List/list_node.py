@@ -28,11 +28,26 @@ def get_element(node):
     return node['info']
 
 
+class DoubleNode:
+    """ Nodo de una lista doblemente encadenada. Con __slots__ cada nodo
+        guarda sus tres campos sin un diccionario propio, así que ocupa
+        mucho menos memoria que un nodo dict.
+    """
+    __slots__ = ("info", "next", "prev")
+
+    def __init__(self, element, next=None, prev=None):
+        self.info = element
+        self.next = next
+        self.prev = prev
+
+
 def new_double_node(element):
     """ Estructura que contiene la información a guardar en un nodo de una lista doblemente encadenada
+
+        :param element: Elemento a guardar en el nodo
+        :type element: any
+
+        :returns: Nodo creado, con los campos info, next y prev
+        :rtype: DoubleNode
     """
-    node = {'info': element,
-            'next': None,
-            'prev': None
-            }
-    return node
+    return DoubleNode(element)
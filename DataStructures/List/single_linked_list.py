@@ -8,6 +8,8 @@ def new_list():
 
 
 def get_element(my_list, pos):
+    if pos == my_list["size"] - 1:
+        return my_list["last"]["info"]
     searchpos = 0
     node = my_list["first"]
     while searchpos < pos:
@@ -153,6 +155,9 @@ def insert_element(my_list, element, pos):
     
 
 def change_info(my_list, pos, new_element):
+    if pos == my_list["size"] - 1:
+        my_list["last"]["info"] = new_element
+        return my_list
     current = my_list["first"]
     for _ in range(pos):
         current = current["next"]
@@ -201,6 +206,115 @@ def delete_element(my_list, pos):
         my_list["size"] -= 1
     return my_list
 
+def iterator(my_list):
+    """
+    Recorre los elementos de la lista en orden, del primero al último. Es la
+    forma de recorrer la lista completa: get_element(i) empieza desde el
+    primer nodo cada vez, así que un ciclo sobre las posiciones es cuadrático.
+    """
+    node = my_list["first"]
+    while node is not None:
+        yield node["info"]
+        node = node["next"]
+
+# Cursor: posición dentro de la lista que avanza nodo por nodo. Empieza antes
+# del primer elemento ("node" es None) y cursor_next lo mueve al siguiente.
+# Las operaciones sobre el nodo actual o el siguiente son O(1) y mantienen
+# "first", "last" y "size" de la lista.
+
+def new_cursor(my_list):
+    return {
+        "list": my_list,
+        "node": None
+    }
+
+def _following(cursor):
+    # Nodo siguiente al actual (el primero si el cursor está al inicio)
+    if cursor["node"] is None:
+        return cursor["list"]["first"]
+    return cursor["node"]["next"]
+
+def cursor_has_next(cursor):
+    return _following(cursor) is not None
+
+def cursor_next(cursor):
+    """
+    Avanza al siguiente elemento y lo retorna. Lanza IndexError si el cursor
+    ya está en el último.
+    """
+    node = _following(cursor)
+    if node is None:
+        raise IndexError("list index out of range")
+    cursor["node"] = node
+    return node["info"]
+
+def cursor_peek(cursor):
+    """
+    Retorna el siguiente elemento sin avanzar, o None si no hay.
+    """
+    node = _following(cursor)
+    if node is None:
+        return None
+    return node["info"]
+
+def cursor_get(cursor):
+    if cursor["node"] is None:
+        raise IndexError("list index out of range")
+    return cursor["node"]["info"]
+
+def cursor_set(cursor, element):
+    # Cambia el elemento actual
+    if cursor["node"] is None:
+        raise IndexError("list index out of range")
+    cursor["node"]["info"] = element
+    return cursor
+
+def cursor_insert_after(cursor, element):
+    """
+    Inserta element después del elemento actual (al inicio de la lista si el
+    cursor no ha avanzado). El cursor no se mueve.
+    """
+    my_list = cursor["list"]
+    current = cursor["node"]
+    if current is None:
+        return add_first(my_list, element)
+    new_node = {
+        "info": element,
+        "next": current["next"]
+    }
+    current["next"] = new_node
+    if my_list["last"] is current:
+        my_list["last"] = new_node
+    my_list["size"] += 1
+    return my_list
+
+def cursor_remove_next(cursor):
+    """
+    Elimina el elemento siguiente al actual y lo retorna. Lanza IndexError
+    si no hay siguiente.
+    """
+    my_list = cursor["list"]
+    current = cursor["node"]
+    if current is None:
+        if my_list["first"] is None:
+            raise IndexError("list index out of range")
+        return remove_first(my_list)
+    removed = current["next"]
+    if removed is None:
+        raise IndexError("list index out of range")
+    current["next"] = removed["next"]
+    if my_list["last"] is removed:
+        my_list["last"] = current
+    my_list["size"] -= 1
+    return removed["info"]
+
+def cursor_copy(cursor):
+    # Otro cursor en la misma posición, que avanza por separado
+    return {
+        "list": cursor["list"],
+        "node": cursor["node"]
+    }
+
 def default_sort_criteria(element_1, element_2):
     is_sorted = False
     if element_1 < element_2:
@@ -211,39 +325,25 @@ def insertion_sort(my_list, sort_crit=None):
     if sort_crit is None:
         sort_crit = default_sort_criteria
 
-    if my_list["size"] <= 1 or my_list["first"] is None:
+    if my_list["size"] <= 1:
         return my_list
 
-    prev_i = my_list["first"]
-    i = prev_i["next"]
-    last_node = prev_i
-
-    while i is not None:
-        key = i
-        if not sort_crit(key["info"], prev_i["info"]):
-            last_node = i
-            prev_i = i
-            i = i["next"]
+    # Un cursor recorre la lista una vez. Un elemento que va antes que el
+    # anterior se saca y otro cursor lo reinserta antes del primero que
+    # debe seguirlo; la búsqueda termina a más tardar en el anterior
+    cursor = new_cursor(my_list)
+    previous = cursor_next(cursor)
+    while cursor_has_next(cursor):
+        element = cursor_peek(cursor)
+        if not sort_crit(element, previous):
+            previous = cursor_next(cursor)
             continue
+        cursor_remove_next(cursor)
+        search = new_cursor(my_list)
+        while not sort_crit(element, cursor_peek(search)):
+            cursor_next(search)
+        cursor_insert_after(search, element)
 
-        prev_i["next"] = key["next"]
-
-        if sort_crit(key["info"], my_list["first"]["info"]):
-            key["next"] = my_list["first"]
-            my_list["first"] = key
-        else:
-            search = my_list["first"]
-            while (search["next"] is not None and not sort_crit(key["info"], search["next"]["info"])):
-                search = search["next"]
-
-            key["next"] = search["next"]
-            search["next"] = key
-
-        i = prev_i["next"]
-        if prev_i["next"] is None:
-            last_node = prev_i
-
-    my_list["last"] = last_node
     return my_list
 
 def selection_sort(my_list, sort_crit=None):
@@ -253,22 +353,21 @@ def selection_sort(my_list, sort_crit=None):
     if my_list["size"] <= 1:
         return my_list
 
-    first = my_list["first"]
-    while first is not None:
-        min_node = first
-        actual = first["next"]
-        while actual is not None:
-            if sort_crit(actual["info"], min_node["info"]):
-                min_node = actual
-            actual = actual["next"]
-
-        if min_node is not first:
-            first["info"], min_node["info"] = min_node["info"], first["info"]
-
-        tail = first
-        first = first["next"]
-
-    my_list["last"] = tail
+    # En cada pasada un cursor busca el menor desde la posición actual y se
+    # intercambia con ella
+    cursor = new_cursor(my_list)
+    while cursor_has_next(cursor):
+        current = cursor_next(cursor)
+        smallest = current
+        minimum = cursor_copy(cursor)
+        scan = cursor_copy(cursor)
+        while cursor_has_next(scan):
+            element = cursor_next(scan)
+            if sort_crit(element, smallest):
+                smallest = element
+                minimum = cursor_copy(scan)
+        cursor_set(minimum, current)
+        cursor_set(cursor, smallest)
 
     return my_list
 
@@ -280,19 +379,26 @@ def shell_sort(my_list, sort_crit=None):
     
     if tamaño_lista <= 1:
         return my_list
-    
+
+    # Los saltos de gap posiciones se hacen sobre una copia indexable de los
+    # elementos; al final se escriben de vuelta en una sola pasada
+    elements = list(iterator(my_list))
     gap = tamaño_lista // 2
 
     while gap > 0:
         for i in range(gap, tamaño_lista):
-            temp = get_element(my_list, i)
+            temp = elements[i]
             j = i
-            while j >= gap and sort_crit(temp, get_element(my_list, j - gap)):
-                change_info(my_list, j, get_element(my_list, j - gap))
+            while j >= gap and sort_crit(temp, elements[j - gap]):
+                elements[j] = elements[j - gap]
                 j -= gap
-            change_info(my_list, j, temp)
+            elements[j] = temp
         gap //= 2
 
+    cursor = new_cursor(my_list)
+    for element in elements:
+        cursor_next(cursor)
+        cursor_set(cursor, element)
     return my_list
 
 def merge_sort(my_list, sort_crit=None):
@@ -302,141 +408,121 @@ def merge_sort(my_list, sort_crit=None):
     if my_list["size"] <= 1 or my_list["first"] is None:
         return my_list
 
-    def split_list(source):
-        if source is None or source["next"] is None:
-            return source, None
-        slow = source
-        fast = source["next"]
-        while fast is not None:
-            fast = fast["next"]
-            if fast is not None:
-                slow = slow["next"]
-                fast = fast["next"]
-        middle = slow["next"]
-        slow["next"] = None
-        return source, middle
-
-    def merge_lists(left, right):
-        if left is None:
-            return right
-        if right is None:
-            return left
-        if sort_crit(left["info"], right["info"]):
-            result = left
-            result["next"] = merge_lists(left["next"], right)
-        else:
-            result = right
-            result["next"] = merge_lists(left, right["next"])
-        return result
-
-    def merge_sort_rec(node):
-        if node is None or node["next"] is None:
-            return node
-        left, right = split_list(node)
-        left = merge_sort_rec(left)
-        right = merge_sort_rec(right)
-        return merge_lists(left, right)
-
-    my_list["first"] = merge_sort_rec(my_list["first"])
-
-    current = my_list["first"]
-    while current and current["next"] is not None:
-        current = current["next"]
-    my_list["last"] = current
+    # Ordenamiento por mezcla de abajo hacia arriba: en cada pasada se mezclan
+    # pares de tramos consecutivos de largo width, reenlazando los nodos sin
+    # recursión ni memoria adicional. Entre elementos equivalentes se toma
+    # primero el de la izquierda si sort_crit(izquierdo, derecho), igual que
+    # la versión recursiva.
+    head = my_list["first"]
+    width = 1
+    while True:
+        left = head
+        head = None
+        tail = None
+        merges = 0
+        while left is not None:
+            merges += 1
+            right = left
+            left_size = 0
+            while left_size < width and right is not None:
+                right = right["next"]
+                left_size += 1
+            right_size = width
+
+            while left_size > 0 and right_size > 0 and right is not None:
+                if sort_crit(left["info"], right["info"]):
+                    node = left
+                    left = left["next"]
+                    left_size -= 1
+                else:
+                    node = right
+                    right = right["next"]
+                    right_size -= 1
+                if tail is None:
+                    head = node
+                else:
+                    tail["next"] = node
+                tail = node
 
+            # Lo que sobra de uno de los dos tramos ya está en orden
+            if left_size > 0:
+                rest, rest_size = left, left_size
+            else:
+                rest, rest_size = right, right_size
+            while rest_size > 0 and rest is not None:
+                if tail is None:
+                    head = rest
+                else:
+                    tail["next"] = rest
+                tail = rest
+                rest = rest["next"]
+                rest_size -= 1
+            # El siguiente par empieza donde terminó el tramo derecho
+            left = right if left_size > 0 else rest
+        tail["next"] = None
+        if merges <= 1:
+            break
+        width *= 2
+
+    my_list["first"] = head
+    my_list["last"] = tail
     return my_list
 
 def quick_sort(my_list, sort_crit=None):
     if sort_crit is None:
         sort_crit = default_sort_criteria
-    
-    
 
     tamano_lista = size(my_list)
     if tamano_lista <= 1:
         return my_list
-    # Aquí ordenamos sin intercambiar elementos, sino que dejamos todos los elementos que 
-    # Son mayores que el pivote por detrás y los que son menores los dejamos por delante
-    # Asi no hacemos intercambios dentro de la lista y nos ahorramos complejidad temporal
-    # Tomamos como pivote el primer elemento
-    def partition(head, end):
-        pivot = end
-        prev = None
-        current = head
-        tail = pivot
-
-        new_head = None
-        new_end = tail
+    # Aquí ordenamos sin intercambiar elementos: el pivote es el último nodo
+    # del tramo, los nodos que van antes que él quedan en un tramo a su
+    # izquierda y el resto en uno a su derecha, ambos en el orden en que
+    # estaban. En vez de recursión se usa una pila de tramos pendientes
+    # (primero, último); un tramo de un solo nodo ya está en su lugar y se
+    # pega al final del resultado.
+    head = None
+    tail = None
+    pending = [(my_list["first"], my_list["last"])]
+    while pending:
+        first, last = pending.pop()
+        if first is last:
+            if tail is None:
+                head = first
+            else:
+                tail["next"] = first
+            tail = first
+            continue
 
+        pivot = last
+        left_first = left_last = None
+        right_first = right_last = None
+        current = first
         while current is not pivot:
             if sort_crit(current["info"], pivot["info"]):
-                # Va al lado izquierdo 
-                if new_head is None:
-                    new_head = current
-                prev = current
-                current = current["next"]
+                if left_last is None:
+                    left_first = current
+                else:
+                    left_last["next"] = current
+                left_last = current
             else:
-                # Mover current detrás de tail
-                next = current["next"]
-                if prev is not None:
-                    prev["next"] = next
+                if right_last is None:
+                    right_first = current
                 else:
-                    # avanzó la cabeza
-                    head = next
-                current["next"] = None
-                tail["next"] = current
-                tail = current
-                current = next
-
-        if new_head is None:
-            # todos fueron mayores que el pivot, este es la nueva cabeza
-            new_head = pivot
-
-        new_end = tail
-        return (new_head, new_end, pivot)
-    
-    def quick_sort_rec(head, end):
-        if head is None or head is end:
-            return head, end
-
-        new_head, new_end, pivot = partition(head, end)
-
-        # Ordenar lado izquierdo si existe algo antes del pivote
-        if new_head is not pivot:
-            # cortar antes del pivote para la recursión izquierda
-            temp = new_head
-            while temp["next"] is not pivot:
-                temp = temp["next"]
-            left_end = temp
-
-            left_head, left_end = quick_sort_rec(new_head, left_end)
-            # conectar cola izquierda con el pivote
-            left_end["next"] = pivot
-            new_head = left_head
-
-        # Ordenar lado derecho (después del pivote)
-        if pivot is not new_end:
-            right_head, right_end = quick_sort_rec(pivot["next"], new_end)
-            pivot["next"] = right_head
-            new_end = right_end
-        else:
-            new_end = pivot
-
-        return new_head, new_end
-
-    # Ejecutar quicksort sobre toda la lista
-    head = my_list["first"]
-    tail = head
-    while tail["next"] is not None:
-        tail = tail["next"]
-
-    new_head, new_end = quick_sort_rec(head, tail)
-
-    my_list["first"] = new_head
-    my_list["last"] = new_end
-
-    if new_end is not None:
-        new_end["next"] = None
+                    right_last["next"] = current
+                right_last = current
+            current = current["next"]
 
+        # Se apila en orden inverso: primero sale la izquierda
+        if right_first is not None:
+            right_last["next"] = None
+            pending.append((right_first, right_last))
+        pending.append((pivot, pivot))
+        if left_first is not None:
+            left_last["next"] = None
+            pending.append((left_first, left_last))
+
+    tail["next"] = None
+    my_list["first"] = head
+    my_list["last"] = tail
     return my_list
-    
\ No newline at end of file
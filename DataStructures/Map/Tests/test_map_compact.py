@@ -0,0 +1,189 @@
+from DataStructures.Map import map_compact as mp
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_colliding_map():
+    # Con scale 1 y shift 0 las llaves enteras k y k + 11 chocan
+    map = mp.new_map(5, 0.5, 7)
+    map["scale"] = 1
+    map["shift"] = 0
+    map["prime"] = 109345121
+    return map
+
+
+@handle_not_implemented
+def test_new_map():
+    map = mp.new_map(5, 0.5, 7)
+    assert map["prime"] == 7
+    assert map["capacity"] == 11
+    assert map["scale"] >= 1 and map["scale"] < 7
+    assert map["shift"] >= 0 and map["shift"] < 7
+    assert map["keys"] == [None] * 11
+    assert map["values"] == [None] * 11
+    assert map["hashes"] == [None] * 11
+    assert map["current_factor"] == 0
+    assert map["limit_factor"] == 0.5
+    assert map["size"] == 0
+
+
+@handle_not_implemented
+def test_put():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "A"
+
+    mp.put(map, 1, "B")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "B"
+
+
+@handle_not_implemented
+def test_contains():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert mp.contains(map, 1)
+    assert not mp.contains(map, 2)
+
+
+@handle_not_implemented
+def test_get():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert mp.get(map, 1) == "A"
+    assert mp.get(map, 2) is None
+
+
+@handle_not_implemented
+def test_remove():
+    map = setup_colliding_map()
+    mp.put(map, 0, "A")
+    mp.put(map, 11, "B")
+
+    assert mp.remove(map, 0)
+    assert not mp.remove(map, 0)
+    assert mp.get(map, 0) is None
+    assert mp.get(map, 11) == "B"
+    assert map["size"] == 1
+    assert map["deleted"] == 1
+
+    # La casilla borrada se reutiliza
+    mp.put(map, 0, "C")
+    assert map["keys"][0] == 0
+    assert map["deleted"] == 0
+
+
+@handle_not_implemented
+def test_size():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.size(map) == 0
+    mp.put(map, 1, "A")
+    assert mp.size(map) == 1
+
+
+@handle_not_implemented
+def test_is_empty():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.is_empty(map)
+    mp.put(map, 1, "A")
+    assert not mp.is_empty(map)
+
+
+@handle_not_implemented
+def test_key_set():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    mp.put(map, 2, "B")
+    mp.put(map, 3, "C")
+
+    key_set = mp.key_set(map)
+    assert lt.size(key_set) == 3
+    assert {1, 2, 3} == set(key_set["elements"])
+
+    mp.remove(map, 1)
+    key_set = mp.key_set(map)
+    assert lt.size(key_set) == 2
+    assert 1 not in key_set["elements"]
+
+
+@handle_not_implemented
+def test_value_set():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "X")
+    mp.put(map, 2, "Y")
+    mp.put(map, 3, "Z")
+
+    value_set = mp.value_set(map)
+    assert lt.size(value_set) == 3
+    assert {"X", "Y", "Z"} == set(value_set["elements"])
+
+    mp.remove(map, 1)
+    value_set = mp.value_set(map)
+    assert lt.size(value_set) == 2
+    assert "X" not in value_set["elements"]
+
+
+@handle_not_implemented
+def test_rehash():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(100):
+        mp.put(map, i, str(i))
+
+    assert map["capacity"] > 11
+    assert map["current_factor"] <= map["limit_factor"]
+    assert len(map["keys"]) == map["capacity"]
+    for i in range(100):
+        assert mp.get(map, i) == str(i)
+
+
+@handle_not_implemented
+def test_remove_cleanup():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(1000):
+        mp.put(map, i, i)
+        mp.remove(map, i)
+
+    assert mp.size(map) == 0
+    assert map["capacity"] < 100
+
+
+@handle_not_implemented
+def test_get_or_create():
+    map = mp.new_map(5, 0.5, 7)
+    created = mp.get_or_create(map, "a", list)
+    assert created == []
+    assert mp.size(map) == 1
+    created.append(1)
+    assert mp.get_or_create(map, "a", list) is created
+    assert mp.get(map, "a") == [1]
+
+
+@handle_not_implemented
+def test_rehash_recomputes_hashes():
+    # Simula una tabla cargada en otro proceso, donde hash() de las cadenas
+    # da otros valores que los guardados: rehash la deja utilizable
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(20):
+        mp.put(map, "k" + str(i), i)
+    for pos, h in enumerate(map["hashes"]):
+        if h is not None:
+            map["hashes"][pos] = h + 1
+
+    mp.rehash(map)
+    for i in range(20):
+        assert mp.get(map, "k" + str(i)) == i
+    assert mp.size(map) == 20
+
+
+@handle_not_implemented
+def test_any_key_after_remove():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, "a", 1)
+    mp.remove(map, "a")
+    for _ in range(3):
+        mp.put(map, "__EMPTY__", 2)
+
+    assert mp.size(map) == 1
+    assert mp.get(map, "__EMPTY__") == 2
+    assert mp.key_set(map)["elements"] == ["__EMPTY__"]
@@ -176,3 +176,69 @@ def test_rehash():
 
     for i in range(5):
         assert mp.contains(map, i)
+
+
+@handle_not_implemented
+def test_put_resize():
+    map = mp.new_map(5, 0.5, 7)
+    capacity = map["capacity"]
+    for i in range(100):
+        mp.put(map, i, str(i))
+
+    assert mp.size(map) == 100
+    assert map["capacity"] > capacity
+    assert map["current_factor"] <= map["limit_factor"]
+    for i in range(100):
+        assert mp.get(map, i) == str(i)
+
+
+@handle_not_implemented
+def test_remove_keeps_probe_chain():
+    map = mp.new_map(5, 0.5, 7)
+    # Con scale 1 y shift 0 las llaves 0 y 11 chocan en la casilla 0
+    map["scale"] = 1
+    map["shift"] = 0
+    map["prime"] = 109345121
+    mp.put(map, 0, "A")
+    mp.put(map, 11, "B")
+    mp.remove(map, 0)
+
+    assert mp.contains(map, 11)
+    assert mp.get(map, 11) == "B"
+    assert map["deleted"] == 1
+
+    # La casilla borrada se reutiliza
+    mp.put(map, 0, "C")
+    assert map["deleted"] == 0
+    assert mp.get(map, 0) == "C"
+    assert mp.size(map) == 2
+
+
+@handle_not_implemented
+def test_remove_cleanup():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(1000):
+        mp.put(map, i, i)
+        mp.remove(map, i)
+
+    assert mp.size(map) == 0
+    assert map["deleted"] / map["capacity"] <= map["limit_factor"]
+    assert map["capacity"] < 100
+
+
+@handle_not_implemented
+def test_any_key_after_remove():
+    # Las casillas borradas no usan una llave especial: cualquier cadena,
+    # incluida "__EMPTY__", se guarda y se encuentra normalmente
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, "a", 1)
+    mp.remove(map, "a")
+    for _ in range(3):
+        mp.put(map, "__EMPTY__", 2)
+
+    assert mp.size(map) == 1
+    assert mp.contains(map, "__EMPTY__")
+    assert mp.get(map, "__EMPTY__") == 2
+    assert mp.key_set(map)["elements"] == ["__EMPTY__"]
+    assert mp.remove(map, "__EMPTY__")
+    assert mp.is_empty(map)
@@ -0,0 +1,164 @@
+from DataStructures.Map import map_robin_hood as mp
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_colliding_map():
+    # Con scale 1 y shift 0 las llaves enteras k y k + 11 chocan
+    map = mp.new_map(5, 0.5, 7)
+    map["scale"] = 1
+    map["shift"] = 0
+    map["prime"] = 109345121
+    return map
+
+
+def key_at(map, pos):
+    return lt.get_element(map["table"], pos)["key"]
+
+
+@handle_not_implemented
+def test_new_map():
+    map = mp.new_map(5, 0.5, 7)
+    assert map["prime"] == 7
+    assert map["capacity"] == 11
+    assert map["scale"] >= 1 and map["scale"] < 7
+    assert map["shift"] >= 0 and map["shift"] < 7
+    assert lt.size(map["table"]) == 11
+    assert lt.size(map["hashes"]) == 11
+    assert map["current_factor"] == 0
+    assert map["limit_factor"] == 0.5
+    assert map["size"] == 0
+
+
+@handle_not_implemented
+def test_put():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "A"
+
+    mp.put(map, 1, "B")
+    assert map["size"] == 1
+    assert mp.get(map, 1) == "B"
+
+
+@handle_not_implemented
+def test_contains():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert mp.contains(map, 1)
+    assert not mp.contains(map, 2)
+
+
+@handle_not_implemented
+def test_get():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert mp.get(map, 1) == "A"
+    assert mp.get(map, 2) is None
+
+
+@handle_not_implemented
+def test_remove():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    assert mp.remove(map, 1)
+    assert mp.get(map, 1) is None
+    assert map["size"] == 0
+    assert not mp.remove(map, 1)
+
+
+@handle_not_implemented
+def test_remove_backward_shift():
+    map = setup_colliding_map()
+    mp.put(map, 0, "A")
+    mp.put(map, 11, "B")
+    mp.put(map, 1, "C")
+
+    mp.remove(map, 0)
+    # 11 y 1 retroceden una casilla y la tabla no guarda borrados
+    assert mp.get(map, 11) == "B"
+    assert mp.get(map, 1) == "C"
+    assert key_at(map, 0) == 11
+    assert key_at(map, 1) == 1
+    assert key_at(map, 2) is None
+
+
+@handle_not_implemented
+def test_robin_hood_displacement():
+    map = setup_colliding_map()
+    mp.put(map, 0, "A")
+    mp.put(map, 1, "B")
+    mp.put(map, 11, "C")
+    # 11 está más lejos de su origen que 1 y le quita la casilla
+    assert key_at(map, 1) == 11
+    assert key_at(map, 2) == 1
+    assert mp.probe_stats(map) == (2, 5 / 3)
+
+
+@handle_not_implemented
+def test_size():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.size(map) == 0
+    mp.put(map, 1, "A")
+    assert mp.size(map) == 1
+
+
+@handle_not_implemented
+def test_is_empty():
+    map = mp.new_map(5, 0.5, 7)
+    assert mp.is_empty(map)
+    mp.put(map, 1, "A")
+    assert not mp.is_empty(map)
+
+
+@handle_not_implemented
+def test_key_set():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "A")
+    mp.put(map, 2, "B")
+    mp.put(map, 3, "C")
+
+    key_set = mp.key_set(map)
+    assert lt.size(key_set) == 3
+    assert {1, 2, 3} == set(key_set["elements"])
+
+    mp.remove(map, 1)
+    key_set = mp.key_set(map)
+    assert lt.size(key_set) == 2
+    assert 1 not in key_set["elements"]
+
+
+@handle_not_implemented
+def test_value_set():
+    map = mp.new_map(5, 0.5, 7)
+    mp.put(map, 1, "X")
+    mp.put(map, 2, "Y")
+    mp.put(map, 3, "Z")
+
+    value_set = mp.value_set(map)
+    assert lt.size(value_set) == 3
+    assert {"X", "Y", "Z"} == set(value_set["elements"])
+
+    mp.remove(map, 1)
+    value_set = mp.value_set(map)
+    assert lt.size(value_set) == 2
+    assert "X" not in value_set["elements"]
+
+
+@handle_not_implemented
+def test_rehash():
+    map = mp.new_map(5, 0.5, 7)
+    for i in range(100):
+        mp.put(map, "2015-01-%02d %02d" % (i % 28 + 1, i % 24), i)
+    for i in range(0, 100, 3):
+        mp.remove(map, "2015-01-%02d %02d" % (i % 28 + 1, i % 24))
+
+    assert map["capacity"] > 11
+    assert map["current_factor"] <= map["limit_factor"]
+    for i in range(100):
+        key = "2015-01-%02d %02d" % (i % 28 + 1, i % 24)
+        if i % 3 == 0:
+            assert not mp.contains(map, key)
+        else:
+            assert mp.get(map, key) == i
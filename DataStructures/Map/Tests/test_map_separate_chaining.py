@@ -142,3 +142,23 @@ def test_rehash():
     for i in range(6):
         assert mp.contains(map, i)
         assert mp.get(map, i) == i*10
+
+
+@handle_not_implemented
+def test_lazy_buckets():
+    map = setup_tests(1, 0)
+    table = map["table"]
+    assert lt.size(table) == map["capacity"]
+    assert all(cell is None for cell in table["elements"])
+
+    # Con scale 1, shift 0 y primo 7 las llaves 1 y 8 van a la misma casilla
+    mp.put(map, 1, "A")
+    mp.put(map, 8, "B")
+    idx = mf.hash_value(map, 1)
+    assert sum(cell is not None for cell in table["elements"]) == 1
+    assert mp.get(map, 8) == "B"
+
+    mp.remove(map, 1)
+    assert mp.get(map, 8) == "B"
+    mp.remove(map, 8)
+    assert lt.get_element(table, idx) is None
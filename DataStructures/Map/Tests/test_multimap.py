@@ -0,0 +1,90 @@
+from DataStructures.Map import multimap as mm
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_multimap():
+    multimap = mm.new_multimap(5, 0.5)
+    assert mm.size(multimap) == 0
+    assert mm.key_count(multimap) == 0
+    assert mm.is_empty(multimap)
+
+
+@handle_not_implemented
+def test_add():
+    multimap = mm.new_multimap(5, 0.5)
+    mm.add(multimap, "a", 1)
+    mm.add(multimap, "b", 2)
+    mm.add(multimap, "a", 3)
+    assert mm.size(multimap) == 3
+    assert mm.key_count(multimap) == 2
+    assert mm.get_all(multimap, "a")["elements"] == [1, 3]
+    assert mm.get_all(multimap, "b")["elements"] == [2]
+
+
+@handle_not_implemented
+def test_get_all():
+    multimap = mm.new_multimap(5, 0.5)
+    assert mm.get_all(multimap, "a") is None
+    mm.add(multimap, "a", 1)
+    assert lt.size(mm.get_all(multimap, "a")) == 1
+    assert mm.contains(multimap, "a")
+    assert not mm.contains(multimap, "b")
+
+
+@handle_not_implemented
+def test_remove():
+    multimap = mm.new_multimap(5, 0.5)
+    mm.add(multimap, "a", 1)
+    mm.add(multimap, "a", 2)
+    mm.add(multimap, "b", 3)
+    assert mm.remove(multimap, "a")
+    assert not mm.remove(multimap, "a")
+    assert mm.get_all(multimap, "a") is None
+    assert mm.size(multimap) == 1
+    assert mm.key_count(multimap) == 1
+
+
+@handle_not_implemented
+def test_key_set():
+    multimap = mm.new_multimap(5, 0.5)
+    for i in range(10):
+        mm.add(multimap, i % 3, i)
+    assert {0, 1, 2} == set(mm.key_set(multimap)["elements"])
+
+
+@handle_not_implemented
+def test_group_by():
+    multimap = mm.group_by(range(100), lambda x: x % 7)
+    assert mm.size(multimap) == 100
+    assert mm.key_count(multimap) == 7
+    for k in range(7):
+        assert mm.get_all(multimap, k)["elements"] == list(range(k, 100, 7))
+
+    # Llaves seguidas repetidas
+    multimap = mm.group_by([1, 1, 2, 2, 1], lambda x: x)
+    assert mm.get_all(multimap, 1)["elements"] == [1, 1, 1]
+    assert mm.get_all(multimap, 2)["elements"] == [2, 2]
+
+
+@handle_not_implemented
+def test_group_by_sorted():
+    words = ["pera", "kiwi", "uva", "higo", "mango", "coco"]
+    multimap = mm.group_by(words, len, sort_key=lambda w: w)
+    assert mm.get_all(multimap, 4)["elements"] == ["coco", "higo", "kiwi", "pera"]
+
+    # Orden descendente estable: los empates conservan el orden de llegada
+    multimap = mm.group_by(words, len, sort_key=lambda w: w[-1], reverse=True)
+    assert mm.get_all(multimap, 4)["elements"] == ["higo", "coco", "kiwi", "pera"]
+
+
+@handle_not_implemented
+def test_sort_values():
+    multimap = mm.new_multimap(5, 0.5)
+    for v in [3, 1, 2]:
+        mm.add(multimap, "a", v)
+        mm.add(multimap, "b", v)
+    mm.sort_values(multimap, lambda v: v, keys=["a"])
+    assert mm.get_all(multimap, "a")["elements"] == [1, 2, 3]
+    assert mm.get_all(multimap, "b")["elements"] == [3, 1, 2]
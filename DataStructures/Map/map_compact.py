@@ -0,0 +1,214 @@
+import DataStructures.Map.map_functions as mf
+import DataStructures.List.array_list as lt
+
+# Sondeo lineal con la tabla partida en tres listas paralelas: "keys",
+# "values" y "hashes" (hash(llave) de cada casilla). Una casilla vacía tiene
+# llave None; una borrada (tombstone) tiene hash None y como llave el marcador
+# _TOMBSTONE, que solo sirve para que el sondeo no se detenga ahí. Se
+# reconoce por el hash, nunca por la llave, así que cualquier llave es
+# válida. No hay un diccionario por casilla: crear o rehacer la tabla son
+# tres [None] * capacity.
+
+_TOMBSTONE = object()
+
+
+def new_map(num_elements, load_factor, prime=109345121):
+    capacity = mf.next_prime(int(num_elements / load_factor))
+
+    hash_table = {
+        "prime" : prime,
+        "capacity" : capacity,
+        "scale" : mf.randrange(1, prime - 1),
+        "shift" : mf.randrange(0, prime - 1),
+        "keys" : [None] * capacity,
+        "values" : [None] * capacity,
+        "hashes" : [None] * capacity,
+        "current_factor" : 0,
+        "limit_factor" : load_factor,
+        "size" : 0,
+        "deleted" : 0
+    }
+
+    return hash_table
+
+def _home(my_map, h):
+    # Casilla de origen para un hash ya calculado (mismo MAD que hash_value)
+    a = my_map["scale"]
+    b = my_map["shift"]
+    return int((abs(a * h + b) % my_map["prime"]) % my_map["capacity"])
+
+def find_slot(my_map, key, h):
+    """
+    Busca key, cuyo hash(key) es h. Retorna (True, pos) si la encuentra; si
+    no, (False, pos) con la primera casilla donde se puede insertar (borrada
+    o vacía), o (False, -1) si no hay ninguna.
+    """
+    capacity = my_map["capacity"]
+    keys = my_map["keys"]
+    hashes = my_map["hashes"]
+
+    first_deleted = -1
+    pos = _home(my_map, h)
+    i = 0
+    while i < capacity:
+        k = keys[pos]
+        if k is None:
+            if first_deleted != -1:
+                return False, first_deleted
+            return False, pos
+        if hashes[pos] is None:
+            if first_deleted == -1:
+                first_deleted = pos
+        elif hashes[pos] == h and k == key:
+            return True, pos
+        pos += 1
+        if pos == capacity:
+            pos = 0
+        i += 1
+    return False, first_deleted
+
+def put(my_map, key, value):
+    h = hash(key)
+    occupied, pos = find_slot(my_map, key, h)
+    if occupied:
+        my_map["values"][pos] = value
+        return my_map
+    _store(my_map, key, h, pos, value)
+    return my_map
+
+def get_or_create(my_map, key, factory):
+    """
+    Retorna el valor de key. Si key no está, guarda factory() como su valor
+    y lo retorna. La tabla se recorre una sola vez en ambos casos.
+    """
+    h = hash(key)
+    occupied, pos = find_slot(my_map, key, h)
+    if occupied:
+        return my_map["values"][pos]
+    value = factory()
+    _store(my_map, key, h, pos, value)
+    return value
+
+def _store(my_map, key, h, pos, value):
+    # Guarda una llave nueva en la casilla libre pos que dio find_slot
+    if pos == -1:
+        # Tabla llena (factor de carga >= 1): se agranda y se reintenta
+        rehash(my_map)
+        occupied, pos = find_slot(my_map, key, h)
+    if my_map["keys"][pos] is not None:
+        my_map["deleted"] -= 1
+    my_map["keys"][pos] = key
+    my_map["values"][pos] = value
+    my_map["hashes"][pos] = h
+    my_map["size"] += 1
+    capacity = my_map["capacity"]
+    my_map["current_factor"] = my_map["size"] / capacity
+    # Igual que map_linear_probing: se crece si la mayoría son llaves vivas y
+    # si no solo se limpian los tombstones
+    if (my_map["size"] + my_map["deleted"]) / capacity > my_map["limit_factor"]:
+        if my_map["current_factor"] > my_map["limit_factor"] / 2:
+            rehash(my_map)
+        else:
+            _reubicar(my_map, capacity)
+
+def contains(my_map, key):
+    occupied, pos = find_slot(my_map, key, hash(key))
+    return occupied
+
+def get(my_map, key):
+    occupied, pos = find_slot(my_map, key, hash(key))
+    if occupied:
+        return my_map["values"][pos]
+    return None
+
+def remove(my_map, key):
+    occupied, pos = find_slot(my_map, key, hash(key))
+    if occupied:
+        my_map["keys"][pos] = _TOMBSTONE
+        my_map["values"][pos] = None
+        my_map["hashes"][pos] = None
+        my_map["size"] -= 1
+        my_map["deleted"] += 1
+        my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+        return True
+    return False
+
+def rehash(my_map):
+    new_capacity = mf.next_prime(2 * my_map["capacity"])
+    my_map["prime"] = mf.next_prime(new_capacity + 1)
+    my_map["scale"] = mf.randrange(1, my_map["prime"] - 1)
+    my_map["shift"] = mf.randrange(0, my_map["prime"] - 1)
+    return _reubicar(my_map, new_capacity)
+
+def _reubicar(my_map, new_capacity):
+    # Reinserta las llaves vivas en listas nuevas de new_capacity casillas,
+    # descartando los tombstones. El hash de cada llave se vuelve a calcular
+    # (las cadenas lo tienen en caché): así rehash también repara una tabla
+    # cuyos hashes guardados vienen de otro proceso, por ejemplo al cargarla
+    # de un pickle, ya que hash() de las cadenas cambia en cada proceso
+    old_keys = my_map["keys"]
+    old_values = my_map["values"]
+    old_hashes = my_map["hashes"]
+    keys = [None] * new_capacity
+    values = [None] * new_capacity
+    hashes = [None] * new_capacity
+
+    my_map["capacity"] = new_capacity
+    my_map["keys"] = keys
+    my_map["values"] = values
+    my_map["hashes"] = hashes
+    my_map["deleted"] = 0
+
+    for i in range(len(old_keys)):
+        if old_hashes[i] is not None:
+            h = hash(old_keys[i])
+            pos = _home(my_map, h)
+            while keys[pos] is not None:
+                pos += 1
+                if pos == new_capacity:
+                    pos = 0
+            keys[pos] = old_keys[i]
+            values[pos] = old_values[i]
+            hashes[pos] = h
+
+    my_map["current_factor"] = my_map["size"] / new_capacity
+    return my_map
+
+def size(my_map):
+    return my_map["size"]
+
+def is_empty(my_map):
+    return my_map["size"] == 0
+
+def key_set(my_map):
+    keys = lt.new_list()
+    hashes = my_map["hashes"]
+    for i, k in enumerate(my_map["keys"]):
+        if hashes[i] is not None:
+            lt.add_last(keys, k)
+    return keys
+
+def value_set(my_map):
+    values = lt.new_list()
+    hashes = my_map["hashes"]
+    for i, v in enumerate(my_map["values"]):
+        if hashes[i] is not None:
+            lt.add_last(values, v)
+    return values
+
+def probe_stats(my_map):
+    """
+    Largo de sondeo (casillas revisadas para encontrar cada llave): retorna
+    (máximo, promedio). Con la tabla vacía retorna (0, 0).
+    """
+    capacity = my_map["capacity"]
+    longest = 0
+    total = 0
+    for i, h in enumerate(my_map["hashes"]):
+        if h is not None:
+            probes = (i - _home(my_map, h)) % capacity + 1
+            longest = max(longest, probes)
+            total += probes
+    if my_map["size"] == 0:
+        return 0, 0
+    return longest, total / my_map["size"]
@@ -4,6 +4,19 @@ import DataStructures.Map.map_entry as me
 import random
 
 
+# Una casilla borrada (tombstone) es una entrada sin llave con el campo
+# "deleted" en True: la búsqueda sigue de largo sobre ella, pero put puede
+# reutilizarla. Como la marca no es una llave, cualquier llave es válida.
+
+def _new_tombstone():
+    entry = me.new_map_entry(None, None)
+    entry["deleted"] = True
+    return entry
+
+def _is_tombstone(entry):
+    return entry.get("deleted", False)
+
+
 def new_map(num_elements, load_factor, prime=109345121):
     capacity = mf.next_prime(int(num_elements / load_factor))
 
@@ -19,7 +32,8 @@ def new_map(num_elements, load_factor, prime=109345121):
         "table" : table,
         "current_factor" : 0,
         "limit_factor" : load_factor,
-        "size" : 0
+        "size" : 0,
+        "deleted" : 0
     }
 
     return hash_table
@@ -28,44 +42,61 @@ def put(my_map, key, value):
     start = mf.hash_value(my_map, key)
     occupied, pos = find_slot(my_map, key, start)
     if pos == -1:
-        return my_map
+        # Tabla llena (factor de carga >= 1): se agranda y se reintenta
+        rehash(my_map)
+        return put(my_map, key, value)
     table = my_map["table"]
+    if occupied:
+        lt.change_info(table, pos, me.new_map_entry(key, value))
+        return my_map
+    if _is_tombstone(lt.get_element(table, pos)):
+        my_map["deleted"] -= 1
     lt.change_info(table, pos, me.new_map_entry(key, value))
-    if not occupied:
-        my_map["size"] += 1
+    my_map["size"] += 1
+    capacity = my_map["capacity"]
+    my_map["current_factor"] = my_map["size"] / capacity
+    # Las casillas borradas también alargan las cadenas de sondeo: si entre
+    # ocupadas y borradas se pasa el factor de carga, se crece cuando la
+    # mayoría son llaves vivas y si no solo se limpian los tombstones
+    if (my_map["size"] + my_map["deleted"]) / capacity > my_map["limit_factor"]:
+        if my_map["current_factor"] > my_map["limit_factor"] / 2:
+            rehash(my_map)
+        else:
+            _reubicar(my_map, capacity)
     return my_map
 
 def contains(my_map, key):
-    index = mf.hash_value(my_map, key)
-    capacity = my_map["capacity"]
-    table = my_map["table"]
-
-    for i in range(capacity):
-        probe_index = (index + i) % capacity
-        entry = lt.get_element(table, probe_index)
-        entry_key = me.get_key(entry)
-        if entry_key is None:
-            return False
-        if entry_key == key:
-            return True
-    return False
+    occupied, pos = find_slot(my_map, key, mf.hash_value(my_map, key))
+    return occupied
 
 def find_slot(my_map,key,hash_value):
+    """
+    Busca key desde la posición hash_value. Retorna (True, pos) si la
+    encuentra; si no, (False, pos) con la primera casilla donde se puede
+    insertar (borrada o vacía), o (False, -1) si no hay ninguna.
+    """
     start = int(hash_value)
     capacity = my_map["capacity"]
     table = my_map["table"]
 
+    first_deleted = -1
     i = 0
     while i < capacity:
         pos = (start + i) % capacity
         entry = lt.get_element(table, pos)
         k = me.get_key(entry)
         if k is None:
-            return False, pos
-        if k == key:
+            if _is_tombstone(entry):
+                if first_deleted == -1:
+                    first_deleted = pos
+            elif first_deleted != -1:
+                return False, first_deleted
+            else:
+                return False, pos
+        elif k == key:
             return True, pos
         i += 1
-    return False, -1
+    return False, first_deleted
 
 def random():
     return _rnd.random()
@@ -79,10 +110,16 @@ def randint(a, b):
     return _rnd.randint(a, b)
 
 def rehash(my_map):
-    old_table = my_map["table"]
-    old_capacity = my_map["capacity"]
+    new_capacity = mf.next_prime(2 * my_map["capacity"])
+    my_map["prime"] = mf.next_prime(new_capacity + 1)
+    my_map["scale"] = mf.randrange(1, my_map["prime"] - 1)
+    my_map["shift"] = mf.randrange(0, my_map["prime"] - 1)
+    return _reubicar(my_map, new_capacity)
 
-    new_capacity = mf.next_prime(2 * old_capacity)
+def _reubicar(my_map, new_capacity):
+    # Reinserta las llaves vivas en una tabla nueva de new_capacity casillas,
+    # descartando los tombstones
+    old_table = my_map["table"]
     new_table = lt.new_list()
     i = 0
     while i < new_capacity:
@@ -90,11 +127,8 @@ def rehash(my_map):
         i += 1
 
     my_map["capacity"] = new_capacity
-    my_map["prime"] = mf.next_prime(new_capacity + 1)
-    my_map["scale"] = mf.randrange(1, my_map["prime"] - 1)
-    my_map["shift"] = mf.randrange(0, my_map["prime"] - 1)
     my_map["table"] = new_table
-    my_map["size"] = 0
+    my_map["deleted"] = 0
 
     i = 0
     m = lt.size(old_table)
@@ -102,7 +136,8 @@ def rehash(my_map):
         entry = lt.get_element(old_table, i)
         k = me.get_key(entry)
         if k is not None:
-            put(my_map, k, me.get_value(entry))
+            occupied, pos = find_slot(my_map, k, mf.hash_value(my_map, k))
+            lt.change_info(new_table, pos, entry)
         i += 1
 
     my_map["current_factor"] = my_map["size"] / my_map["capacity"]
@@ -111,7 +146,7 @@ def rehash(my_map):
 def get(my_map,key):
     start = mf.hash_value(my_map, key)
     occupied, pos = find_slot(my_map, key, start)
-    if occupied and pos != -1:
+    if occupied:
         entry = lt.get_element(my_map["table"], pos)
         return me.get_value(entry)
     return None
@@ -121,9 +156,13 @@ def get(my_map,key):
 def remove(my_map,key):
     start = mf.hash_value(my_map, key)
     occupied, pos = find_slot(my_map, key, start)
-    if occupied and pos != -1:
-        lt.change_info(my_map["table"], pos, me.new_map_entry(None, None))
+    if occupied:
+        # Se deja un tombstone para no cortar la cadena de sondeo de las
+        # llaves que vienen después
+        lt.change_info(my_map["table"], pos, _new_tombstone())
         my_map["size"] -= 1
+        my_map["deleted"] += 1
+        my_map["current_factor"] = my_map["size"] / my_map["capacity"]
         return True
     return False
     
@@ -154,13 +193,34 @@ def value_set(my_map):
     i = 0
     while i < m:
         entry = lt.get_element(table, i)
-        if me.get_key(entry) is not None:
+        k = me.get_key(entry)
+        if k is not None:
             lt.add_last(values, me.get_value(entry))
         i += 1
     return values
 
 def is_available(table, pos):
-    entry = lt.get_element(table, pos)
-    return me.get_key(entry) is None
+    return me.get_key(lt.get_element(table, pos)) is None
 
 
+
+def probe_stats(my_map):
+    """
+    Largo de sondeo (casillas revisadas para encontrar cada llave): retorna
+    (máximo, promedio). Con la tabla vacía retorna (0, 0).
+    """
+    table = my_map["table"]
+    capacity = my_map["capacity"]
+    longest = 0
+    total = 0
+    i = 0
+    while i < capacity:
+        k = me.get_key(lt.get_element(table, i))
+        if k is not None:
+            probes = (i - mf.hash_value(my_map, k)) % capacity + 1
+            longest = max(longest, probes)
+            total += probes
+        i += 1
+    if my_map["size"] == 0:
+        return 0, 0
+    return longest, total / my_map["size"]
@@ -0,0 +1,229 @@
+import DataStructures.Map.map_functions as mf
+import DataStructures.List.array_list as lt
+import DataStructures.Map.map_entry as me
+
+# Direccionamiento abierto con desplazamiento Robin Hood: al insertar, la llave
+# que está más lejos de su casilla de origen se queda con la casilla y la más
+# cercana sigue sondeando. Así las distancias de sondeo quedan parejas y una
+# búsqueda fallida puede parar apenas encuentra una llave más cerca de su
+# origen que la buscada. Junto a cada entrada se guarda hash(llave) en
+# "hashes" para no comparar llaves cuyo hash no coincide.
+
+
+def new_map(num_elements, load_factor, prime=109345121):
+    capacity = mf.next_prime(int(num_elements / load_factor))
+
+    table = lt.new_list()
+    hashes = lt.new_list()
+    for _ in range(capacity):
+        lt.add_last(table, me.new_map_entry(None, None))
+        lt.add_last(hashes, None)
+
+    hash_table = {
+        "prime" : prime,
+        "capacity" : capacity,
+        "scale" : mf.randrange(1, prime - 1),
+        "shift" : mf.randrange(0, prime - 1),
+        "table" : table,
+        "hashes" : hashes,
+        "current_factor" : 0,
+        "limit_factor" : load_factor,
+        "size" : 0
+    }
+
+    return hash_table
+
+def _home(my_map, h):
+    # Casilla de origen para un hash ya calculado (mismo MAD que hash_value)
+    a = my_map["scale"]
+    b = my_map["shift"]
+    return int((abs(a * h + b) % my_map["prime"]) % my_map["capacity"])
+
+def _distance(my_map, pos, h):
+    return (pos - _home(my_map, h)) % my_map["capacity"]
+
+def find_slot(my_map, key):
+    """
+    Retorna la posición de key en la tabla, o -1 si no está.
+    """
+    h = hash(key)
+    capacity = my_map["capacity"]
+    elements = my_map["table"]["elements"]
+    hashes = my_map["hashes"]["elements"]
+    a = my_map["scale"]
+    b = my_map["shift"]
+    p = my_map["prime"]
+
+    pos = _home(my_map, h)
+    dist = 0
+    while dist < capacity:
+        slot_hash = hashes[pos]
+        if slot_hash is None:
+            return -1
+        if slot_hash == h and me.get_key(elements[pos]) == key:
+            return pos
+        if (pos - (abs(a * slot_hash + b) % p) % capacity) % capacity < dist:
+            # key habría desplazado a esta entrada: no está en la tabla
+            return -1
+        pos = (pos + 1) % capacity
+        dist += 1
+    return -1
+
+def put(my_map, key, value):
+    pos = find_slot(my_map, key)
+    if pos != -1:
+        me.set_value(lt.get_element(my_map["table"], pos), value)
+        return my_map
+
+    if (my_map["size"] + 1) / my_map["capacity"] > my_map["limit_factor"] \
+            or my_map["size"] == my_map["capacity"]:
+        rehash(my_map)
+    _insert(my_map, me.new_map_entry(key, value), hash(key))
+    my_map["size"] += 1
+    my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    return my_map
+
+def _insert(my_map, entry, h):
+    # Inserta una llave que no está en la tabla; hay al menos una casilla vacía
+    capacity = my_map["capacity"]
+    table = my_map["table"]
+    hashes = my_map["hashes"]
+
+    pos = _home(my_map, h)
+    dist = 0
+    while True:
+        slot = lt.get_element(table, pos)
+        if me.get_key(slot) is None:
+            lt.change_info(table, pos, entry)
+            lt.change_info(hashes, pos, h)
+            return pos
+        slot_hash = lt.get_element(hashes, pos)
+        slot_dist = _distance(my_map, pos, slot_hash)
+        if slot_dist < dist:
+            # La entrada más cercana a su origen cede la casilla y sigue
+            lt.change_info(table, pos, entry)
+            lt.change_info(hashes, pos, h)
+            entry, h, dist = slot, slot_hash, slot_dist
+        pos = (pos + 1) % capacity
+        dist += 1
+
+def contains(my_map, key):
+    return find_slot(my_map, key) != -1
+
+def get(my_map, key):
+    pos = find_slot(my_map, key)
+    if pos == -1:
+        return None
+    return me.get_value(lt.get_element(my_map["table"], pos))
+
+def remove(my_map, key):
+    pos = find_slot(my_map, key)
+    if pos == -1:
+        return False
+
+    # Borrado con corrimiento hacia atrás: las entradas siguientes que no
+    # están en su casilla de origen retroceden una posición, así que no
+    # quedan tombstones
+    capacity = my_map["capacity"]
+    table = my_map["table"]
+    hashes = my_map["hashes"]
+    nxt = (pos + 1) % capacity
+    while True:
+        entry = lt.get_element(table, nxt)
+        if me.get_key(entry) is None:
+            break
+        slot_hash = lt.get_element(hashes, nxt)
+        if _distance(my_map, nxt, slot_hash) == 0:
+            break
+        lt.change_info(table, pos, entry)
+        lt.change_info(hashes, pos, slot_hash)
+        pos = nxt
+        nxt = (nxt + 1) % capacity
+    lt.change_info(table, pos, me.new_map_entry(None, None))
+    lt.change_info(hashes, pos, None)
+
+    my_map["size"] -= 1
+    my_map["current_factor"] = my_map["size"] / capacity
+    return True
+
+def rehash(my_map):
+    old_table = my_map["table"]
+    old_hashes = my_map["hashes"]
+
+    new_capacity = mf.next_prime(2 * my_map["capacity"])
+    table = lt.new_list()
+    hashes = lt.new_list()
+    i = 0
+    while i < new_capacity:
+        lt.add_last(table, me.new_map_entry(None, None))
+        lt.add_last(hashes, None)
+        i += 1
+
+    my_map["capacity"] = new_capacity
+    my_map["prime"] = mf.next_prime(new_capacity + 1)
+    my_map["scale"] = mf.randrange(1, my_map["prime"] - 1)
+    my_map["shift"] = mf.randrange(0, my_map["prime"] - 1)
+    my_map["table"] = table
+    my_map["hashes"] = hashes
+
+    i = 0
+    m = lt.size(old_table)
+    while i < m:
+        entry = lt.get_element(old_table, i)
+        if me.get_key(entry) is not None:
+            _insert(my_map, entry, lt.get_element(old_hashes, i))
+        i += 1
+
+    my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    return my_map
+
+def size(my_map):
+    return my_map["size"]
+
+def is_empty(my_map):
+    return my_map["size"] == 0
+
+def key_set(my_map):
+    keys = lt.new_list()
+    table = my_map["table"]
+    m = lt.size(table)
+    i = 0
+    while i < m:
+        k = me.get_key(lt.get_element(table, i))
+        if k is not None:
+            lt.add_last(keys, k)
+        i += 1
+    return keys
+
+def value_set(my_map):
+    values = lt.new_list()
+    table = my_map["table"]
+    m = lt.size(table)
+    i = 0
+    while i < m:
+        entry = lt.get_element(table, i)
+        if me.get_key(entry) is not None:
+            lt.add_last(values, me.get_value(entry))
+        i += 1
+    return values
+
+def probe_stats(my_map):
+    """
+    Largo de sondeo (casillas revisadas para encontrar cada llave): retorna
+    (máximo, promedio). Con la tabla vacía retorna (0, 0).
+    """
+    table = my_map["table"]
+    hashes = my_map["hashes"]
+    longest = 0
+    total = 0
+    i = 0
+    m = lt.size(table)
+    while i < m:
+        if me.get_key(lt.get_element(table, i)) is not None:
+            probes = _distance(my_map, i, lt.get_element(hashes, i)) + 1
+            longest = max(longest, probes)
+            total += probes
+        i += 1
+    if my_map["size"] == 0:
+        return 0, 0
+    return longest, total / my_map["size"]
@@ -2,17 +2,19 @@ import DataStructures.Map.map_functions as mf
 import DataStructures.List.single_linked_list as lt
 import DataStructures.List.array_list as al
 import DataStructures.Map.map_entry as me
+import DataStructures.List.list_node as ln
 import random
 
 
 
+# La tabla es un array_list con acceso directo por posición; cada casilla es
+# None hasta que se le asigna la primera llave, y desde ahí guarda un
+# single_linked_list con las entradas de esa casilla
+
+
 def new_map(num_elements, load_factor, prime=109345121):
     capacity = mf.next_prime(int(num_elements / load_factor))
-    table = lt.new_list()
-    c = 0
-    while c < capacity:
-        lt.add_last(table, me.new_map_entry(None, None))
-        c += 1
+    table = _new_table(capacity)
     return {
         "prime": prime,
         "capacity": capacity,
@@ -25,6 +27,15 @@ def new_map(num_elements, load_factor, prime=109345121):
     }
 
 
+def _new_table(capacity):
+    table = al.new_list()
+    c = 0
+    while c < capacity:
+        al.add_last(table, None)
+        c += 1
+    return table
+
+
 def default_compare(key, element):
     k = me.get_key(element)
     if key == k:
@@ -36,48 +47,34 @@ def default_compare(key, element):
     return -1
 
 
+def _find_in_bucket(bucket, key):
+    # Posición y entrada de key dentro de la casilla, o (-1, None)
+    node = bucket["first"]
+    j = 0
+    while node is not None:
+        entry = ln.get_element(node)
+        if me.get_key(entry) == key:
+            return j, entry
+        node = node["next"]
+        j += 1
+    return -1, None
+
+
 def put(my_map, key, value):
     idx = mf.hash_value(my_map, key)
     table = my_map["table"]
-    cell = lt.get_element(table, idx)
+    bucket = al.get_element(table, idx)
 
-    if ("key" in cell) and ("value" in cell):
-        if cell["key"] is None:
-            bucket = lt.new_list()
-            lt.change_info(table, idx, bucket)
-            lt.add_last(bucket, me.new_map_entry(key, value))
-            my_map["size"] += 1
-        else:
-            if default_compare(key, cell) == 0:
-                cell["value"] = value
-                lt.change_info(table, idx, cell)
-            else:
-                bucket = lt.new_list()
-                lt.add_last(bucket, cell)
-                lt.add_last(bucket, me.new_map_entry(key, value))
-                lt.change_info(table, idx, bucket)
-                my_map["size"] += 1
-    elif ("first" in cell) and ("last" in cell) and ("size" in cell):
-        bucket = cell
-        found = False
-        j = 0
-        bsize = lt.size(bucket)
-        while j < bsize and not found:
-            entry = lt.get_element(bucket, j)
-            if default_compare(key, entry) == 0:
-                entry["value"] = value
-                found = True
-            else:
-                j += 1
-        if not found:
-            lt.add_last(bucket, me.new_map_entry(key, value))
-            my_map["size"] += 1
-    else:
+    if bucket is None:
         bucket = lt.new_list()
-        lt.add_last(bucket, me.new_map_entry(key, value))
-        lt.change_info(table, idx, bucket)
-        my_map["size"] += 1
+        al.change_info(table, idx, bucket)
+    pos, entry = _find_in_bucket(bucket, key)
+    if entry is not None:
+        me.set_value(entry, value)
+        return my_map
 
+    lt.add_last(bucket, me.new_map_entry(key, value))
+    my_map["size"] += 1
     my_map["current_factor"] = my_map["size"] / my_map["capacity"]
     if my_map["current_factor"] > my_map["limit_factor"]:
         rehash(my_map)
@@ -85,78 +82,37 @@ def put(my_map, key, value):
 
 
 def contains(my_map, key):
-    if my_map["size"] == 0:
+    bucket = al.get_element(my_map["table"], mf.hash_value(my_map, key))
+    if bucket is None:
         return False
-    idx = mf.hash_value(my_map, key)
-    cell = lt.get_element(my_map["table"], idx)
-
-    if ("key" in cell) and ("value" in cell):
-        return cell["key"] == key
-
-    if ("first" in cell) and ("last" in cell) and ("size" in cell):
-        bsize = lt.size(cell)
-        j = 0
-        while j < bsize:
-            entry = lt.get_element(cell, j)
-            if entry["key"] == key:
-                return True
-            j += 1
-    return False
+    pos, entry = _find_in_bucket(bucket, key)
+    return entry is not None
 
 
 def get(my_map, key):
-    if my_map["size"] == 0:
+    bucket = al.get_element(my_map["table"], mf.hash_value(my_map, key))
+    if bucket is None:
         return None
-    idx = mf.hash_value(my_map, key)
-    cell = lt.get_element(my_map["table"], idx)
-
-    if ("key" in cell) and ("value" in cell):
-        if cell["key"] == key:
-            return me.get_value(cell)
+    pos, entry = _find_in_bucket(bucket, key)
+    if entry is None:
         return None
-
-    if ("first" in cell) and ("last" in cell) and ("size" in cell):
-        bsize = lt.size(cell)
-        j = 0
-        while j < bsize:
-            entry = lt.get_element(cell, j)
-            if entry["key"] == key:
-                return me.get_value(entry)
-            j += 1
-    return None
+    return me.get_value(entry)
 
 
 def remove(my_map, key):
-    if my_map["size"] == 0:
-        return my_map
     idx = mf.hash_value(my_map, key)
     table = my_map["table"]
-    cell = lt.get_element(table, idx)
-
-    if ("key" in cell) and ("value" in cell):
-        if cell["key"] is not None and cell["key"] == key:
-            lt.change_info(table, idx, me.new_map_entry(None, None))
-            my_map["size"] -= 1
-            my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    bucket = al.get_element(table, idx)
+    if bucket is None:
         return my_map
 
-    if ("first" in cell) and ("last" in cell) and ("size" in cell):
-        bucket = cell
-        bsize = lt.size(bucket)
-        j = 0
-        pos = -1
-        while j < bsize and pos == -1:
-            entry = lt.get_element(bucket, j)
-            if entry["key"] == key:
-                pos = j
-            else:
-                j += 1
-        if pos != -1:
-            lt.delete_element(bucket, pos)
-            my_map["size"] -= 1
-            if lt.size(bucket) == 0:
-                lt.change_info(table, idx, me.new_map_entry(None, None))
-            my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    pos, entry = _find_in_bucket(bucket, key)
+    if entry is not None:
+        lt.delete_element(bucket, pos)
+        my_map["size"] -= 1
+        if lt.is_empty(bucket):
+            al.change_info(table, idx, None)
+        my_map["current_factor"] = my_map["size"] / my_map["capacity"]
     return my_map
 
 
@@ -168,82 +124,53 @@ def is_empty(my_map):
     return my_map["size"] == 0
 
 
-def key_set(my_map):
-    keys = al.new_list()
+def _entries(my_map):
+    # Todas las entradas del mapa, casilla por casilla
     table = my_map["table"]
-    tsize = lt.size(table)
+    tsize = al.size(table)
     i = 0
     while i < tsize:
-        cell = lt.get_element(table, i)
-        if ("key" in cell) and ("value" in cell):
-            if cell["key"] is not None:
-                al.add_last(keys, cell["key"])
-        elif ("first" in cell) and ("last" in cell) and ("size" in cell):
-            bsize = lt.size(cell)
-            j = 0
-            while j < bsize:
-                entry = lt.get_element(cell, j)
-                if entry["key"] is not None:
-                    al.add_last(keys, entry["key"])
-                j += 1
+        bucket = al.get_element(table, i)
+        if bucket is not None:
+            node = bucket["first"]
+            while node is not None:
+                yield ln.get_element(node)
+                node = node["next"]
         i += 1
+
+
+def key_set(my_map):
+    keys = al.new_list()
+    for entry in _entries(my_map):
+        al.add_last(keys, me.get_key(entry))
     return keys
 
 
 def value_set(my_map):
     values = al.new_list()
-    table = my_map["table"]
-    tsize = lt.size(table)
-    i = 0
-    while i < tsize:
-        cell = lt.get_element(table, i)
-        if ("key" in cell) and ("value" in cell):
-            if cell["key"] is not None:
-                al.add_last(values, cell["value"])
-        elif ("first" in cell) and ("last" in cell) and ("size" in cell):
-            bsize = lt.size(cell)
-            j = 0
-            while j < bsize:
-                entry = lt.get_element(cell, j)
-                if entry["key"] is not None:
-                    al.add_last(values, entry["value"])
-                j += 1
-        i += 1
+    for entry in _entries(my_map):
+        al.add_last(values, me.get_value(entry))
     return values
 
 
 def rehash(my_map):
-    old_table = my_map["table"]
-    old_capacity = my_map["capacity"]
-    new_capacity = mf.next_prime(2 * old_capacity)
-    new_table = lt.new_list()
-    i = 0
-    while i < new_capacity:
-        lt.add_last(new_table, me.new_map_entry(None, None))
-        i += 1
+    entries = list(_entries(my_map))
+    new_capacity = mf.next_prime(2 * my_map["capacity"])
+    new_table = _new_table(new_capacity)
 
     my_map["capacity"] = new_capacity
     my_map["prime"] = mf.next_prime(new_capacity + 1)
     my_map["scale"] = random.randrange(1, my_map["prime"] - 1)
     my_map["shift"] = random.randrange(0, my_map["prime"] - 1)
     my_map["table"] = new_table
-    my_map["size"] = 0
-    my_map["current_factor"] = 0
 
-    t = lt.size(old_table)
-    i = 0
-    while i < t:
-        cell = lt.get_element(old_table, i)
-        if ("key" in cell) and ("value" in cell):
-            if cell["key"] is not None:
-                put(my_map, cell["key"], cell["value"])
-        elif ("first" in cell) and ("last" in cell) and ("size" in cell):
-            bsize = lt.size(cell)
-            j = 0
-            while j < bsize:
-                entry = lt.get_element(cell, j)
-                if entry["key"] is not None:
-                    put(my_map, entry["key"], entry["value"])
-                j += 1
-        i += 1
-    return my_map
\ No newline at end of file
+    # Las llaves ya son distintas: se reubican sin volver a buscarlas
+    for entry in entries:
+        idx = mf.hash_value(my_map, me.get_key(entry))
+        bucket = al.get_element(new_table, idx)
+        if bucket is None:
+            bucket = lt.new_list()
+            al.change_info(new_table, idx, bucket)
+        lt.add_last(bucket, entry)
+    my_map["current_factor"] = my_map["size"] / my_map["capacity"]
+    return my_map
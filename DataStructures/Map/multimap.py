@@ -0,0 +1,89 @@
+import DataStructures.Map.map_compact as mp
+import DataStructures.List.array_list as lt
+
+# Mapa de una llave a varios valores: cada llave guarda un array_list con sus
+# valores en orden de llegada. Agregar un valor recorre la tabla una sola vez
+# (map_compact.get_or_create), aunque la llave sea nueva.
+
+
+def new_multimap(num_elements, load_factor=0.5):
+    return {
+        "map": mp.new_map(num_elements, load_factor),
+        "size": 0
+    }
+
+def add(my_multimap, key, value):
+    values = mp.get_or_create(my_multimap["map"], key, lt.new_list)
+    lt.add_last(values, value)
+    my_multimap["size"] += 1
+    return my_multimap
+
+def get_all(my_multimap, key):
+    """
+    Retorna el array_list con los valores de key, o None si key no tiene
+    ninguno. La lista es la del multimapa, no una copia.
+    """
+    return mp.get(my_multimap["map"], key)
+
+def contains(my_multimap, key):
+    return mp.contains(my_multimap["map"], key)
+
+def remove(my_multimap, key):
+    # Quita key con todos sus valores
+    values = mp.get(my_multimap["map"], key)
+    if values is None:
+        return False
+    mp.remove(my_multimap["map"], key)
+    my_multimap["size"] -= lt.size(values)
+    return True
+
+def size(my_multimap):
+    # Total de valores, sumando todas las llaves
+    return my_multimap["size"]
+
+def key_count(my_multimap):
+    return mp.size(my_multimap["map"])
+
+def is_empty(my_multimap):
+    return my_multimap["size"] == 0
+
+def key_set(my_multimap):
+    return mp.key_set(my_multimap["map"])
+
+def sort_values(my_multimap, sort_key, reverse=False, keys=None):
+    """
+    Ordena los valores de cada llave por sort_key (orden estable, como
+    sorted). Con keys solo se ordenan las llaves de ese iterable.
+    """
+    if keys is None:
+        keys = mp.key_set(my_multimap["map"])["elements"]
+    for key in keys:
+        values = mp.get(my_multimap["map"], key)
+        if values is not None:
+            lt.sort_by(values, sort_key, reverse)
+    return my_multimap
+
+def group_by(iterable, key_fn, sort_key=None, reverse=False, num_elements=16,
+             load_factor=0.5):
+    """
+    Construye un multimapa con cada elemento de iterable bajo la llave
+    key_fn(elemento). Si varios elementos seguidos tienen la misma llave solo
+    se busca la primera vez. Con sort_key, al final se ordenan los valores de
+    cada llave como en sort_values.
+    """
+    my_multimap = new_multimap(num_elements, load_factor)
+    table = my_multimap["map"]
+    values = None
+    last_key = None
+    n = 0
+    for element in iterable:
+        key = key_fn(element)
+        if values is None or key != last_key:
+            values = mp.get_or_create(table, key, lt.new_list)
+            last_key = key
+        lt.add_last(values, element)
+        n += 1
+    my_multimap["size"] = n
+    if sort_key is not None:
+        sort_values(my_multimap, sort_key, reverse)
+    return my_multimap
@@ -0,0 +1,53 @@
+from DataStructures.PriorityQueue import binary_heap as pq
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+values = [30, 50, 22, 10, 11, 13, 15, 14, 12, 17, 19, 18, 16, 20, 21]
+
+def setup_list():
+    my_list = lt.new_list()
+    for value in values:
+        lt.add_last(my_list, value)
+    return my_list
+
+@handle_not_implemented
+def test_new_heap():
+    my_heap = pq.new_heap()
+
+    assert type(my_heap) == dict
+    assert pq.is_empty(my_heap)
+    assert pq.size(my_heap) == 0
+    assert pq.peek(my_heap) is None
+    assert pq.del_min(my_heap) is None
+
+@handle_not_implemented
+def test_insert_and_del_min():
+    my_heap = pq.new_heap()
+    for value in values:
+        pq.insert(my_heap, "v" + str(value), value)
+    assert pq.size(my_heap) == 15
+    assert pq.peek(my_heap) == "v10"
+    assert pq.peek_priority(my_heap) == 10
+
+    assert pq.del_min(my_heap) == "v10"
+    assert pq.del_min(my_heap) == "v11"
+    assert pq.size(my_heap) == 13
+
+@handle_not_implemented
+def test_max_heap():
+    my_heap = pq.new_heap(is_min_pq=False)
+    for value in values:
+        pq.insert(my_heap, value, value)
+    assert pq.drain(my_heap)["elements"] == sorted(values, reverse=True)
+    assert pq.is_empty(my_heap)
+
+@handle_not_implemented
+def test_heapify():
+    my_heap = pq.heapify(setup_list())
+    assert pq.size(my_heap) == 15
+    assert pq.drain(my_heap)["elements"] == sorted(values)
+
+    # Prioridad dada por una función sobre cada valor
+    my_heap = pq.heapify(setup_list(), key_fn=lambda v: -v)
+    assert pq.peek(my_heap) == 50
+    assert pq.peek_priority(my_heap) == -50
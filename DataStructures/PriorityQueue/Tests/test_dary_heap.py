@@ -0,0 +1,37 @@
+from DataStructures.PriorityQueue import dary_heap as pq
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+values = [30, 50, 22, 10, 11, 13, 15, 14, 12, 17, 19, 18, 16, 20, 21]
+
+@handle_not_implemented
+def test_new_heap():
+    my_heap = pq.new_heap(3)
+
+    assert pq.is_empty(my_heap)
+    assert my_heap["d"] == 3
+    assert pq.del_min(my_heap) is None
+    try:
+        pq.new_heap(1)
+        assert False
+    except ValueError:
+        pass
+
+@handle_not_implemented
+def test_insert_and_del_min():
+    for d in (2, 3, 4, 8):
+        my_heap = pq.new_heap(d)
+        for value in values:
+            pq.insert(my_heap, value, value)
+        assert pq.peek(my_heap) == 10
+        assert pq.drain(my_heap)["elements"] == sorted(values)
+
+@handle_not_implemented
+def test_heapify():
+    my_list = lt.new_list()
+    for value in values:
+        lt.add_last(my_list, value)
+    for d in (2, 3, 5):
+        my_heap = pq.heapify(my_list, d, is_min_pq=False)
+        assert pq.size(my_heap) == 15
+        assert pq.drain(my_heap)["elements"] == sorted(values, reverse=True)
@@ -0,0 +1,64 @@
+from DataStructures.PriorityQueue import indexed_min_pq as pq
+from DataStructures.Utils.utils import handle_not_implemented
+
+priorities = [30, 50, 22, 10, 11, 13, 15, 14, 12, 17]
+
+def setup_pq():
+    my_pq = pq.new_pq(20)
+    for index, priority in enumerate(priorities):
+        pq.insert(my_pq, index, priority)
+    return my_pq
+
+@handle_not_implemented
+def test_new_pq():
+    my_pq = pq.new_pq(5)
+
+    assert pq.is_empty(my_pq)
+    assert pq.del_min(my_pq) is None
+    assert pq.min_index(my_pq) is None
+    assert not pq.contains(my_pq, 4)
+
+@handle_not_implemented
+def test_insert_and_del_min():
+    my_pq = setup_pq()
+    assert pq.size(my_pq) == 10
+    assert pq.min_index(my_pq) == 3
+    assert pq.min_priority(my_pq) == 10
+    assert pq.get_priority(my_pq, 1) == 50
+    assert pq.get_priority(my_pq, 15) is None
+
+    order = [pq.del_min(my_pq) for _ in range(10)]
+    assert order == sorted(range(10), key=lambda i: priorities[i])
+    assert pq.is_empty(my_pq)
+
+@handle_not_implemented
+def test_decrease_key():
+    my_pq = setup_pq()
+    pq.decrease_key(my_pq, 1, 5)
+    assert pq.min_index(my_pq) == 1
+    assert pq.get_priority(my_pq, 1) == 5
+
+    for bad_call in (lambda: pq.decrease_key(my_pq, 1, 40),
+                     lambda: pq.decrease_key(my_pq, 15, 1),
+                     lambda: pq.insert(my_pq, 1, 3)):
+        try:
+            bad_call()
+            assert False
+        except ValueError:
+            pass
+
+@handle_not_implemented
+def test_change_and_remove():
+    my_pq = setup_pq()
+    pq.change_priority(my_pq, 3, 100)
+    assert pq.min_index(my_pq) == 4
+    assert pq.remove(my_pq, 4)
+    assert not pq.remove(my_pq, 4)
+    assert not pq.contains(my_pq, 4)
+    assert pq.del_min(my_pq) == 8
+    assert pq.size(my_pq) == 8
+    try:
+        pq.contains(my_pq, 20)
+        assert False
+    except IndexError:
+        pass
@@ -0,0 +1,156 @@
+"""
+  Cola de prioridad implementada como montículo binario (heap) sobre un
+  arreglo.
+
+  Cada elemento se guarda como la tupla (prioridad, valor) en "elements";
+  los hijos de la posición i están en 2i+1 y 2i+2. Las prioridades se
+  comparan con cmp_function (-1, 0 o 1, como en los mapas ordenados). Con
+  is_min_pq=True el tope es la menor prioridad y con False la mayor. Entre
+  prioridades iguales no se garantiza ningún orden.
+"""
+
+import DataStructures.List.array_list as lt
+
+
+def default_compare(priority, other_priority):
+    if priority == other_priority:
+        return 0
+    elif priority > other_priority:
+        return 1
+    return -1
+
+
+def new_heap(is_min_pq=True, cmp_function=None):
+    """ Crea una cola de prioridad vacía
+
+        :param is_min_pq: True para sacar primero la menor prioridad, False
+            para la mayor
+        :type is_min_pq: bool
+        :param cmp_function: Función de comparación entre prioridades
+        :type cmp_function: function
+
+        :returns: Cola de prioridad creada
+        :rtype: dict
+    """
+    if cmp_function is None:
+        cmp_function = default_compare
+    return {
+        "elements": [],
+        "size": 0,
+        "cmp_function": cmp_function,
+        "sign": 1 if is_min_pq else -1
+    }
+
+
+def heapify(my_list, key_fn=None, is_min_pq=True, cmp_function=None):
+    """ Crea una cola de prioridad con los elementos de un array_list en
+        O(n), sin insertarlos uno por uno
+
+        :param my_list: Valores a guardar
+        :type my_list: array_list
+        :param key_fn: Función valor -> prioridad (por defecto el mismo valor)
+        :type key_fn: function
+
+        :returns: Cola de prioridad creada
+        :rtype: dict
+    """
+    my_heap = new_heap(is_min_pq, cmp_function)
+    values = my_list["elements"]
+    if key_fn is None:
+        elements = [(value, value) for value in values]
+    else:
+        elements = [(key_fn(value), value) for value in values]
+    my_heap["elements"] = elements
+    my_heap["size"] = len(elements)
+    for pos in range(len(elements) // 2 - 1, -1, -1):
+        _sink(my_heap, pos)
+    return my_heap
+
+
+def _above(my_heap, priority, other_priority):
+    # True si priority debe quedar más arriba que other_priority
+    return my_heap["cmp_function"](priority, other_priority) * my_heap["sign"] < 0
+
+
+def _swim(my_heap, pos):
+    # Sube el elemento de pos mientras su padre deba ir debajo de él
+    elements = my_heap["elements"]
+    entry = elements[pos]
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _above(my_heap, entry[0], elements[parent][0]):
+            break
+        elements[pos] = elements[parent]
+        pos = parent
+    elements[pos] = entry
+
+
+def _sink(my_heap, pos):
+    # Baja el elemento de pos mientras alguno de sus hijos deba ir encima
+    elements = my_heap["elements"]
+    n = my_heap["size"]
+    entry = elements[pos]
+    child = 2 * pos + 1
+    while child < n:
+        if child + 1 < n and _above(my_heap, elements[child + 1][0], elements[child][0]):
+            child += 1
+        if not _above(my_heap, elements[child][0], entry[0]):
+            break
+        elements[pos] = elements[child]
+        pos = child
+        child = 2 * pos + 1
+    elements[pos] = entry
+
+
+def insert(my_heap, value, priority):
+    my_heap["elements"].append((priority, value))
+    my_heap["size"] += 1
+    _swim(my_heap, my_heap["size"] - 1)
+    return my_heap
+
+
+def del_min(my_heap):
+    """ Saca el elemento del tope y retorna su valor, o None si la cola está
+        vacía. Con is_min_pq=False el tope es el de mayor prioridad.
+    """
+    if my_heap["size"] == 0:
+        return None
+    elements = my_heap["elements"]
+    top = elements[0]
+    last = elements.pop()
+    my_heap["size"] -= 1
+    if my_heap["size"] > 0:
+        elements[0] = last
+        _sink(my_heap, 0)
+    return top[1]
+
+
+def peek(my_heap):
+    # Valor del tope sin sacarlo
+    if my_heap["size"] == 0:
+        return None
+    return my_heap["elements"][0][1]
+
+
+def peek_priority(my_heap):
+    if my_heap["size"] == 0:
+        return None
+    return my_heap["elements"][0][0]
+
+
+def size(my_heap):
+    return my_heap["size"]
+
+
+def is_empty(my_heap):
+    return my_heap["size"] == 0
+
+
+def drain(my_heap):
+    """ Saca todos los elementos y los retorna en un array_list, en el orden
+        en que salen del tope. La cola queda vacía.
+    """
+    result = lt.new_list()
+    while my_heap["size"] > 0:
+        lt.add_last(result, del_min(my_heap))
+    return result
@@ -0,0 +1,133 @@
+"""
+  Cola de prioridad sobre un montículo d-ario: como binary_heap, pero cada
+  nodo tiene d hijos, en las posiciones d*i+1 ... d*i+d.
+
+  Con d mayor el árbol es más bajo: insert sube por menos niveles y del_min
+  baja por menos niveles aunque compara d hijos en cada uno. Conviene cuando
+  hay muchas más inserciones que extracciones (por ejemplo, un top-K sobre
+  un recorrido largo). Los elementos y las comparaciones son los mismos de
+  binary_heap.
+"""
+
+import DataStructures.List.array_list as lt
+import DataStructures.PriorityQueue.binary_heap as bh
+
+
+def new_heap(d=4, is_min_pq=True, cmp_function=None):
+    """ Crea una cola de prioridad vacía
+
+        :param d: Número de hijos de cada nodo (al menos 2)
+        :type d: int
+        :param is_min_pq: True para sacar primero la menor prioridad, False
+            para la mayor
+        :type is_min_pq: bool
+        :param cmp_function: Función de comparación entre prioridades
+        :type cmp_function: function
+
+        :returns: Cola de prioridad creada
+        :rtype: dict
+    """
+    if d < 2:
+        raise ValueError("d must be at least 2")
+    my_heap = bh.new_heap(is_min_pq, cmp_function)
+    my_heap["d"] = d
+    return my_heap
+
+
+def heapify(my_list, d=4, key_fn=None, is_min_pq=True, cmp_function=None):
+    """ Crea una cola de prioridad con los elementos de un array_list en O(n)
+    """
+    my_heap = new_heap(d, is_min_pq, cmp_function)
+    values = my_list["elements"]
+    if key_fn is None:
+        elements = [(value, value) for value in values]
+    else:
+        elements = [(key_fn(value), value) for value in values]
+    my_heap["elements"] = elements
+    my_heap["size"] = len(elements)
+    for pos in range((len(elements) - 2) // d, -1, -1):
+        _sink(my_heap, pos)
+    return my_heap
+
+
+def _above(my_heap, priority, other_priority):
+    return my_heap["cmp_function"](priority, other_priority) * my_heap["sign"] < 0
+
+
+def _swim(my_heap, pos):
+    elements = my_heap["elements"]
+    d = my_heap["d"]
+    entry = elements[pos]
+    while pos > 0:
+        parent = (pos - 1) // d
+        if not _above(my_heap, entry[0], elements[parent][0]):
+            break
+        elements[pos] = elements[parent]
+        pos = parent
+    elements[pos] = entry
+
+
+def _sink(my_heap, pos):
+    elements = my_heap["elements"]
+    n = my_heap["size"]
+    d = my_heap["d"]
+    entry = elements[pos]
+    first_child = d * pos + 1
+    while first_child < n:
+        # El hijo que debe quedar más arriba entre los d
+        best = first_child
+        for child in range(first_child + 1, min(first_child + d, n)):
+            if _above(my_heap, elements[child][0], elements[best][0]):
+                best = child
+        if not _above(my_heap, elements[best][0], entry[0]):
+            break
+        elements[pos] = elements[best]
+        pos = best
+        first_child = d * pos + 1
+    elements[pos] = entry
+
+
+def insert(my_heap, value, priority):
+    my_heap["elements"].append((priority, value))
+    my_heap["size"] += 1
+    _swim(my_heap, my_heap["size"] - 1)
+    return my_heap
+
+
+def del_min(my_heap):
+    """ Saca el elemento del tope y retorna su valor, o None si la cola está
+        vacía
+    """
+    if my_heap["size"] == 0:
+        return None
+    elements = my_heap["elements"]
+    top = elements[0]
+    last = elements.pop()
+    my_heap["size"] -= 1
+    if my_heap["size"] > 0:
+        elements[0] = last
+        _sink(my_heap, 0)
+    return top[1]
+
+
+def peek(my_heap):
+    return bh.peek(my_heap)
+
+
+def peek_priority(my_heap):
+    return bh.peek_priority(my_heap)
+
+
+def size(my_heap):
+    return my_heap["size"]
+
+
+def is_empty(my_heap):
+    return my_heap["size"] == 0
+
+
+def drain(my_heap):
+    result = lt.new_list()
+    while my_heap["size"] > 0:
+        lt.add_last(result, del_min(my_heap))
+    return result
@@ -0,0 +1,177 @@
+"""
+  Cola de prioridad indexada de mínimos.
+
+  Cada elemento es un índice entero entre 0 y capacity - 1 (por ejemplo, la
+  fila de un viaje en el catálogo) con una prioridad. Además del montículo
+  binario de índices ("heap") se guarda la posición de cada índice en el
+  montículo ("positions", -1 si no está) y su prioridad ("priorities"), así
+  que se puede consultar, cambiar o borrar la prioridad de un índice en
+  O(log n) sin buscarlo.
+"""
+
+import DataStructures.PriorityQueue.binary_heap as bh
+
+
+def new_pq(capacity, cmp_function=None):
+    """ Crea una cola indexada vacía para los índices 0 .. capacity - 1
+
+        :param capacity: Número de índices posibles
+        :type capacity: int
+        :param cmp_function: Función de comparación entre prioridades
+        :type cmp_function: function
+
+        :returns: Cola creada
+        :rtype: dict
+    """
+    if cmp_function is None:
+        cmp_function = bh.default_compare
+    return {
+        "heap": [],
+        "positions": [-1] * capacity,
+        "priorities": [None] * capacity,
+        "capacity": capacity,
+        "cmp_function": cmp_function
+    }
+
+
+def _check_index(my_pq, index):
+    if index < 0 or index >= my_pq["capacity"]:
+        raise IndexError("index out of range")
+
+
+def _less(my_pq, index, other_index):
+    priorities = my_pq["priorities"]
+    return my_pq["cmp_function"](priorities[index], priorities[other_index]) < 0
+
+
+def _swim(my_pq, pos):
+    heap = my_pq["heap"]
+    positions = my_pq["positions"]
+    index = heap[pos]
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if not _less(my_pq, index, heap[parent]):
+            break
+        heap[pos] = heap[parent]
+        positions[heap[pos]] = pos
+        pos = parent
+    heap[pos] = index
+    positions[index] = pos
+
+
+def _sink(my_pq, pos):
+    heap = my_pq["heap"]
+    positions = my_pq["positions"]
+    n = len(heap)
+    index = heap[pos]
+    child = 2 * pos + 1
+    while child < n:
+        if child + 1 < n and _less(my_pq, heap[child + 1], heap[child]):
+            child += 1
+        if not _less(my_pq, heap[child], index):
+            break
+        heap[pos] = heap[child]
+        positions[heap[pos]] = pos
+        pos = child
+        child = 2 * pos + 1
+    heap[pos] = index
+    positions[index] = pos
+
+
+def contains(my_pq, index):
+    _check_index(my_pq, index)
+    return my_pq["positions"][index] != -1
+
+
+def insert(my_pq, index, priority):
+    """ Agrega index con la prioridad dada. Lanza ValueError si index ya
+        está en la cola.
+    """
+    if contains(my_pq, index):
+        raise ValueError("index is already in the priority queue")
+    my_pq["priorities"][index] = priority
+    my_pq["heap"].append(index)
+    _swim(my_pq, len(my_pq["heap"]) - 1)
+    return my_pq
+
+
+def get_priority(my_pq, index):
+    if not contains(my_pq, index):
+        return None
+    return my_pq["priorities"][index]
+
+
+def decrease_key(my_pq, index, priority):
+    """ Baja la prioridad de index. Lanza ValueError si index no está o si
+        priority no es menor o igual a la actual.
+    """
+    if not contains(my_pq, index):
+        raise ValueError("index is not in the priority queue")
+    if my_pq["cmp_function"](priority, my_pq["priorities"][index]) > 0:
+        raise ValueError("priority is greater than the current one")
+    my_pq["priorities"][index] = priority
+    _swim(my_pq, my_pq["positions"][index])
+    return my_pq
+
+
+def change_priority(my_pq, index, priority):
+    # Cambia la prioridad de index, sea mayor o menor que la actual
+    if not contains(my_pq, index):
+        raise ValueError("index is not in the priority queue")
+    my_pq["priorities"][index] = priority
+    pos = my_pq["positions"][index]
+    _swim(my_pq, pos)
+    _sink(my_pq, my_pq["positions"][index])
+    return my_pq
+
+
+def _remove_at(my_pq, pos):
+    heap = my_pq["heap"]
+    index = heap[pos]
+    last = heap.pop()
+    if pos < len(heap):
+        heap[pos] = last
+        my_pq["positions"][last] = pos
+        _swim(my_pq, pos)
+        _sink(my_pq, my_pq["positions"][last])
+    my_pq["positions"][index] = -1
+    my_pq["priorities"][index] = None
+    return index
+
+
+def remove(my_pq, index):
+    """ Saca index de la cola. Retorna True si estaba.
+    """
+    if not contains(my_pq, index):
+        return False
+    _remove_at(my_pq, my_pq["positions"][index])
+    return True
+
+
+def del_min(my_pq):
+    """ Saca el índice de menor prioridad y lo retorna, o None si la cola está
+        vacía
+    """
+    if len(my_pq["heap"]) == 0:
+        return None
+    return _remove_at(my_pq, 0)
+
+
+def min_index(my_pq):
+    if len(my_pq["heap"]) == 0:
+        return None
+    return my_pq["heap"][0]
+
+
+def min_priority(my_pq):
+    if len(my_pq["heap"]) == 0:
+        return None
+    return my_pq["priorities"][my_pq["heap"][0]]
+
+
+def size(my_pq):
+    return len(my_pq["heap"])
+
+
+def is_empty(my_pq):
+    return len(my_pq["heap"]) == 0
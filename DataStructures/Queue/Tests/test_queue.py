@@ -77,3 +77,16 @@ def test_size():
 
     queue.dequeue(my_queue)
     assert queue.size(my_queue) == 2
+
+@handle_not_implemented
+def test_backends():
+    # La cola se comporta igual sobre cualquiera de sus estructuras
+    for backend in ("single_linked_list", "doubly_linked_list", "deque"):
+        my_queue = queue.new_queue(backend)
+        for i in range(20):
+            queue.enqueue(my_queue, i)
+        assert queue.peek(my_queue) == 0
+        assert [queue.dequeue(my_queue) for _ in range(15)] == list(range(15))
+        queue.enqueue(my_queue, 20)
+        assert queue.size(my_queue) == 6
+        assert queue.peek(my_queue) == 15
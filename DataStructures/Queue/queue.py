@@ -1,21 +1,40 @@
 from DataStructures.List import single_linked_list as sl
-
-def new_queue():
-    return sl.new_list()
+from DataStructures.List import doubly_linked_list as dl
+from DataStructures.Deque import deque as dq
+
+# Estructuras que pueden guardar los elementos de la cola, con la función que
+# crea cada una. Todas tienen add_last, remove_first, first_element, size e
+# is_empty en O(1); "deque" usa un arreglo circular y no crea un nodo por
+# elemento.
+_BACKENDS = {
+    "single_linked_list": (sl, sl.new_list),
+    "doubly_linked_list": (dl, dl.new_list),
+    "deque": (dq, dq.new_deque)
+}
+
+def _backend(my_queue):
+    return _BACKENDS[my_queue.get("backend", "single_linked_list")][0]
+
+def new_queue(backend="single_linked_list"):
+    if backend not in _BACKENDS:
+        raise ValueError("backend must be one of " + ", ".join(_BACKENDS))
+    my_queue = _BACKENDS[backend][1]()
+    my_queue["backend"] = backend
+    return my_queue
 
 def enqueue(my_queue, element):
-    return sl.add_last(my_queue, element)
+    return _backend(my_queue).add_last(my_queue, element)
 
 def dequeue(my_queue):
-    return sl.remove_first(my_queue)
+    return _backend(my_queue).remove_first(my_queue)
 
 
 def is_empty(my_queue):
-    return sl.is_empty(my_queue)
+    return _backend(my_queue).is_empty(my_queue)
 
 def peek(my_queue):
-    return sl.first_element(my_queue)
+    return _backend(my_queue).first_element(my_queue)
 
 
 def size(my_queue):
-    return sl.size(my_queue)
\ No newline at end of file
+    return _backend(my_queue).size(my_queue)
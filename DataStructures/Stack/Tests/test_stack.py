@@ -77,3 +77,15 @@ def test_size():
 
     stack.pop(my_stack)
     assert stack.size(my_stack) == 2
+
+@handle_not_implemented
+def test_backends():
+    # La pila se comporta igual sobre cualquiera de sus estructuras
+    for backend in ("single_linked_list", "doubly_linked_list", "deque"):
+        my_stack = stack.new_stack(backend)
+        for i in range(20):
+            stack.push(my_stack, i)
+        assert stack.top(my_stack) == 19
+        assert [stack.pop(my_stack) for _ in range(15)] == list(range(19, 4, -1))
+        assert stack.size(my_stack) == 5
+        assert stack.top(my_stack) == 4
@@ -1,23 +1,41 @@
 from DataStructures.List import single_linked_list as sl
+from DataStructures.List import doubly_linked_list as dl
+from DataStructures.Deque import deque as dq
 
-def new_stack():
-    return sl.new_list()
+# Estructuras que pueden guardar los elementos de la pila, con la función que
+# crea cada una. El tope es el primer elemento; todas tienen add_first,
+# remove_first, first_element, size e is_empty en O(1).
+_BACKENDS = {
+    "single_linked_list": (sl, sl.new_list),
+    "doubly_linked_list": (dl, dl.new_list),
+    "deque": (dq, dq.new_deque)
+}
+
+def _backend(my_stack):
+    return _BACKENDS[my_stack.get("backend", "single_linked_list")][0]
+
+def new_stack(backend="single_linked_list"):
+    if backend not in _BACKENDS:
+        raise ValueError("backend must be one of " + ", ".join(_BACKENDS))
+    my_stack = _BACKENDS[backend][1]()
+    my_stack["backend"] = backend
+    return my_stack
 
 def push(my_stack, element):
-    return sl.add_first(my_stack, element)
+    return _backend(my_stack).add_first(my_stack, element)
 
 def pop(my_stack):
-    if sl.is_empty(my_stack):
+    if is_empty(my_stack):
         raise Exception("EmptyStructureError: stack is empty")
-    return sl.remove_first(my_stack)
+    return _backend(my_stack).remove_first(my_stack)
 
 def is_empty(my_stack):
-    return sl.is_empty(my_stack)
+    return _backend(my_stack).is_empty(my_stack)
 
 def top(my_stack):
-    if sl.is_empty(my_stack):
+    if is_empty(my_stack):
         raise Exception("EmptyStructureError: stack is empty")
-    return sl.first_element(my_stack)
+    return _backend(my_stack).first_element(my_stack)
 
 def size(my_stack):
-    return sl.size(my_stack)
\ No newline at end of file
+    return _backend(my_stack).size(my_stack)
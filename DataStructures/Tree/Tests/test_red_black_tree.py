@@ -0,0 +1,159 @@
+from DataStructures.Tree import red_black_tree as rbt
+from DataStructures.Tree import rbt_node as rbn
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    # Árbol con las llaves 10, 20, ..., 100 y valor igual a la llave / 10
+    tree = rbt.new_map()
+    for key in [50, 20, 80, 10, 30, 60, 90, 40, 70, 100]:
+        rbt.put(tree, key, key // 10)
+    return tree
+
+
+def check_invariants(node):
+    # Retorna la altura negra del subárbol y falla si se rompe alguna
+    # invariante del árbol rojo-negro inclinado a la izquierda
+    if node is None:
+        return 0
+    assert not rbn.is_red(node["right"])
+    assert not (rbn.is_red(node) and rbn.is_red(node["left"]))
+    left = check_invariants(node["left"])
+    right = check_invariants(node["right"])
+    assert left == right
+    assert node["size"] == 1 + (node["left"] or {"size": 0})["size"] + \
+        (node["right"] or {"size": 0})["size"]
+    return left + (0 if rbn.is_red(node) else 1)
+
+
+@handle_not_implemented
+def test_new_map():
+    tree = rbt.new_map()
+    assert tree["root"] is None
+    assert rbt.size(tree) == 0
+    assert rbt.is_empty(tree)
+    assert rbt.get_min(tree) is None
+    assert rbt.get_max(tree) is None
+
+
+@handle_not_implemented
+def test_put():
+    tree = setup_tests()
+    assert rbt.size(tree) == 10
+    assert not rbn.is_red(tree["root"])
+    check_invariants(tree["root"])
+
+    rbt.put(tree, 50, "X")
+    assert rbt.size(tree) == 10
+    assert rbt.get(tree, 50) == "X"
+
+
+@handle_not_implemented
+def test_put_sorted_keys():
+    tree = rbt.new_map()
+    for key in range(1000):
+        rbt.put(tree, key, key)
+    check_invariants(tree["root"])
+    assert rbt.height(tree) <= 20
+
+
+@handle_not_implemented
+def test_get():
+    tree = setup_tests()
+    assert rbt.get(tree, 30) == 3
+    assert rbt.get(tree, 35) is None
+    assert rbt.contains(tree, 30)
+    assert not rbt.contains(tree, 35)
+
+
+@handle_not_implemented
+def test_min_max():
+    tree = setup_tests()
+    assert rbt.get_min(tree) == 10
+    assert rbt.get_max(tree) == 100
+
+
+@handle_not_implemented
+def test_floor_ceiling():
+    tree = setup_tests()
+    assert rbt.floor(tree, 35) == 30
+    assert rbt.floor(tree, 30) == 30
+    assert rbt.floor(tree, 5) is None
+    assert rbt.ceiling(tree, 35) == 40
+    assert rbt.ceiling(tree, 40) == 40
+    assert rbt.ceiling(tree, 105) is None
+
+
+@handle_not_implemented
+def test_rank_select():
+    tree = setup_tests()
+    assert rbt.rank(tree, 10) == 0
+    assert rbt.rank(tree, 35) == 3
+    assert rbt.rank(tree, 200) == 10
+    for pos in range(10):
+        assert rbt.select(tree, pos) == (pos + 1) * 10
+        assert rbt.rank(tree, rbt.select(tree, pos)) == pos
+    assert rbt.select(tree, 10) is None
+    assert rbt.select(tree, -1) is None
+
+
+@handle_not_implemented
+def test_keys_values():
+    tree = setup_tests()
+    assert rbt.keys(tree, 25, 70)["elements"] == [30, 40, 50, 60, 70]
+    assert rbt.values(tree, 25, 70)["elements"] == [3, 4, 5, 6, 7]
+    assert lt.size(rbt.keys(tree, 101, 200)) == 0
+    assert rbt.key_set(tree)["elements"] == list(range(10, 101, 10))
+    assert rbt.value_set(tree)["elements"] == list(range(1, 11))
+
+
+@handle_not_implemented
+def test_remove():
+    tree = setup_tests()
+    assert rbt.remove(tree, 50)
+    assert not rbt.remove(tree, 50)
+    assert rbt.size(tree) == 9
+    assert not rbt.contains(tree, 50)
+    check_invariants(tree["root"])
+
+    for key in range(10, 101, 10):
+        rbt.remove(tree, key)
+        check_invariants(tree["root"])
+    assert rbt.is_empty(tree)
+
+
+@handle_not_implemented
+def test_delete_min_max():
+    tree = setup_tests()
+    rbt.delete_min(tree)
+    rbt.delete_max(tree)
+    check_invariants(tree["root"])
+    assert rbt.size(tree) == 8
+    assert rbt.get_min(tree) == 20
+    assert rbt.get_max(tree) == 90
+
+
+@handle_not_implemented
+def test_duplicates():
+    tree = rbt.new_map(allow_duplicates=True)
+    rbt.put(tree, "b", 1)
+    rbt.put(tree, "a", 2)
+    rbt.put(tree, "b", 3)
+    assert rbt.size(tree) == 2
+    assert rbt.get(tree, "b")["elements"] == [1, 3]
+    assert rbt.values(tree, "a", "b")["elements"] == [2, 1, 3]
+    rbt.remove(tree, "b")
+    assert rbt.value_set(tree)["elements"] == [2]
+
+
+@handle_not_implemented
+def test_cmp_function():
+    def reverse_compare(key, element_key):
+        return -rbt.default_compare(key, element_key)
+
+    tree = rbt.new_map(cmp_function=reverse_compare)
+    for key in [3, 1, 2]:
+        rbt.put(tree, key, key)
+    assert rbt.key_set(tree)["elements"] == [3, 2, 1]
+    assert rbt.get_min(tree) == 3
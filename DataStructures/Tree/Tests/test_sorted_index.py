@@ -0,0 +1,110 @@
+from array import array
+from DataStructures.Tree import sorted_index as si
+from DataStructures.List import array_list as lt
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def setup_tests():
+    # Llave de cada fila: la fila 0 tiene 3.0, la fila 1 tiene 1.0, ...
+    keys = array("d", [3.0, 1.0, 2.0, 5.0, 2.0, 4.0, 2.0])
+    return keys, si.new_index(keys)
+
+
+@handle_not_implemented
+def test_new_index():
+    keys, index = setup_tests()
+    assert si.size(index) == 7
+    assert not si.is_empty(index)
+    assert list(index["keys"]) == [1.0, 2.0, 2.0, 2.0, 3.0, 4.0, 5.0]
+    # Los empates quedan en el orden de las filas
+    assert list(index["rows"]) == [1, 2, 4, 6, 0, 5, 3]
+    assert si.get_min(index) == 1.0
+    assert si.get_max(index) == 5.0
+
+    empty = si.new_index(array("d"))
+    assert si.is_empty(empty)
+    assert si.get_min(empty) is None
+
+
+@handle_not_implemented
+def test_tie_key():
+    keys = array("d", [3.0, 1.0, 2.0, 5.0, 2.0, 4.0, 2.0])
+    index = si.new_index(keys, tie_key=lambda r: -r)
+    assert list(index["rows"]) == [1, 6, 4, 2, 0, 5, 3]
+
+    index = si.new_index(keys, rows=[0, 2, 4])
+    assert list(index["rows"]) == [2, 4, 0]
+
+
+@handle_not_implemented
+def test_count():
+    keys, index = setup_tests()
+    assert si.count(index, 2.0, 3.0) == 4
+    assert si.count(index, 2.5, 2.9) == 0
+    assert si.count(index, 0.0, 10.0) == 7
+    assert si.count(index, 4.0, 2.0) == 0
+
+
+@handle_not_implemented
+def test_values():
+    keys, index = setup_tests()
+    assert si.values(index, 2.0, 3.0)["elements"] == [2, 4, 6, 0]
+    assert si.values(index, 2.0, 3.0, reverse=True)["elements"] == [0, 6, 4, 2]
+    assert si.keys(index, 3.5, 10.0)["elements"] == [4.0, 5.0]
+    assert lt.size(si.values(index, 6.0, 7.0)) == 0
+
+
+@handle_not_implemented
+def test_first_last_k():
+    keys, index = setup_tests()
+    assert si.first_k(index, 2.0, 5.0, 2)["elements"] == [2, 4]
+    assert si.last_k(index, 2.0, 5.0, 2)["elements"] == [5, 3]
+    assert si.first_k(index, 2.0, 2.0, 10)["elements"] == [2, 4, 6]
+    assert si.last_k(index, 2.0, 2.0, 10)["elements"] == [2, 4, 6]
+
+
+@handle_not_implemented
+def test_iterate():
+    keys, index = setup_tests()
+    assert list(si.iterate(index, 1.0, 3.0)) == [1, 2, 4, 6, 0]
+    assert list(si.iterate(index, 1.0, 3.0, reverse=True)) == [0, 6, 4, 2, 1]
+
+
+@handle_not_implemented
+def test_insert():
+    keys, index = setup_tests()
+    keys.extend([2.0, 6.0, 0.5])
+    si.insert(index, keys, [7, 8, 9])
+    assert list(index["rows"]) == [9, 1, 2, 4, 6, 7, 0, 5, 3, 8]
+    assert list(index["keys"]) == sorted(keys)
+
+    # Mismo resultado que construir el índice desde cero
+    assert index == si.new_index(keys)
+
+
+@handle_not_implemented
+def test_merge_rows():
+    keys, index = setup_tests()
+    rows = array("l", index["rows"])
+    keys.extend([2.0, 6.0, 0.5])
+    merged = si.merge_rows(rows, [8, 7, 9], keys.__getitem__)
+    # Se mezcla en el mismo arreglo; la fila 7 empata con 2, 4 y 6 y queda
+    # después de ellas
+    assert merged is rows
+    assert list(rows) == [9, 1, 2, 4, 6, 7, 0, 5, 3, 8]
+    assert list(si.merge_rows(rows, [], keys.__getitem__)) == list(rows)
+
+
+@handle_not_implemented
+def test_mutable():
+    # Un memoryview (como los de un snapshot) se copia a un arreglo que puede
+    # crecer; los demás arreglos se retornan sin copiar
+    rows = array("l", [3, 1, 2])
+    copy = si.mutable(memoryview(rows))
+    assert isinstance(copy, array) and copy.typecode == "l"
+    copy.append(4)
+    assert list(copy) == [3, 1, 2, 4]
+    assert si.mutable(rows) is rows
+
+    data = si.mutable(memoryview(bytearray(b"ab")))
+    assert isinstance(data, bytearray) and data == b"ab"
@@ -0,0 +1,57 @@
+"""
+  Estructura que contiene la información a guardar en un nodo de un árbol
+  rojo-negro
+"""
+
+RED = 0
+BLACK = 1
+
+
+def new_node(key, value, color=RED):
+    """ Crea un nodo de árbol rojo-negro sin hijos
+
+        :param key: Llave del nodo
+        :type key: any
+        :param value: Valor del nodo
+        :type value: any
+        :param color: Color del enlace que llega al nodo (RED o BLACK)
+        :type color: int
+
+        :returns: Nodo creado
+        :rtype: dict
+    """
+    node = {"key": key,
+            "value": value,
+            "size": 1,
+            "color": color,
+            "left": None,
+            "right": None
+            }
+    return node
+
+
+def is_red(node):
+    """ Indica si el enlace que llega al nodo es rojo. Un nodo None es negro.
+
+        :param node: El nodo a examinar
+        :type node: rbt_node
+
+        :returns: True si el nodo es rojo
+        :rtype: bool
+    """
+    if node is None:
+        return False
+    return node["color"] == RED
+
+
+def get_key(node):
+    return node["key"]
+
+
+def get_value(node):
+    return node["value"]
+
+
+def change_color(node, color):
+    node["color"] = color
+    return node
@@ -0,0 +1,396 @@
+"""
+  Tabla de símbolos ordenada implementada como árbol rojo-negro inclinado a
+  la izquierda (left-leaning red-black BST).
+
+  El árbol es un diccionario con la raíz, la función de comparación y el modo
+  de duplicados. Con allow_duplicates=True cada llave guarda un array_list con
+  todos los valores que se le han dado, en orden de llegada; size, rank y
+  select cuentan llaves distintas.
+"""
+
+import DataStructures.Tree.rbt_node as rbn
+import DataStructures.List.array_list as lt
+
+
+def default_compare(key, element_key):
+    if key == element_key:
+        return 0
+    elif key > element_key:
+        return 1
+    return -1
+
+
+def new_map(allow_duplicates=False, cmp_function=None):
+    if cmp_function is None:
+        cmp_function = default_compare
+    return {
+        "root": None,
+        "cmp_function": cmp_function,
+        "duplicates": allow_duplicates
+    }
+
+
+def _size(node):
+    if node is None:
+        return 0
+    return node["size"]
+
+
+def _update_size(node):
+    node["size"] = 1 + _size(node["left"]) + _size(node["right"])
+
+
+def _rotate_left(h):
+    x = h["right"]
+    h["right"] = x["left"]
+    x["left"] = h
+    x["color"] = h["color"]
+    h["color"] = rbn.RED
+    x["size"] = h["size"]
+    _update_size(h)
+    return x
+
+
+def _rotate_right(h):
+    x = h["left"]
+    h["left"] = x["right"]
+    x["right"] = h
+    x["color"] = h["color"]
+    h["color"] = rbn.RED
+    x["size"] = h["size"]
+    _update_size(h)
+    return x
+
+
+def _flip_colors(h):
+    for node in (h, h["left"], h["right"]):
+        node["color"] = rbn.BLACK if node["color"] == rbn.RED else rbn.RED
+
+
+def _balance(h):
+    # Restaura las invariantes del árbol al subir por el camino de inserción
+    # o eliminación
+    if rbn.is_red(h["right"]) and not rbn.is_red(h["left"]):
+        h = _rotate_left(h)
+    if rbn.is_red(h["left"]) and rbn.is_red(h["left"]["left"]):
+        h = _rotate_right(h)
+    if rbn.is_red(h["left"]) and rbn.is_red(h["right"]):
+        _flip_colors(h)
+    _update_size(h)
+    return h
+
+
+def put(my_rbt, key, value):
+    my_rbt["root"] = _put(my_rbt, my_rbt["root"], key, value)
+    my_rbt["root"]["color"] = rbn.BLACK
+    return my_rbt
+
+
+def _put(my_rbt, h, key, value):
+    if h is None:
+        if my_rbt["duplicates"]:
+            values = lt.new_list()
+            lt.add_last(values, value)
+            return rbn.new_node(key, values)
+        return rbn.new_node(key, value)
+
+    cmp = my_rbt["cmp_function"](key, h["key"])
+    if cmp < 0:
+        h["left"] = _put(my_rbt, h["left"], key, value)
+    elif cmp > 0:
+        h["right"] = _put(my_rbt, h["right"], key, value)
+    elif my_rbt["duplicates"]:
+        lt.add_last(h["value"], value)
+    else:
+        h["value"] = value
+    return _balance(h)
+
+
+def _find(my_rbt, key):
+    cmp_function = my_rbt["cmp_function"]
+    node = my_rbt["root"]
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node
+        node = node["left"] if cmp < 0 else node["right"]
+    return None
+
+
+def get(my_rbt, key):
+    """ Valor de key (en modo duplicados, el array_list con sus valores), o
+        None si key no está
+    """
+    node = _find(my_rbt, key)
+    if node is None:
+        return None
+    return rbn.get_value(node)
+
+
+def contains(my_rbt, key):
+    return _find(my_rbt, key) is not None
+
+
+def size(my_rbt):
+    return _size(my_rbt["root"])
+
+
+def is_empty(my_rbt):
+    return my_rbt["root"] is None
+
+
+def height(my_rbt):
+    return _height(my_rbt["root"])
+
+
+def _height(node):
+    if node is None:
+        return 0
+    return 1 + max(_height(node["left"]), _height(node["right"]))
+
+
+def get_min(my_rbt):
+    node = my_rbt["root"]
+    if node is None:
+        return None
+    while node["left"] is not None:
+        node = node["left"]
+    return node["key"]
+
+
+def get_max(my_rbt):
+    node = my_rbt["root"]
+    if node is None:
+        return None
+    while node["right"] is not None:
+        node = node["right"]
+    return node["key"]
+
+
+def floor(my_rbt, key):
+    """ Mayor llave menor o igual a key, o None si no hay ninguna
+    """
+    cmp_function = my_rbt["cmp_function"]
+    node = my_rbt["root"]
+    best = None
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node["key"]
+        if cmp < 0:
+            node = node["left"]
+        else:
+            best = node["key"]
+            node = node["right"]
+    return best
+
+
+def ceiling(my_rbt, key):
+    """ Menor llave mayor o igual a key, o None si no hay ninguna
+    """
+    cmp_function = my_rbt["cmp_function"]
+    node = my_rbt["root"]
+    best = None
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp == 0:
+            return node["key"]
+        if cmp > 0:
+            node = node["right"]
+        else:
+            best = node["key"]
+            node = node["left"]
+    return best
+
+
+def rank(my_rbt, key):
+    """ Número de llaves estrictamente menores que key
+    """
+    cmp_function = my_rbt["cmp_function"]
+    node = my_rbt["root"]
+    count = 0
+    while node is not None:
+        cmp = cmp_function(key, node["key"])
+        if cmp < 0:
+            node = node["left"]
+        elif cmp > 0:
+            count += 1 + _size(node["left"])
+            node = node["right"]
+        else:
+            return count + _size(node["left"])
+    return count
+
+
+def select(my_rbt, pos):
+    """ Llave en la posición pos (desde 0) del orden, o None si pos está
+        fuera de rango
+    """
+    if pos < 0 or pos >= size(my_rbt):
+        return None
+    node = my_rbt["root"]
+    while node is not None:
+        left = _size(node["left"])
+        if pos < left:
+            node = node["left"]
+        elif pos > left:
+            pos -= left + 1
+            node = node["right"]
+        else:
+            return node["key"]
+    return None
+
+
+def keys(my_rbt, key_initial, key_final):
+    """ array_list con las llaves entre key_initial y key_final (ambas
+        incluidas), en orden ascendente
+    """
+    result = lt.new_list()
+    _collect(my_rbt, my_rbt["root"], key_initial, key_final, result, False)
+    return result
+
+
+def values(my_rbt, key_initial, key_final):
+    """ array_list con los valores de las llaves entre key_initial y
+        key_final (ambas incluidas), en el orden de las llaves. En modo
+        duplicados se incluyen todos los valores de cada llave.
+    """
+    result = lt.new_list()
+    _collect(my_rbt, my_rbt["root"], key_initial, key_final, result, True)
+    return result
+
+
+def _collect(my_rbt, node, lo, hi, result, want_values):
+    # Recorrido en orden que solo baja a los subárboles que cortan [lo, hi]
+    if node is None:
+        return
+    cmp_function = my_rbt["cmp_function"]
+    cmp_lo = cmp_function(lo, node["key"])
+    cmp_hi = cmp_function(hi, node["key"])
+    if cmp_lo < 0:
+        _collect(my_rbt, node["left"], lo, hi, result, want_values)
+    if cmp_lo <= 0 and cmp_hi >= 0:
+        if not want_values:
+            lt.add_last(result, node["key"])
+        elif my_rbt["duplicates"]:
+            for value in node["value"]["elements"]:
+                lt.add_last(result, value)
+        else:
+            lt.add_last(result, node["value"])
+    if cmp_hi > 0:
+        _collect(my_rbt, node["right"], lo, hi, result, want_values)
+
+
+def key_set(my_rbt):
+    if is_empty(my_rbt):
+        return lt.new_list()
+    return keys(my_rbt, get_min(my_rbt), get_max(my_rbt))
+
+
+def value_set(my_rbt):
+    if is_empty(my_rbt):
+        return lt.new_list()
+    return values(my_rbt, get_min(my_rbt), get_max(my_rbt))
+
+
+def _move_red_left(h):
+    # h es rojo y h.left y h.left.left son negros: se vuelve rojo h.left o
+    # uno de sus hijos
+    _flip_colors(h)
+    if rbn.is_red(h["right"]["left"]):
+        h["right"] = _rotate_right(h["right"])
+        h = _rotate_left(h)
+        _flip_colors(h)
+    return h
+
+
+def _move_red_right(h):
+    _flip_colors(h)
+    if rbn.is_red(h["left"]["left"]):
+        h = _rotate_right(h)
+        _flip_colors(h)
+    return h
+
+
+def delete_min(my_rbt):
+    root = my_rbt["root"]
+    if root is None:
+        return my_rbt
+    if not rbn.is_red(root["left"]) and not rbn.is_red(root["right"]):
+        root["color"] = rbn.RED
+    my_rbt["root"] = _delete_min(root)
+    if my_rbt["root"] is not None:
+        my_rbt["root"]["color"] = rbn.BLACK
+    return my_rbt
+
+
+def _delete_min(h):
+    if h["left"] is None:
+        return None
+    if not rbn.is_red(h["left"]) and not rbn.is_red(h["left"]["left"]):
+        h = _move_red_left(h)
+    h["left"] = _delete_min(h["left"])
+    return _balance(h)
+
+
+def delete_max(my_rbt):
+    root = my_rbt["root"]
+    if root is None:
+        return my_rbt
+    if not rbn.is_red(root["left"]) and not rbn.is_red(root["right"]):
+        root["color"] = rbn.RED
+    my_rbt["root"] = _delete_max(root)
+    if my_rbt["root"] is not None:
+        my_rbt["root"]["color"] = rbn.BLACK
+    return my_rbt
+
+
+def _delete_max(h):
+    if rbn.is_red(h["left"]):
+        h = _rotate_right(h)
+    if h["right"] is None:
+        return None
+    if not rbn.is_red(h["right"]) and not rbn.is_red(h["right"]["left"]):
+        h = _move_red_right(h)
+    h["right"] = _delete_max(h["right"])
+    return _balance(h)
+
+
+def remove(my_rbt, key):
+    """ Elimina key (en modo duplicados, con todos sus valores). Retorna
+        True si la llave estaba.
+    """
+    if not contains(my_rbt, key):
+        return False
+    root = my_rbt["root"]
+    if not rbn.is_red(root["left"]) and not rbn.is_red(root["right"]):
+        root["color"] = rbn.RED
+    my_rbt["root"] = _remove(my_rbt, root, key)
+    if my_rbt["root"] is not None:
+        my_rbt["root"]["color"] = rbn.BLACK
+    return True
+
+
+def _remove(my_rbt, h, key):
+    cmp_function = my_rbt["cmp_function"]
+    if cmp_function(key, h["key"]) < 0:
+        if not rbn.is_red(h["left"]) and not rbn.is_red(h["left"]["left"]):
+            h = _move_red_left(h)
+        h["left"] = _remove(my_rbt, h["left"], key)
+    else:
+        if rbn.is_red(h["left"]):
+            h = _rotate_right(h)
+        if cmp_function(key, h["key"]) == 0 and h["right"] is None:
+            return None
+        if not rbn.is_red(h["right"]) and not rbn.is_red(h["right"]["left"]):
+            h = _move_red_right(h)
+        if cmp_function(key, h["key"]) == 0:
+            # Se reemplaza por el sucesor y se borra el sucesor
+            successor = h["right"]
+            while successor["left"] is not None:
+                successor = successor["left"]
+            h["key"] = successor["key"]
+            h["value"] = successor["value"]
+            h["right"] = _delete_min(h["right"])
+        else:
+            h["right"] = _remove(my_rbt, h["right"], key)
+    return _balance(h)
@@ -0,0 +1,227 @@
+"""
+  Índice ordenado estático para consultas por rango sobre llaves numéricas.
+
+  Se construye de una vez a partir de una columna (llave de cada fila) y
+  queda guardado en dos arreglos tipados contiguos: "keys", con las llaves en
+  orden ascendente, y "rows", con la fila de cada llave en la misma posición.
+  Las consultas son búsquedas binarias sobre "keys"; los empates quedan en el
+  orden de tie_key(fila) dado al construir.
+"""
+
+import bisect
+from array import array
+import DataStructures.List.array_list as lt
+
+
+def new_index(keys, rows=None, tie_key=None, typecode="d"):
+    """ Crea el índice de las filas rows (por defecto todas las de keys)
+
+        :param keys: Columna con la llave de cada fila, indexada por fila
+        :type keys: sequence
+        :param rows: Filas a indexar
+        :type rows: iterable of int
+        :param tie_key: Función fila -> criterio de desempate entre llaves iguales
+        :type tie_key: function
+        :param typecode: Tipo del arreglo de llaves (ver array.array)
+        :type typecode: str
+
+        :returns: Índice creado
+        :rtype: dict
+    """
+    if rows is None:
+        rows = range(len(keys))
+    order = sorted(rows, key=_sort_key(keys, tie_key))
+    return {
+        "keys": array(typecode, [keys[r] for r in order]),
+        "rows": array("l", order)
+    }
+
+
+def _sort_key(keys, tie_key):
+    if tie_key is None:
+        return keys.__getitem__
+    return lambda r: (keys[r], tie_key(r))
+
+
+def size(my_index):
+    return len(my_index["rows"])
+
+
+def is_empty(my_index):
+    return len(my_index["rows"]) == 0
+
+
+def get_min(my_index):
+    if is_empty(my_index):
+        return None
+    return my_index["keys"][0]
+
+
+def get_max(my_index):
+    if is_empty(my_index):
+        return None
+    return my_index["keys"][-1]
+
+
+def bounds(my_index, lo, hi):
+    """ Posiciones [inicio, fin) de las llaves k con lo <= k <= hi
+    """
+    keys = my_index["keys"]
+    start = bisect.bisect_left(keys, lo)
+    end = bisect.bisect_right(keys, hi)
+    return start, max(start, end)
+
+
+def count(my_index, lo, hi):
+    start, end = bounds(my_index, lo, hi)
+    return end - start
+
+
+def values(my_index, lo, hi, reverse=False):
+    """ array_list con las filas cuyas llaves están entre lo y hi (ambas
+        incluidas), en orden ascendente o, con reverse, descendente
+    """
+    start, end = bounds(my_index, lo, hi)
+    return _to_list(my_index["rows"], start, end, reverse)
+
+
+def keys(my_index, lo, hi, reverse=False):
+    start, end = bounds(my_index, lo, hi)
+    return _to_list(my_index["keys"], start, end, reverse)
+
+
+def first_k(my_index, lo, hi, k):
+    """ Las primeras k filas del rango, en orden ascendente
+    """
+    start, end = bounds(my_index, lo, hi)
+    return _to_list(my_index["rows"], start, min(end, start + k), False)
+
+
+def last_k(my_index, lo, hi, k):
+    """ Las últimas k filas del rango, en orden ascendente
+    """
+    start, end = bounds(my_index, lo, hi)
+    return _to_list(my_index["rows"], max(start, end - k), end, False)
+
+
+def iterate(my_index, lo, hi, reverse=False):
+    """ Recorre las filas del rango sin copiarlas
+    """
+    start, end = bounds(my_index, lo, hi)
+    rows = my_index["rows"]
+    if reverse:
+        for pos in range(end - 1, start - 1, -1):
+            yield rows[pos]
+    else:
+        for pos in range(start, end):
+            yield rows[pos]
+
+
+def _to_list(data, start, end, reverse):
+    result = lt.new_list()
+    elements = list(data[start:end])
+    if reverse:
+        elements.reverse()
+    result["elements"] = elements
+    result["size"] = len(elements)
+    return result
+
+
+def insert(my_index, keys, new_rows, tie_key=None):
+    """ Agrega filas nuevas al índice mezclándolas en una sola pasada: la
+        posición de cada fila nueva se busca con bisect y los tramos de
+        filas existentes entre ellas se copian sin volver a calcular su
+        llave. Cuesta O(n) en copia de arreglos más O(m log n) búsquedas
+        para m filas nuevas. Entre filas con el mismo criterio completo las
+        existentes quedan primero.
+
+        :param keys: Columna con la llave de cada fila (la misma del índice)
+        :param new_rows: Filas a agregar
+        :param tie_key: El mismo criterio de desempate usado al construir
+    """
+    sort_key = _sort_key(keys, tie_key)
+    new_rows = sorted(new_rows, key=sort_key)
+    if len(new_rows) == 0:
+        return my_index
+    rows = mutable(my_index["rows"])
+    index_keys = mutable(my_index["keys"])
+    merged_rows = array(rows.typecode)
+    merged_keys = array(index_keys.typecode)
+
+    prev = 0
+    for row in new_rows:
+        key = keys[row]
+        lo = bisect.bisect_left(index_keys, key, prev)
+        hi = bisect.bisect_right(index_keys, key, lo)
+        if tie_key is not None and lo < hi:
+            # Entre las llaves iguales se ubica por el desempate
+            hi = _after(rows, sort_key(row), sort_key, lo, hi)
+        pos = hi
+        merged_rows.extend(rows[prev:pos])
+        merged_rows.append(row)
+        merged_keys.extend(index_keys[prev:pos])
+        merged_keys.append(key)
+        prev = pos
+    merged_rows.extend(rows[prev:])
+    merged_keys.extend(index_keys[prev:])
+    my_index["rows"] = merged_rows
+    my_index["keys"] = merged_keys
+    return my_index
+
+
+def merge_rows(rows, new_rows, sort_key):
+    """ Mezcla filas nuevas en un arreglo de filas ordenado por sort_key, en
+        el mismo arreglo y en una sola pasada. Es la mezcla de insert para
+        listas de filas sin arreglo de llaves: la posición de cada fila nueva
+        se busca con búsqueda binaria y solo se reescribe el tramo desde la
+        primera de ellas, así que si las nuevas van al final el costo es
+        proporcional a ellas. Entre criterios iguales las existentes quedan
+        primero.
+
+        :param rows: Arreglo modificable (ver mutable) ordenado por sort_key
+        :param new_rows: Filas a agregar
+        :param sort_key: Función fila -> criterio de orden
+
+        :returns: El mismo arreglo rows
+    """
+    new_rows = sorted(new_rows, key=sort_key)
+    if len(new_rows) == 0:
+        return rows
+    start = _after(rows, sort_key(new_rows[0]), sort_key, 0, len(rows))
+    tail = rows[start:]
+    del rows[start:]
+
+    prev = 0
+    for row in new_rows:
+        pos = _after(tail, sort_key(row), sort_key, prev, len(tail))
+        rows.extend(tail[prev:pos])
+        rows.append(row)
+        prev = pos
+    rows.extend(tail[prev:])
+    return rows
+
+
+def _after(rows, full_key, sort_key, lo, hi):
+    # Primera posición en [lo, hi) cuya fila tiene criterio > full_key
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sort_key(rows[mid]) <= full_key:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def mutable(data):
+    """ Versión modificable de un arreglo. Los arreglos que vienen de un
+        snapshot son memoryview de solo lectura en tamaño: se copian a un
+        array (o a un bytearray si son de bytes). Cualquier otro arreglo se
+        retorna tal cual.
+    """
+    if isinstance(data, memoryview):
+        if data.format == "B":
+            return bytearray(data)
+        copy = array(data.format)
+        copy.frombytes(data.cast("B"))
+        return copy
+    return data